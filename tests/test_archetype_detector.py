@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Tests for archetype detection
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import victoria.core.archetype_detector as archetype_detector_module
+from victoria.core.archetype_detector import ArchetypeDetector, TRAIT_CODES, TRAIT_ORDER
+
+
+def test_detect_archetype_ignores_nan_scores():
+    """A NaN trait score counts as missing instead of hiding every archetype"""
+    trait_scores = {trait_code: 0.5 for trait_code in TRAIT_CODES}
+    trait_scores.update(RT=0.6, IO=0.6, CT=0.6, DM=0.6, A=float('nan'))
+
+    result = ArchetypeDetector().detect_archetype(trait_scores)
+
+    assert result['archetype_name'] == 'Strategic Innovation'
+    assert abs(result['archetype_score'] - 0.6) < 1e-12
+
+
+def test_detect_archetype_batch_matches_per_person():
+    """The batch detection agrees with detect_archetype, including NaN and missing trait scores"""
+    detector = ArchetypeDetector()
+    rng = np.random.default_rng(7)
+    scores = rng.uniform(0.0, 1.0, (40, len(TRAIT_CODES)))
+    scores[rng.uniform(size=scores.shape) < 0.2] = np.nan
+    scores[0] = np.nan
+    scores[1] = 0.0
+
+    batch = detector.detect_archetype_batch(scores)
+
+    for row, index, score, confidence in zip(scores, batch['archetype_index'], batch['archetype_score'], batch['confidence']):
+        # Missing traits are left out of the dictionary, NaN ones are passed through
+        trait_scores = {
+            trait_code: value
+            for trait_code, value in zip(TRAIT_CODES, row.tolist())
+            if not (np.isnan(value) and trait_code in ('IN', 'RT', 'A'))
+        }
+        result = detector.detect_archetype(trait_scores)
+        name = batch['archetype_names'][index] if index >= 0 else 'Unknown'
+        assert result['archetype_name'] == name
+        assert result['archetype_score'] == pytest.approx(score)
+        assert result['confidence'] == pytest.approx(confidence)
+
+
+@pytest.mark.parametrize("jit", [True, False], ids=["njit", "numpy"])
+def test_correlation_matrix_matches_per_pair_rule(monkeypatch, jit):
+    """Both the JIT kernel and the NumPy fallback apply the per-pair correlation rule to every cell"""
+    if not jit:
+        monkeypatch.setattr(archetype_detector_module, 'njit', None)
+    elif archetype_detector_module.njit is None:
+        pytest.skip("numba is not installed")
+    detector = ArchetypeDetector()
+
+    matrix = detector._build_correlation_matrix()
+
+    expected = [
+        [detector._calculate_trait_archetype_correlation(trait_name, archetype) for trait_name in TRAIT_ORDER]
+        for archetype in detector.archetypes.values()
+    ]
+    np.testing.assert_allclose(matrix, expected, rtol=0, atol=1e-12)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests for the Rasch trait scorer
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import victoria.scoring.fixed_trait_scorer as fixed_trait_scorer_module
+from victoria.scoring.fixed_trait_scorer import FixedTraitScorer
+
+
+def make_responses(n_persons=12, seed=11):
+    """Likert answers with missing responses, one question absent and one trait unanswered by person 1"""
+    scorer = FixedTraitScorer()
+    rng = np.random.default_rng(seed)
+    answers = np.array(list(scorer.likert_mapping), dtype=object)
+    questions = list(scorer.question_mapping)
+    data = answers[rng.integers(0, len(answers), (n_persons, len(questions)))]
+    data[rng.uniform(size=data.shape) < 0.15] = None
+    df = pd.DataFrame(data, columns=questions)
+    df.loc[1, list(scorer._questions_by_trait[scorer.trait_names[2]])] = None
+    return df.drop(columns=questions[0])
+
+
+def make_rasch_results(df, seed=11):
+    """Rasch results with difficulties for most items and abilities for all but the last two persons"""
+    rng = np.random.default_rng(seed)
+    return {
+        'item_difficulties': {question: float(rng.normal()) for question in df.columns[::3].tolist() + df.columns[1::3].tolist()},
+        'person_abilities': {f"person_{i}": float(rng.normal()) for i in df.index[:-2]}
+    }
+
+
+def test_trait_score_frame_matches_per_person():
+    """Scoring everyone at once gives the same scores as scoring each person on their own"""
+    df = make_responses()
+    rasch_results = make_rasch_results(df)
+    scorer = FixedTraitScorer()
+
+    frame = scorer.calculate_trait_score_frame(df, rasch_results)
+    profiles = scorer.calculate_trait_scores(df, rasch_results)
+
+    assert list(frame.index) == [f"person_{i}" for i in df.index]
+    assert list(frame.columns) == scorer.trait_names
+    assert not frame.isna().any().any()
+    for i in df.index:
+        person = scorer.calculate_trait_score_frame(df.loc[[i]], rasch_results)
+        np.testing.assert_allclose(frame.loc[[f"person_{i}"]].to_numpy(), person.to_numpy(), rtol=0, atol=1e-12)
+        assert profiles[f"person_{i}"] == dict(zip(frame.columns, frame.loc[f"person_{i}"].tolist()))
+
+
+def test_trait_score_frame_without_rasch_results():
+    """Without Rasch results every person is scored by the arithmetic mean, on its own or not"""
+    df = make_responses()
+    scorer = FixedTraitScorer()
+
+    frame = scorer.calculate_trait_score_frame(df)
+
+    for i in df.index:
+        person = scorer.calculate_trait_score_frame(df.loc[[i]])
+        np.testing.assert_allclose(frame.loc[[f"person_{i}"]].to_numpy(), person.to_numpy(), rtol=0, atol=1e-12)
+
+
+@pytest.mark.parametrize("kernel", ["njit", "py_func"])
+def test_rasch_kernel_matches_numpy_fallback(monkeypatch, kernel):
+    """The Rasch trait kernel, compiled or run as plain Python, agrees with the NumPy fallback"""
+    if fixed_trait_scorer_module.njit is None:
+        pytest.skip("numba is not installed")
+    df = make_responses()
+    rasch_results = make_rasch_results(df)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(fixed_trait_scorer_module, 'njit', None)
+        expected = FixedTraitScorer().calculate_trait_score_frame(df, rasch_results)
+    if kernel == "py_func":
+        monkeypatch.setattr(
+            fixed_trait_scorer_module, '_rasch_trait_kernel', fixed_trait_scorer_module._rasch_trait_kernel.py_func
+        )
+    scores = FixedTraitScorer().calculate_trait_score_frame(df, rasch_results)
+
+    np.testing.assert_allclose(scores.to_numpy(), expected.to_numpy(), rtol=0, atol=1e-12)
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Tests for the report generator, run against a stubbed OpenAI client where one is needed
+"""
+
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+
+import victoria.core.report_generator as report_generator_module
+from victoria.core.report_generator import ReportGenerator
+
+
+class StubCompletions:
+    """Chat completions that answer every request with a fixed text after a short delay"""
+
+    def __init__(self, content="Stub response.", delay=0.0):
+        self.content = content
+        self.delay = delay
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def create(self, **params):
+        with self._lock:
+            self.calls.append(params)
+        if self.delay:
+            threading.Event().wait(self.delay)
+        message = SimpleNamespace(content=self.content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def make_client(**kwargs):
+    """Stub OpenAI client exposing chat.completions"""
+    return SimpleNamespace(chat=SimpleNamespace(completions=StubCompletions(**kwargs)))
+
+
+def test_archetype_cache_concurrent_writes(tmp_path):
+    """Threads generating the same archetype leave one complete cache file and no temporary files"""
+    generator = ReportGenerator(openai_client=make_client(content="Activation text.", delay=0.02))
+    generator._archetype_cache_dir = str(tmp_path)
+
+    threads = [
+        threading.Thread(target=generator._generate_archetype_activation_description, args=("Strategic Innovation",))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    files = os.listdir(tmp_path)
+    assert len(files) == 1 and files[0].endswith('.txt')
+    assert (tmp_path / files[0]).read_text(encoding='utf-8') == "Activation text."
+
+
+def test_trait_description_fallback_uses_exact_score():
+    """Scores close together each get a fallback description quoting their own percentage"""
+    generator = ReportGenerator(openai_client=None)
+    descriptions = {}
+
+    first = generator._get_trait_description('XX', 0.61, descriptions)
+    second = generator._get_trait_description('XX', 0.62, descriptions)
+
+    assert first.endswith("61.0%.")
+    assert second.endswith("62.0%.")
+    assert not hasattr(generator, '_desc_cache')
+
+
+def test_failed_render_keeps_previous_report(tmp_path):
+    """A render failing part way leaves the existing report untouched and no temporary file"""
+    class FailingStream:
+        def dump(self, f):
+            f.write("<html>partial")
+            raise RuntimeError("render failed")
+
+    generator = ReportGenerator(openai_client=None)
+    generator._archetype_cache_dir = str(tmp_path / 'archetypes')
+    generator._get_template = lambda: SimpleNamespace(stream=lambda **data: FailingStream())
+    report_path = tmp_path / 'reports' / 'report.html'
+    report_path.parent.mkdir()
+    report_path.write_text("previous report", encoding='utf-8')
+
+    result = generator.generate_comprehensive_report({'trait_scores': {}}, str(report_path))
+
+    assert result == {'success': False, 'error': "render failed"}
+    assert report_path.read_text(encoding='utf-8') == "previous report"
+    assert os.listdir(report_path.parent) == ['report.html']
+
+
+class StubBatches:
+    """OpenAI files and batches APIs whose batch moves through a fixed list of statuses"""
+
+    def __init__(self, statuses, contents):
+        self.statuses = list(statuses)
+        self.contents = contents
+        self.requests = []
+        self.cancelled = []
+
+    # files API
+    def create(self, file, purpose):
+        self.requests = [json.loads(line) for line in file[1].decode('utf-8').splitlines()]
+        return SimpleNamespace(id="file-in")
+
+    def content(self, file_id):
+        lines = [
+            json.dumps({
+                'custom_id': request['custom_id'],
+                'response': {'status_code': 200, 'body': {'choices': [{'message': {'content': json.dumps(content)}}]}}
+            })
+            for request, content in zip(self.requests, self.contents)
+        ]
+        return SimpleNamespace(text="\n".join(lines))
+
+    # batches API
+    def _batch(self):
+        status = self.statuses.pop(0) if len(self.statuses) > 1 else self.statuses[0]
+        return SimpleNamespace(id="batch-1", status=status, output_file_id="file-out" if status == 'completed' else None)
+
+    def submit(self, input_file_id, endpoint, completion_window):
+        return self._batch()
+
+    def retrieve(self, batch_id):
+        return self._batch()
+
+    def cancel(self, batch_id):
+        self.cancelled.append(batch_id)
+
+
+def make_batch_client(statuses, contents=()):
+    """Stub OpenAI client exposing files, batches and chat.completions"""
+    stub = StubBatches(statuses, list(contents))
+    return SimpleNamespace(
+        files=SimpleNamespace(create=stub.create, content=stub.content),
+        batches=SimpleNamespace(create=stub.submit, retrieve=stub.retrieve, cancel=stub.cancel),
+        chat=SimpleNamespace(completions=StubCompletions(content=json.dumps({
+            'executive_summary': "Interactive summary.", 'archetype_description': "Interactive description."
+        }))),
+        stub=stub
+    )
+
+
+PROFILES = [
+    {'person_name': "Ann", 'archetype_name': "Strategic Innovation", 'overall_score': 0.7},
+    {'person_name': "Bob", 'archetype_name': "Adaptive Intelligence", 'overall_score': 0.6}
+]
+
+
+def test_inspiring_content_batch_completed():
+    """Results of a completed batch are routed back to their profiles"""
+    client = make_batch_client(
+        ['validating', 'in_progress', 'completed'],
+        [{'executive_summary': f"Summary {i}.", 'archetype_description': f"Description {i}."} for i in range(2)]
+    )
+    generator = ReportGenerator(openai_client=client)
+
+    results = generator.generate_inspiring_content_batch(PROFILES, poll_interval=0)
+
+    assert results == [
+        {'executive_summary': "Summary 0.", 'archetype_description': "Description 0."},
+        {'executive_summary': "Summary 1.", 'archetype_description': "Description 1."}
+    ]
+    assert [request['custom_id'] for request in client.stub.requests] == ["0:inspiring_content", "1:inspiring_content"]
+    assert not client.chat.completions.calls
+
+
+@pytest.mark.parametrize("statuses, timeout, cancelled", [
+    (['in_progress', 'failed'], 60, []),
+    (['in_progress'], 0, ["batch-1"])
+])
+def test_inspiring_content_batch_falls_back(statuses, timeout, cancelled):
+    """A failed batch, or one cancelled at the timeout, falls back to interactive requests"""
+    client = make_batch_client(statuses)
+    generator = ReportGenerator(openai_client=client)
+    report_generator_module._response_cache.clear()
+
+    results = generator.generate_inspiring_content_batch(PROFILES, poll_interval=0, timeout=timeout)
+
+    assert results == [{'executive_summary': "Interactive summary.", 'archetype_description': "Interactive description."}] * 2
+    assert client.stub.cancelled == cancelled
+    assert len(client.chat.completions.calls) == 2
+
+
+def test_stream_llm_content_holds_concurrency_slot(monkeypatch):
+    """A streamed section keeps its concurrency slot until the stream is read to the end"""
+    semaphore = threading.BoundedSemaphore(1)
+    monkeypatch.setattr(report_generator_module, '_llm_semaphore', semaphore)
+    report_generator_module._response_cache.clear()
+    slot_taken = []
+
+    def stream(**params):
+        for text in ["  First", " part.", None]:
+            taken = not semaphore.acquire(blocking=False)
+            if not taken:
+                semaphore.release()
+            slot_taken.append(taken)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=stream)))
+    generator = ReportGenerator(openai_client=client)
+
+    text = ''.join(generator.stream_llm_content('executive_summary', person_name="Ann"))
+
+    assert text == "First part."
+    assert slot_taken == [True, True, True]
+    assert semaphore.acquire(blocking=False)
+
+
+@pytest.mark.parametrize("cache_size, expected_calls", [(4096, 1), (0, 2)])
+def test_response_cache_size(monkeypatch, cache_size, expected_calls):
+    """Repeated requests are served from the response cache unless its size is 0"""
+    monkeypatch.setattr(report_generator_module, 'RESPONSE_CACHE_SIZE', cache_size)
+    report_generator_module._response_cache.clear()
+    client = make_client(content="Cached text.")
+    generator = ReportGenerator(openai_client=client)
+
+    texts = [generator._generate_llm_content('executive_summary', person_name="Ann") for _ in range(2)]
+
+    assert texts == ["Cached text.", "Cached text."]
+    assert len(client.chat.completions.calls) == expected_calls
+    assert len(report_generator_module._response_cache) == (1 if cache_size else 0)
+
+
+def test_archetype_cache_is_opt_in_and_versioned(monkeypatch, tmp_path):
+    """The archetype cache is off unless its directory is set, and a new cache version ignores old files"""
+    monkeypatch.delenv('VICTORIA_ARCHETYPE_CACHE_DIR', raising=False)
+    assert ReportGenerator(openai_client=make_client())._archetype_cache_dir is None
+
+    monkeypatch.setenv('VICTORIA_ARCHETYPE_CACHE_DIR', str(tmp_path))
+    generator = ReportGenerator(openai_client=make_client(content="Activation text."))
+    assert generator._generate_archetype_activation_description("Ambitious Drive") == "Activation text."
+    (cache_file,) = tmp_path.iterdir()
+    cache_file.write_text("Stale text.", encoding='utf-8')
+    assert generator._generate_archetype_activation_description("Ambitious Drive") == "Stale text."
+
+    monkeypatch.setattr(report_generator_module, 'ARCHETYPE_CACHE_VERSION', report_generator_module.ARCHETYPE_CACHE_VERSION + 1)
+    assert generator._generate_archetype_activation_description("Ambitious Drive") == "Activation text."
+
+
+def test_report_file_mode_follows_umask(tmp_path):
+    """A generated report gets the usual permissions for new files rather than owner-only ones"""
+    generator = ReportGenerator(openai_client=None)
+    generator._get_template = lambda: SimpleNamespace(
+        stream=lambda **data: SimpleNamespace(dump=lambda f: f.write("<html></html>"))
+    )
+    report_path = tmp_path / 'report.html'
+
+    result = generator.generate_comprehensive_report({'trait_scores': {}}, str(report_path))
+
+    umask = os.umask(0)
+    os.umask(umask)
+    assert result['success'] is True
+    assert report_path.read_text(encoding='utf-8') == "<html></html>"
+    assert report_path.stat().st_mode & 0o777 == 0o666 & ~umask
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Tests for the batch paths of the Vetria pipeline, run against a stubbed OpenAI client
+"""
+
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import victoria.core.report_generator as report_generator_module
+import victoria_pipeline
+from victoria.mapping.question_trait_mapper import QuestionTraitMapper
+from victoria_pipeline import VetriaPipeline
+
+
+class StubCompletions:
+    """Chat completions answering JSON requests with an empty object and others with a fixed text"""
+
+    def __init__(self):
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def create(self, **params):
+        with self._lock:
+            self.calls.append(params)
+        if params.get('response_format', {}).get('type') == 'json_object':
+            content = json.dumps({})
+        else:
+            content = "Stub response."
+        message = SimpleNamespace(content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def write_responses_csv(path, names):
+    """Write an assessment CSV with random Likert answers, one row per name"""
+    mapper = QuestionTraitMapper()
+    answers = list(mapper.get_likert_mapping())
+    rng = np.random.default_rng(0)
+    columns = {'First name': names, 'Last name': ['Tester'] * len(names), 'Email': ['a@example.com'] * len(names)}
+    for question in mapper.get_question_mapping():
+        columns[question] = [answers[i] for i in rng.integers(0, len(answers), len(names))]
+    columns["What kind of work energizes you most—and why?"] = [f"Answer from {name}" for name in names]
+    pd.DataFrame(columns).to_csv(path, index=False)
+
+
+def make_pipeline(monkeypatch, tmp_path):
+    """Pipeline whose report generators use a stubbed OpenAI client and a temporary archetype cache"""
+    monkeypatch.delenv('OPENAI_API_KEY', raising=False)
+    monkeypatch.delenv('VICTORIA_PROFILE_CACHE_DIR', raising=False)
+    monkeypatch.setenv('VICTORIA_ARCHETYPE_CACHE_DIR', str(tmp_path / 'archetypes'))
+    report_generator_module._response_cache.clear()
+
+    pipeline = VetriaPipeline()
+    pipeline.openai_client = SimpleNamespace(chat=SimpleNamespace(completions=StubCompletions()))
+    pipeline.report_generator.openai_client = pipeline.openai_client
+    return pipeline
+
+
+def test_process_batch_matches_single_person(monkeypatch, tmp_path):
+    """Profiles processed concurrently equal the ones processed one at a time"""
+    csv_path = tmp_path / 'responses.csv'
+    write_responses_csv(csv_path, ['Ann', 'Bob', 'Cy'])
+    pipeline = make_pipeline(monkeypatch, tmp_path)
+
+    batch = pipeline.process_batch(str(csv_path), [0, 1, 2])
+    single = [pipeline.process_single_person(str(csv_path), index) for index in range(3)]
+
+    assert [profile['person_name'] for profile in batch] == ['Ann Tester', 'Bob Tester', 'Cy Tester']
+    for batch_profile, single_profile in zip(batch, single):
+        assert batch_profile['trait_scores'] == single_profile['trait_scores']
+        assert batch_profile['archetype_name'] == single_profile['archetype_name']
+        assert batch_profile['open_ended_responses'] == single_profile['open_ended_responses']
+
+
+def test_generate_reports_batch(monkeypatch, tmp_path):
+    """Every person of a batch gets a complete report of their own"""
+    csv_path = tmp_path / 'responses.csv'
+    write_responses_csv(csv_path, ['Ann', 'Bob', 'Cy'])
+    pipeline = make_pipeline(monkeypatch, tmp_path)
+
+    paths = pipeline.generate_reports(str(csv_path), [0, 1, 2], str(tmp_path / 'reports'))
+
+    assert len(set(paths)) == 3
+    for path, name in zip(paths, ['Ann', 'Bob', 'Cy']):
+        html = Path(path).read_text(encoding='utf-8')
+        assert html.rstrip().endswith('</html>')
+        assert f"{name} Tester" in html
+    assert pipeline.openai_client.chat.completions.calls
+
+
+def test_process_batch_with_batch_api(monkeypatch, tmp_path):
+    """The batch API path adds the inspiring content of every person from one OpenAI batch"""
+    csv_path = tmp_path / 'responses.csv'
+    write_responses_csv(csv_path, ['Ann', 'Bob'])
+    pipeline = make_pipeline(monkeypatch, tmp_path)
+    requested = []
+
+    def generate_inspiring_content_batch(profiles):
+        requested.extend(profile['person_name'] for profile in profiles)
+        return [{'executive_summary': f"Summary for {profile['person_name']}.", 'archetype_description': "Batch."}
+                for profile in profiles]
+
+    monkeypatch.setattr(pipeline.report_generator, 'generate_inspiring_content_batch', generate_inspiring_content_batch)
+
+    profiles = pipeline.process_batch(str(csv_path), [0, 1], use_batch_api=True)
+
+    assert requested == ['Ann Tester', 'Bob Tester']
+    assert [profile['executive_summary'] for profile in profiles] == ["Summary for Ann Tester.", "Summary for Bob Tester."]
+    assert not pipeline.openai_client.chat.completions.calls
+
+
+def test_profile_cache_round_trip(monkeypatch, tmp_path):
+    """A cached profile is stored as JSON and reused until the cache version changes"""
+    csv_path = tmp_path / 'responses.csv'
+    write_responses_csv(csv_path, ['Ann', 'Bob'])
+    pipeline = make_pipeline(monkeypatch, tmp_path)
+    pipeline._profile_cache_dir = str(tmp_path / 'profiles')
+
+    profile = pipeline.process_single_person(str(csv_path), 1)
+    calls = len(pipeline.openai_client.chat.completions.calls)
+    cached = pipeline.process_single_person(str(csv_path), 1)
+
+    files = list((tmp_path / 'profiles').iterdir())
+    assert [path.suffix for path in files] == ['.json']
+    umask = os.umask(0)
+    os.umask(umask)
+    assert files[0].stat().st_mode & 0o777 == 0o666 & ~umask
+    assert cached == json.loads(json.dumps(profile))
+    assert len(pipeline.openai_client.chat.completions.calls) == calls
+
+    monkeypatch.setattr(victoria_pipeline, 'PROFILE_CACHE_VERSION', victoria_pipeline.PROFILE_CACHE_VERSION + 1)
+    assert pipeline._profile_cache_path(str(csv_path), 1) != str(files[0])
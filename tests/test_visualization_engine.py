@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Tests for the visualization engine
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from victoria.core.archetype_detector import TRAIT_CODES
+from victoria.core.report_generator import ReportGenerator
+from victoria.core.visualization_engine import VisualizationEngine
+
+
+def test_gauge_traits_match_report_selection_with_ties():
+    """The top and growth gauges pick the same traits, in the same order, as the report text"""
+    engine = VisualizationEngine()
+    generator = ReportGenerator(openai_client=None)
+    rng = np.random.default_rng(5)
+    profiles = [
+        dict(zip(codes, rng.choice([0.25, 0.5, 0.75, 1.0], len(codes)).tolist()))
+        for codes in (rng.permutation(TRAIT_CODES).tolist() for _ in range(300))
+    ]
+    profiles.append({'RB': .75, 'RT': .75, 'F': .75, 'A': .25, 'C': .25, 'IN': .25, 'DM': .5})
+    profiles.append({'RT': .5, 'IO': .5})
+
+    for trait_scores in profiles:
+        codes, scores = engine._scores_array(trait_scores, exclude=('IN',))
+        top, bottom = engine._pick_top_bottom(scores)
+        assert list(zip(codes[top].tolist(), scores[top].tolist())) == generator._select_strength_traits(trait_scores)
+        assert list(zip(codes[bottom].tolist(), scores[bottom].tolist())) == generator._select_growth_traits(trait_scores)
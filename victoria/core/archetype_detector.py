@@ -2,20 +2,152 @@
 Archetype Detector - Detects entrepreneurial archetype based on trait scores
 """
 
+import sys
 import logging
-from typing import Dict, List, Tuple, Any
-from dataclasses import dataclass
+import numpy as np
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Tuple, Any
+from dataclasses import dataclass, field
+
+# Optional JIT compilation for the correlation matrix builder
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# All traits in the exact order used by the heatmap
+# Note: This order must match the trait_names order in visualization_engine.py
+TRAIT_ORDER = (
+    "Social Orientation",           # 0 - IN
+    "Resilience and Grit",          # 1 - RG
+    "Servant Leadership",           # 2 - SL
+    "Emotional Intelligence",       # 3 - EI
+    "Decision Making",              # 4 - DM
+    "Problem Solving",              # 5 - PS
+    "Drive and Ambition",           # 6 - DA
+    "Innovation Orientation",       # 7 - IO
+    "Adaptability",                 # 8 - AD
+    "Critical Thinking",            # 9 - CT
+    "Team Building",                # 10 - TB
+    "Risk Taking",                  # 11 - RT
+    "Accountability",               # 12 - A
+    "Relationship-Building",        # 13 - RB
+    "Negotiation",                  # 14 - N
+    "Conflict Resolution",          # 15 - C
+    "Approach to Failure"           # 16 - F
+)
+
+# Trait codes in TRAIT_ORDER and their column index in score vectors/matrices
+TRAIT_CODES = ("IN", "RG", "SL", "EI", "DM", "PS", "DA", "IO", "AD", "CT", "TB", "RT", "A", "RB", "N", "C", "F")
+TRAIT_CODE_INDEX = {trait_code: i for i, trait_code in enumerate(TRAIT_CODES)}
+
+# Alternative spellings of trait names, normalized before any lookup
+TRAIT_NAME_ALIASES = {
+    "Decision-Making": "Decision Making",
+    "Problem-Solving": "Problem Solving",
+    "Risk-Taking": "Risk Taking",
+    "Resilience & Grit": "Resilience and Grit",
+    "Drive & Ambition": "Drive and Ambition"
+}
+
+# Define Trait Semantic Categories (canonical trait names only)
+TRAIT_CATEGORIES = {
+    # Social / Interpersonal
+    "Social Orientation": "Social",
+    "Relationship-Building": "Social",
+    "Team Building": "Social",
+    "Servant Leadership": "Social",
+    "Negotiation": "Social",
+    "Conflict Resolution": "Social",
+    "Emotional Intelligence": "Social",
+
+    # Cognitive / Strategic
+    "Decision Making": "Cognitive",
+    "Problem Solving": "Cognitive",
+    "Critical Thinking": "Cognitive",
+    "Innovation Orientation": "Cognitive",
+
+    # Resilience / Drive / Execution
+    "Resilience and Grit": "Resilience",
+    "Drive and Ambition": "Resilience",
+    "Risk Taking": "Resilience",
+    "Approach to Failure": "Resilience",
+    "Adaptability": "Resilience",
+    "Accountability": "Resilience"
+}
+
+# Define Archetype Category Focus (Primary, Secondary)
+# Derived from functionality and description
+ARCHETYPE_FOCUS = {
+    "Strategic Innovation": {"primary": "Cognitive", "secondary": "Resilience"},
+    "Resilient Leadership": {"primary": "Social", "secondary": "Resilience"},
+    "Collaborative Responsibility": {"primary": "Social", "secondary": "Resilience"},
+    "Ambitious Drive": {"primary": "Resilience", "secondary": "Cognitive"},
+    "Adaptive Intelligence": {"primary": "Cognitive", "secondary": "Social"}
+}
+NO_FOCUS = {"primary": "None", "secondary": "None"}
+
+# Correlation scores are computed in integer hundredths and divided by 100 once,
+# so every score is exactly the nearest float to a 2-decimal value.
+# Key traits: 85 plus a bonus of up to 5 for the first key traits
+KEY_TRAIT_BASE, KEY_TRAIT_MAX_BONUS = 85, 5
+
+# Category match kinds and their (base hundredths, variation modulus) for non-key traits:
+# primary 0.55 - 0.65, secondary 0.40 - 0.50, no match 0.20 - 0.34
+PRIMARY_MATCH, SECONDARY_MATCH, NO_MATCH = 0, 1, 2
+CORRELATION_PARAMS = ((55, 11), (40, 11), (20, 15))
+
+def _correlation_kernel(key_position, match, seed, base, modulus):
+    """
+    Fill the archetype x trait correlation matrix from integer-encoded inputs.
+    
+    Key traits score 85 plus a position bonus; all other cells score the base
+    of their category match plus a seeded variation. Values are in hundredths.
+    """
+    n_archetypes, n_traits = key_position.shape
+    out = np.empty((n_archetypes, n_traits), dtype=np.int64)
+    for i in range(n_archetypes):
+        for j in range(n_traits):
+            if key_position[i, j] >= 0:
+                out[i, j] = KEY_TRAIT_BASE + max(0, KEY_TRAIT_MAX_BONUS - key_position[i, j])
+            else:
+                m = match[i, j]
+                out[i, j] = base[m] + seed[i, j] % modulus[m]
+    return out
+
+if njit is not None:
+    _correlation_kernel = njit(cache=True)(_correlation_kernel)
+
+@lru_cache(maxsize=None)
+def get_default_detector() -> "ArchetypeDetector":
+    """Shared detector with the predefined archetypes, built on first use"""
+    return ArchetypeDetector()
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep a regular dataclass
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class Archetype:
     """Represents an entrepreneurial archetype"""
     name: str
     description: str
-    key_traits: List[str]
+    key_traits: Tuple[str, ...]
     color: str
     score: float = 0.0
+    key_traits_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    key_traits_index: Dict[str, int] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Freeze key traits and build the lookups used for membership and position tests"""
+        # Stored as a tuple so results handed to callers cannot alter the archetype
+        self.key_traits = tuple(self.key_traits)
+        self.key_traits_set = frozenset(self.key_traits)
+        self.key_traits_index = {}
+        for i, trait_name in enumerate(self.key_traits):
+            # Keep the first position, matching list.index()
+            self.key_traits_index.setdefault(trait_name, i)
 
 class ArchetypeDetector:
     """Detects entrepreneurial archetype based on trait scores"""
@@ -75,6 +207,37 @@ class ArchetypeDetector:
             "Approach to Failure": "F",
             "Social Orientation": "IN"
         }
+        
+        # Key-trait membership matrix (archetypes x traits in TRAIT_ORDER), built once
+        # so that detection is a pair of matrix-vector products
+        self._archetype_ids = tuple(self.archetypes)
+        self._arch_list = tuple(self.archetypes.values())
+        self._trait_codes = TRAIT_CODES
+        self._key_trait_matrix = np.zeros((len(self._archetype_ids), len(self._trait_codes)), dtype=np.float64)
+        for row, archetype in enumerate(self.archetypes.values()):
+            for trait_name in archetype.key_traits:
+                self._key_trait_matrix[row, TRAIT_CODE_INDEX[self.trait_name_to_code[trait_name]]] = 1.0
+        
+        # Deterministic per (trait, archetype) seeds used to vary correlation scores
+        self._seed = {
+            (trait_name, archetype.name): sum(map(ord, trait_name + archetype.name))
+            for trait_name in TRAIT_ORDER
+            for archetype in self.archetypes.values()
+        }
+        
+        # Memoized per-pair scores from _calculate_trait_archetype_correlation
+        self._correlation_memo = {}
+        
+        # Correlation data only depends on the archetype definitions: reuse the frozen data of
+        # the shared default detector once it exists and the definitions match, otherwise build it
+        self._arch_names = [archetype.name for archetype in self.archetypes.values()]
+        default = get_default_detector() if get_default_detector.cache_info().currsize else None
+        if default is not None and self.archetypes == default.archetypes:
+            self._corr_matrix = default._corr_matrix
+            self._correlation_cache = default._correlation_cache
+        else:
+            self._corr_matrix = self._build_correlation_matrix()
+            self._correlation_cache = tuple(zip(self._arch_names, map(tuple, self._corr_matrix.tolist())))
     
     def detect_archetype(self, trait_scores: Dict[str, float]) -> Dict[str, Any]:
         """
@@ -86,25 +249,30 @@ class ArchetypeDetector:
         Returns:
             Dictionary containing detected archetype and confidence
         """
-        best_archetype = None
-        best_score = 0.0
-        archetype_scores = {}
+        # Lay scores out in TRAIT_ORDER next to a presence flag (column 0: score,
+        # column 1: 1.0 if scored); missing and NaN traits are excluded from the averages
+        values = np.zeros((len(self._trait_codes), 2), dtype=np.float64)
+        for trait_code, score in trait_scores.items():
+            i = TRAIT_CODE_INDEX.get(trait_code)
+            if i is not None and score is not None and not np.isnan(score):
+                values[i, 0] = score
+                values[i, 1] = 1.0
         
-        for archetype_id, archetype in self.archetypes.items():
-            # Calculate average score for key traits
-            key_trait_scores = []
-            for trait_name in archetype.key_traits:
-                trait_code = self.trait_name_to_code.get(trait_name, trait_name)
-                if trait_code in trait_scores:
-                    key_trait_scores.append(trait_scores[trait_code])
-            
-            if key_trait_scores:
-                avg_score = sum(key_trait_scores) / len(key_trait_scores)
-                archetype_scores[archetype_id] = avg_score
-                
-                if avg_score > best_score:
-                    best_score = avg_score
-                    best_archetype = archetype
+        # Sum and count the available key-trait scores for every archetype in one product
+        totals, counts = (self._key_trait_matrix @ values).T
+        
+        # Average key-trait score per archetype; archetypes without any scored key trait never win
+        averages = np.full(len(self._archetype_ids), -np.inf)
+        np.divide(totals, counts, out=averages, where=counts > 0)
+        archetype_scores = {
+            archetype_id: avg_score
+            for archetype_id, avg_score, count in zip(self._archetype_ids, averages.tolist(), counts)
+            if count
+        }
+        
+        best_index = int(averages.argmax())
+        best_score = float(averages[best_index])
+        best_archetype = self._arch_list[best_index] if best_score > 0.0 else None
         
         if best_archetype:
             # Calculate confidence (0-1)
@@ -126,10 +294,53 @@ class ArchetypeDetector:
                 'archetype_color': '#666666',
                 'archetype_score': 0.0,
                 'confidence': 0.0,
-                'key_traits': [],  # Empty list for unknown archetype
+                'key_traits': (),  # No key traits for unknown archetype
                 'all_scores': {}
             }
     
+    def detect_archetype_batch(self, scores_matrix: np.ndarray) -> Dict[str, Any]:
+        """
+        Detect the best matching archetype for many respondents at once
+        
+        Args:
+            scores_matrix: Array of shape (n_respondents, 17) with trait scores in
+                TRAIT_CODES order (see TRAIT_CODE_INDEX); NaN marks a missing trait score
+            
+        Returns:
+            Dictionary containing per-respondent archetype indices (-1 when no
+            archetype matches), archetype scores and confidences, plus the
+            archetype ids and names the indices refer to
+        """
+        scores_matrix = np.asarray(scores_matrix, dtype=np.float64)
+        if scores_matrix.ndim != 2 or scores_matrix.shape[1] != len(self._trait_codes):
+            raise ValueError(f"Expected scores of shape (n, {len(self._trait_codes)}), got {scores_matrix.shape}")
+        
+        present = ~np.isnan(scores_matrix)
+        totals = np.where(present, scores_matrix, 0.0) @ self._key_trait_matrix.T
+        counts = present.astype(np.float64) @ self._key_trait_matrix.T
+        
+        averages = np.full(totals.shape, -np.inf)
+        np.divide(totals, counts, out=averages, where=counts > 0)
+        
+        best = averages.argmax(axis=1)
+        best_scores = averages[np.arange(len(best)), best]
+        matched = best_scores > 0.0
+        
+        return {
+            'archetype_index': np.where(matched, best, -1),
+            'archetype_score': np.where(matched, best_scores, 0.0),
+            'confidence': np.where(matched, np.minimum(best_scores, 1.0), 0.0),
+            'archetype_ids': self._archetype_ids,
+            'archetype_names': tuple(self._arch_names)
+        }
+    
+    def _get_seed(self, trait_name: str, archetype_name: str) -> int:
+        """Get the variation seed for a trait/archetype pair, precomputed for the heatmap traits"""
+        seed = self._seed.get((trait_name, archetype_name))
+        if seed is None:
+            seed = sum(map(ord, trait_name + archetype_name))
+        return seed
+    
     def _calculate_trait_archetype_correlation(self, trait_name: str, archetype: Archetype) -> float:
         """
         Calculate correlation score between a trait and an archetype dynamically based on semantic categories.
@@ -141,138 +352,116 @@ class ArchetypeDetector:
         4. No Category Match: 0.20 - 0.35 (Foundational/Background)
         
         Args:
-            trait_name: Full name of the trait
+            trait_name: Full name of the trait (hyphen/ampersand variants are accepted)
             archetype: Archetype object
             
         Returns:
             Correlation score between 0.0 and 1.0 (approximated)
         """
-
+        trait_name = TRAIT_NAME_ALIASES.get(trait_name, trait_name)
+        cache_key = (trait_name, archetype.name)
+        score = self._correlation_memo.get(cache_key)
+        if score is None:
+            score = self._correlation_memo[cache_key] = self._compute_trait_archetype_correlation(trait_name, archetype)
+        return score
+    
+    def _compute_trait_archetype_correlation(self, trait_name: str, archetype: Archetype) -> float:
+        """Uncached implementation of _calculate_trait_archetype_correlation"""
         # 1. Check if it's a Key Trait (Highest Correlation)
-        if trait_name in archetype.key_traits:
+        if trait_name in archetype.key_traits_set:
             # Base score 0.85 + slight position variance
-            trait_index = archetype.key_traits.index(trait_name)
+            trait_index = archetype.key_traits_index[trait_name]
             # 1st trait gets bonus, others slightly less
-            return round(0.85 + max(0, 0.05 - (trait_index * 0.01)), 2)
-
-        # Define Trait Semantic Categories
-        trait_categories = {
-            # Social / Interpersonal
-            "Social Orientation": "Social",
-            "Relationship-Building": "Social",
-            "Team Building": "Social",
-            "Servant Leadership": "Social",
-            "Negotiation": "Social",
-            "Conflict Resolution": "Social",
-            "Emotional Intelligence": "Social",
-            
-            # Cognitive / Strategic
-            "Decision Making": "Cognitive",
-            "Decision-Making": "Cognitive", # Handle both formats
-            "Problem Solving": "Cognitive",
-            "Problem-Solving": "Cognitive", # Handle both formats
-            "Critical Thinking": "Cognitive",
-            "Innovation Orientation": "Cognitive",
-            
-            # Resilience / Drive / Execution
-            "Resilience and Grit": "Resilience",
-            "Resilience & Grit": "Resilience", # Handle variation
-            "Drive and Ambition": "Resilience",
-            "Drive & Ambition": "Resilience", # Handle variation
-            "Risk Taking": "Resilience",
-            "Risk-Taking": "Resilience", # Handle variation
-            "Approach to Failure": "Resilience",
-            "Adaptability": "Resilience",
-            "Accountability": "Resilience"
-        }
-        
-        # Define Archetype Category Focus (Primary, Secondary)
-        # Derived from functionality and description
-        archetype_focus = {
-            "Strategic Innovation": {"primary": "Cognitive", "secondary": "Resilience"},
-            "Resilient Leadership": {"primary": "Social", "secondary": "Resilience"},
-            "Collaborative Responsibility": {"primary": "Social", "secondary": "Resilience"},
-            "Ambitious Drive": {"primary": "Resilience", "secondary": "Cognitive"},
-            "Adaptive Intelligence": {"primary": "Cognitive", "secondary": "Social"}
-        }
+            return (KEY_TRAIT_BASE + max(0, KEY_TRAIT_MAX_BONUS - trait_index)) / 100
 
         # Get categories
-        this_trait_category = trait_categories.get(trait_name, "General")
-        this_archetype_focus = archetype_focus.get(archetype.name, {"primary": "None", "secondary": "None"})
+        this_trait_category = TRAIT_CATEGORIES.get(trait_name, "General")
+        this_archetype_focus = ARCHETYPE_FOCUS.get(archetype.name, NO_FOCUS)
         
-        # 2. Check for Primary Category Match (High Correlation)
+        # 2. Primary Category Match (High), 3. Secondary Category Match (Medium),
+        # 4. No Match (Low / Foundational)
         if this_trait_category == this_archetype_focus["primary"]:
-            # Range 0.55 - 0.65
-            # Use seed based on both trait and archetype to ensure uniqueness
-            seed = sum(ord(c) for c in trait_name + archetype.name)
-            variation = (seed % 11) * 0.01  # 0.00 to 0.10
-            return round(0.55 + variation, 2)
-            
-        # 3. Check for Secondary Category Match (Medium Correlation)
+            match = PRIMARY_MATCH
         elif this_trait_category == this_archetype_focus["secondary"]:
-            # Range 0.40 - 0.50
-            seed = sum(ord(c) for c in trait_name + archetype.name)
-            variation = (seed % 11) * 0.01 # 0.00 to 0.10
-            return round(0.40 + variation, 2)
-            
-        # 4. No Match (Low / Foundational Correlation)
+            match = SECONDARY_MATCH
         else:
-            # Range 0.20 - 0.35
-            # Ensure "Social Orientation" specifically isn't 0.0 unless truly irrelevant (it never is fully)
-            # Use deterministic hash-like value for stability
-            # value between 0.20 and 0.35
-            seed = sum(ord(c) for c in trait_name + archetype.name)
-            variation = (seed % 15) * 0.01  # 0.00 to 0.14
-            return round(0.20 + variation, 2)
+            match = NO_MATCH
+        
+        # Deterministic variation seeded by both trait and archetype to ensure uniqueness
+        base, modulus = CORRELATION_PARAMS[match]
+        seed = self._get_seed(trait_name, archetype.name)
+        return (base + seed % modulus) / 100
     
-    def get_archetype_correlation_data(self) -> Dict[str, List[float]]:
+    def _build_correlation_matrix(self) -> np.ndarray:
         """
-        Get correlation data for heatmap visualization.
+        Build the archetype x trait correlation matrix in one vectorized pass.
         
-        Returns 17 values per archetype in the specific order required by visualization_engine.
+        Applies the same rules as _calculate_trait_archetype_correlation to every
+        (archetype, trait) cell, with traits in TRAIT_ORDER.
         
         Returns:
-            Dictionary mapping archetype names to lists of 17 correlation scores
+            Read-only array of shape (n_archetypes, 17)
         """
-        # Define all traits in the exact order used by the heatmap
-        # Note: This order must match the trait_names order in visualization_engine.py
-        all_traits = [
-            "Social Orientation",           # 0 - IN
-            "Resilience and Grit",          # 1 - RG
-            "Servant Leadership",           # 2 - SL
-            "Emotional Intelligence",       # 3 - EI
-            "Decision Making",              # 4 - DM
-            "Problem Solving",              # 5 - PS
-            "Drive and Ambition",           # 6 - DA
-            "Innovation Orientation",       # 7 - IO
-            "Adaptability",                 # 8 - AD
-            "Critical Thinking",            # 9 - CT
-            "Team Building",                # 10 - TB
-            "Risk Taking",                  # 11 - RT
-            "Accountability",               # 12 - A
-            "Relationship-Building",        # 13 - RB
-            "Negotiation",                  # 14 - N
-            "Conflict Resolution",          # 15 - C
-            "Approach to Failure"           # 16 - F
-        ]
+        archetypes = list(self.archetypes.values())
+        trait_column = {trait_name: col for col, trait_name in enumerate(TRAIT_ORDER)}
         
-        correlation_data = {}
+        # Position of each trait within the archetype's key traits (-1 if not a key trait)
+        key_position = np.full((len(archetypes), len(TRAIT_ORDER)), -1, dtype=np.int64)
+        for row, archetype in enumerate(archetypes):
+            for position, trait_name in enumerate(archetype.key_traits):
+                if trait_name in trait_column:
+                    key_position[row, trait_column[trait_name]] = position
         
-        # Calculate correlation scores for each archetype
-        for archetype_id, archetype in self.archetypes.items():
-            archetype_name = archetype.name
-            correlation_scores = []
-            
-            for trait_name in all_traits:
-                # Calculate correlation score dynamically
-                score = self._calculate_trait_archetype_correlation(trait_name, archetype)
-                correlation_scores.append(score)
-            
-            correlation_data[archetype_name] = correlation_scores
+        trait_category = np.array([TRAIT_CATEGORIES.get(trait_name, "General") for trait_name in TRAIT_ORDER])
+        primary = np.array([ARCHETYPE_FOCUS.get(archetype.name, NO_FOCUS)["primary"] for archetype in archetypes])
+        secondary = np.array([ARCHETYPE_FOCUS.get(archetype.name, NO_FOCUS)["secondary"] for archetype in archetypes])
+        seed = np.array([[self._seed[(trait_name, archetype.name)] for trait_name in TRAIT_ORDER] for archetype in archetypes], dtype=np.int64)
         
-        # Add this at the end of the method
-        logger.info(f"Archetype correlation data generated:")
-        for arch_name, scores in correlation_data.items():
-            logger.info(f"  {arch_name}: {len(scores)} traits, range: {min(scores):.2f}-{max(scores):.2f}")
+        match = np.select(
+            [trait_category[None, :] == primary[:, None], trait_category[None, :] == secondary[:, None]],
+            [PRIMARY_MATCH, SECONDARY_MATCH],
+            NO_MATCH
+        ).astype(np.int64)
+        base = np.array([params[0] for params in CORRELATION_PARAMS], dtype=np.int64)
+        modulus = np.array([params[1] for params in CORRELATION_PARAMS], dtype=np.int64)
         
-        return correlation_data
+        if njit is not None:
+            hundredths = _correlation_kernel(key_position, match, seed, base, modulus)
+        else:
+            hundredths = np.where(
+                key_position >= 0,
+                KEY_TRAIT_BASE + np.maximum(0, KEY_TRAIT_MAX_BONUS - key_position),
+                base[match] + seed % modulus[match]
+            )
+        matrix = hundredths / 100.0
+        matrix.flags.writeable = False
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Archetype correlation data generated:")
+            for arch_name, low, high in zip(self._arch_names, matrix.min(axis=1), matrix.max(axis=1)):
+                logger.info(f"  {arch_name}: {matrix.shape[1]} traits, range: {low:.2f}-{high:.2f}")
+        
+        return matrix
+    
+    def get_archetype_correlation_matrix(self) -> np.ndarray:
+        """
+        Get the correlation matrix for NumPy-native callers.
+        
+        Returns:
+            Read-only array of shape (n_archetypes, 17); rows follow self.archetypes
+            order and columns follow TRAIT_ORDER
+        """
+        return self._corr_matrix
+    
+    def get_archetype_correlation_data(self) -> Dict[str, List[float]]:
+        """
+        Get correlation data for heatmap visualization.
+        
+        Returns 17 values per archetype in the specific order required by visualization_engine.
+        
+        Returns:
+            Dictionary mapping archetype names to lists of 17 correlation scores
+        """
+        # Hand out copies so callers cannot mutate the cached rows
+        return {arch_name: list(scores) for arch_name, scores in self._correlation_cache}
+
@@ -4,38 +4,474 @@ Report Generator - Generates comprehensive HTML reports with LLM content
 
 import os
 import json
+import hashlib
+import heapq
 import logging
+import random
 import re
-from typing import Dict, List, Any, Optional
+import sys
+import tempfile
+import textwrap
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from functools import lru_cache, partial
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
+from string import Template as PromptTemplate
+from threading import BoundedSemaphore, Lock
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
 from dotenv import load_dotenv
 
+from victoria.core.archetype_detector import ArchetypeDetector
+
+try:
+    import openai
+except ImportError:
+    openai = None
+
 # Load environment variables from .env file
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# In-memory LRU cache of LLM responses, keyed by a SHA-256 of the full request. The prompts and
+# responses quote respondents' answers, so LLM_RESPONSE_CACHE_SIZE=0 turns the cache off
+RESPONSE_CACHE_SIZE = int(os.getenv("LLM_RESPONSE_CACHE_SIZE", "4096"))
+_response_cache: "OrderedDict[str, str]" = OrderedDict()
+_response_cache_lock = Lock()
+
+# Sections generated together by generate_inspiring_content
+INSPIRING_CONTENT_SECTIONS = ['executive_summary', 'archetype_description']
+
+# OpenAI Batch API statuses after which a batch will not progress further
+BATCH_TERMINAL_STATUSES = frozenset({'completed', 'failed', 'expired', 'cancelled'})
+
+# Seconds to wait for an OpenAI batch before cancelling it (the batch completion window)
+BATCH_TIMEOUT = 24 * 60 * 60
+
+# Output budget for each free-form content section: the prompt asks for at most
+# SECTION_WORD_LIMIT words and max_tokens leaves ~1.5 tokens per word of headroom
+SECTION_WORD_LIMIT = 200
+SECTION_MAX_TOKENS = 300
+
+# Upper bound on OpenAI requests in flight at once across all report sections
+LLM_MAX_CONCURRENCY = 8
+_llm_semaphore = BoundedSemaphore(LLM_MAX_CONCURRENCY)
+
+# Transient OpenAI failures (rate limits, timeouts, dropped connections, 5xx) are retried
+# with full-jitter exponential backoff before a section falls back to static content
+LLM_MAX_ATTEMPTS = 5
+LLM_RETRY_MAX_WAIT = 30.0
+if openai is not None:
+    RETRYABLE_LLM_ERRORS = (
+        openai.RateLimitError,
+        openai.APITimeoutError,
+        openai.APIConnectionError,
+        openai.InternalServerError
+    )
+else:
+    RETRYABLE_LLM_ERRORS = ()
+
+# Trait heading names (as used in trait.txt and the report) to trait codes
+TRAIT_NAME_TO_CODE: Mapping[str, str] = MappingProxyType({
+    'Risk-Taking': 'RT',
+    'Introversion and Extroversion': 'IN',  # Keep for backward compatibility with trait.txt
+    'Social Orientation': 'IN',  # New name
+    'Relationship-Building': 'RB',
+    'Decision-Making': 'DM',
+    'Problem-Solving': 'PS',
+    'Critical Thinking': 'CT',
+    'Negotiation': 'N',
+    'Accountability': 'A',
+    'Emotional Intelligence': 'EI',
+    'Conflict Resolution': 'C',
+    'Team Building': 'TB',
+    'Servant Leadership': 'SL',
+    'Adaptability': 'AD',
+    'Approach to Failure': 'F',
+    'Resilience and Grit': 'RG',
+    'Innovation Orientation': 'IO',
+    'Drive and Ambition': 'DA'
+})
+
+# Trait descriptions file at the project root (next to victoria_pipeline.py)
+TRAIT_FILE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'trait.txt')
+
+# One trait.txt section: "Trait N: <name>" up to the next trait heading
+TRAIT_SECTION_PATTERN = re.compile(r'^Trait [^:\n]*:(?P<name>[^\n]*)\n(?P<body>.*?)(?=^Trait |\Z)', re.MULTILINE | re.DOTALL)
+
+# Sentence boundary used to trim trait descriptions to their opening sentences
+SENTENCE_SPLIT_PATTERN = re.compile(r'\.\s+')
+
+# Activation description used when the LLM is unavailable or fails
+ARCHETYPE_ACTIVATION_FALLBACK = """Your results confirm your strength as a {name} — someone who not only adapts and perseveres but also sees connections others often miss and pursues a vision rooted in making a difference rather than simply building something. These qualities position you to lead with both clarity and purpose, turning uncertainty into opportunity and setbacks into momentum.
+
+The next step is to activate these strengths through Vertria Vantage — a dynamic experience that transforms insights into practice. Here you'll engage in challenges that sharpen resilience, expand your ability to connect people and ideas, and translate your purpose into tangible strategies. You'll also step into a trusted network of peers and mentors who will walk beside you as you grow.
+
+Don't stop at insight. Step into Vertria Vantage, the next stage of your journey where your assessment comes alive — connecting you with the right opportunities, mentors, and challenges to activate your entrepreneurial advantage."""
+
+# Directory where generated archetype activation descriptions are kept and reused across reports
+# and runs; unset disables the cache (the text is rendered into reports unescaped, so the directory
+# must not be writable by others)
+ARCHETYPE_CACHE_DIR_ENV = "VICTORIA_ARCHETYPE_CACHE_DIR"
+
+# Part of every archetype cache key, next to the full request: bump it whenever the handling of
+# the cached text changes, so that descriptions cached by earlier code are no longer used
+ARCHETYPE_CACHE_VERSION = 1
+
+# First sentences this short that already address the reader are kept as written instead of being rewritten
+PLAIN_FIRST_SENTENCE_MAX_CHARS = 120
+PLAIN_FIRST_SENTENCE_OPENINGS = ('You ', 'Your ')
+
+# Sections that are short, tightly constrained rewrites run on OPENAI_FAST_MODEL; the rest use OPENAI_MODEL
+FAST_MODEL_SECTIONS = frozenset({
+    'archetype_description',
+    'strengths_explanation',
+    'growth_explanation',
+    'archetype_activation_description',
+    'first_sentence'
+})
+
+# Open-ended questions used as LLM context, and the subset most relevant to each content type
+CONTEXT_QUESTIONS = (
+    'Which of the following best describes where you are in your entrepreneurial journey?',
+    'What does "entrepreneurship" mean to you personally?',
+    'What kind of work energizes you most—and why?',
+    'When you imagine your future, what role (if any) does building something yourself play?',
+    'What are you learning about yourself right now—and what are you still figuring out?',
+    'What inspired you to take this assessment today?',
+    "What's a time when you took initiative or built something from scratch",
+    'What fears or uncertainties do you have about starting something of your own?',
+    'What kinds of work or challenges bring out the best in you?',
+    'When have you taken the lead without being asked—and what happened?',
+    'Where do you feel most confident in how you contribute?',
+    "What's something others often rely on you for?",
+    'How do you typically approach uncertainty or change?',
+    'If you were to fully embrace your entrepreneurial energy, what might become possible?'
+)
+RELEVANT_QUESTIONS_BY_TYPE = {
+    'executive_summary': (
+        CONTEXT_QUESTIONS[0], CONTEXT_QUESTIONS[1], CONTEXT_QUESTIONS[2], CONTEXT_QUESTIONS[3], CONTEXT_QUESTIONS[13]
+    ),
+    'archetype_description': (
+        CONTEXT_QUESTIONS[2], CONTEXT_QUESTIONS[8], CONTEXT_QUESTIONS[9], CONTEXT_QUESTIONS[10], CONTEXT_QUESTIONS[11]
+    ),
+    'personalized_insights': (
+        CONTEXT_QUESTIONS[4], CONTEXT_QUESTIONS[7], CONTEXT_QUESTIONS[10], CONTEXT_QUESTIONS[11], CONTEXT_QUESTIONS[12]
+    ),
+    'growth_opportunities_description': (
+        CONTEXT_QUESTIONS[4], CONTEXT_QUESTIONS[7], CONTEXT_QUESTIONS[8], CONTEXT_QUESTIONS[12]
+    ),
+    'next_steps_description': (
+        CONTEXT_QUESTIONS[0], CONTEXT_QUESTIONS[3], CONTEXT_QUESTIONS[5], CONTEXT_QUESTIONS[7], CONTEXT_QUESTIONS[13]
+    )
+}
+# Prompt templates, compiled once; sections are filled with $person_name, $archetype_name and $context
+PROMPT_TEMPLATES = {
+    'executive_summary': PromptTemplate("""Write a personal, engaging executive summary for $person_name who has been identified as a $archetype_name.
+
+Context from their responses:
+$context
+
+Focus on their personal journey, their vision, and what makes them unique. Use their actual words and make it feel personal and inspiring. Avoid specific numbers or percentages."""),
+    
+    'archetype_description': PromptTemplate("""Write a personal description of what the $archetype_name archetype means for this specific person.
+
+Context from their responses:
+$context
+
+Focus on how this archetype connects to their personal responses and journey. Make it feel personal and relevant to their specific situation. Avoid generic trait lists."""),
+    
+    'personalized_insights': PromptTemplate("""Provide personalized insights for $person_name based on their $archetype_name archetype and their specific responses.
+
+Context from their responses:
+$context
+
+Use their actual words and experiences to create relevant, personalized insights."""),
+    
+    'growth_opportunities_description': PromptTemplate("""Describe specific growth opportunities for $person_name based on their $archetype_name archetype and their responses.
+
+Context from their responses:
+$context
+
+Make the recommendations specific to their situation and goals."""),
+    
+    'next_steps_description': PromptTemplate("""Suggest concrete next steps for $person_name based on their $archetype_name archetype and their entrepreneurial journey.
+
+Context from their responses:
+$context
+
+Provide actionable, specific recommendations that align with their goals and current situation."""),
+    
+    # The two executive summary paragraphs of the comprehensive report
+    'executive_summary_archetype': PromptTemplate("""Write a professional paragraph (3-4 sentences, under 100 words) about the $archetype_name archetype in entrepreneurship.
+
+IMPORTANT - The KEY TRAITS for $archetype_name are: $key_traits
+
+Focus ONLY on:
+- What this archetype is and how it functions in entrepreneurship
+- Mention the specific key traits: $key_traits
+- How this archetype approaches business challenges and opportunities
+
+YOU MUST mention these exact key traits: $key_traits
+DO NOT mention any personal responses, quotes, or individual details.
+Be professional and concise."""),
+    
+    'executive_summary_personal': PromptTemplate("""Write a professional paragraph (3-4 sentences, under 100 words) analyzing these specific responses and how they connect to the $archetype_name archetype.
+
+ACTUAL RESPONSES TO ANALYZE:
+$responses
+
+REQUIREMENTS:
+- Use their EXACT quotes from the responses above
+- Show how their specific words connect to the archetype
+- Analyze their actual responses, not generic statements
+- Provide guidance based on their specific words
+
+DO NOT describe the archetype again.
+Be professional and concise."""),
+    
+    # Short explanations under the strengths and growth gauge graphs, filled with $trait_context
+    'strengths_explanation': PromptTemplate("""Based on these top 3 entrepreneurial strengths and their descriptions from trait.txt:
+
+$trait_context
+
+Write a brief 2-3 line explanation (under 60 words) that highlights how these specific traits work together to create entrepreneurial success. Focus on the synergy between these exact strengths and their practical impact in business contexts. Use an inspiring and professional tone that references the specific strengths mentioned in the trait descriptions."""),
+    
+    'growth_explanation': PromptTemplate("""Based on these growth opportunities and their descriptions from trait.txt:
+
+$trait_context
+
+Write a brief 2-3 line explanation (under 60 words) that motivates development in these specific areas. Focus on the potential impact of improving these exact traits and how they complement existing strengths. Use an encouraging and professional tone that references the specific growth potential mentioned in the trait descriptions.""")
+}
+
+# Output cap for one gauge graph explanation (under 60 words), and the text used when generating one fails
+EXPLANATION_MAX_TOKENS = 100
+STRENGTHS_EXPLANATION_ERROR_FALLBACK = "Your entrepreneurial strengths provide a solid foundation for success in business and leadership contexts."
+GROWTH_EXPLANATION_ERROR_FALLBACK = "Focus on developing these areas to create a more comprehensive entrepreneurial skill set."
+
+# Longer answers are shortened (on a word boundary) before they are embedded in a prompt
+CONTEXT_ANSWER_MAX_CHARS = 400
+
+def _create_with_retry(create: Callable[..., Any], **params) -> Any:
+    """Call an OpenAI create method under the concurrency cap, retrying transient errors with backoff"""
+    for attempt in range(1, LLM_MAX_ATTEMPTS + 1):
+        try:
+            with _llm_semaphore:
+                return create(**params)
+        except RETRYABLE_LLM_ERRORS as e:
+            if attempt == LLM_MAX_ATTEMPTS:
+                raise
+            # Sleep outside the semaphore so other requests can proceed meanwhile
+            delay = random.uniform(0, min(LLM_RETRY_MAX_WAIT, 2 ** attempt))
+            logger.warning(f"OpenAI request failed ({type(e).__name__}), retrying in {delay:.1f}s "
+                           f"(attempt {attempt}/{LLM_MAX_ATTEMPTS})")
+            time.sleep(delay)
+
+def _stream_with_retry(create: Callable[..., Any], **params) -> Iterator[Any]:
+    """Stream an OpenAI completion's chunks, holding a concurrency slot until the stream is read to the end"""
+    for attempt in range(1, LLM_MAX_ATTEMPTS + 1):
+        _llm_semaphore.acquire()
+        try:
+            stream = create(**params, stream=True)
+        except RETRYABLE_LLM_ERRORS as e:
+            _llm_semaphore.release()
+            if attempt == LLM_MAX_ATTEMPTS:
+                raise
+            delay = random.uniform(0, min(LLM_RETRY_MAX_WAIT, 2 ** attempt))
+            logger.warning(f"OpenAI request failed ({type(e).__name__}), retrying in {delay:.1f}s "
+                           f"(attempt {attempt}/{LLM_MAX_ATTEMPTS})")
+            time.sleep(delay)
+            continue
+        except BaseException:
+            _llm_semaphore.release()
+            raise
+        
+        # The completion is still being generated while it is read, so the slot is kept until then
+        try:
+            yield from stream
+        finally:
+            _llm_semaphore.release()
+        return
+
+def _response_cache_key(params: Dict[str, Any]) -> str:
+    """SHA-256 of a chat completion request, used as its response cache key"""
+    return hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+def _get_cached_response(cache_key: str) -> Optional[str]:
+    """Return a cached response (marking it recently used), or None"""
+    with _response_cache_lock:
+        if cache_key in _response_cache:
+            _response_cache.move_to_end(cache_key)
+            return _response_cache[cache_key]
+    return None
+
+def _cache_response(cache_key: str, content: str) -> None:
+    """Store a response, evicting the least recently used entries beyond RESPONSE_CACHE_SIZE"""
+    if RESPONSE_CACHE_SIZE <= 0:
+        return
+    with _response_cache_lock:
+        _response_cache[cache_key] = content
+        while len(_response_cache) > RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+
+# Sub-headings inside a trait section, and the description each one starts
+TRAIT_HEADING_PATTERN = re.compile(r'(?P<kind>Extroversion as a Strength|Introversion as a Strength|as a Strength|as a Growth Area)')
+TRAIT_HEADING_SECTIONS = {
+    'Extroversion as a Strength': 'extroversion',
+    'Introversion as a Strength': 'introversion',
+    'as a Strength': 'strength',
+    'as a Growth Area': 'growth'
+}
+
+@lru_cache(maxsize=4)
+def _parse_trait_file(trait_file_path: str, mtime: float) -> Dict[str, Dict[str, str]]:
+    """Parse trait.txt into {trait code: descriptions}; cached per path and modification time"""
+    logger.info(f"Parsing trait descriptions from: {trait_file_path}")
+    with open(trait_file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    # Parse the trait descriptions from the file
+    trait_descriptions = {}
+    
+    for match in TRAIT_SECTION_PATTERN.finditer(content):
+        lines = match.group('body').strip().splitlines()
+        
+        # Extract trait name and code
+        trait_name = match.group('name').strip()
+        trait_code = TRAIT_NAME_TO_CODE.get(trait_name)
+        
+        # Extract strength and growth area descriptions
+        # Special handling for IN trait which has two "as a Strength" sections
+        buffers = {"strength": [], "growth": [], "extroversion": [], "introversion": []}
+        
+        current_section = ""
+        for line in lines:
+            heading = TRAIT_HEADING_PATTERN.search(line)
+            section = TRAIT_HEADING_SECTIONS[heading.group('kind')] if heading else None
+            if section == "strength" and trait_code == 'IN':
+                section = None
+            
+            if section:
+                current_section = section
+            elif current_section:
+                text = line.strip()
+                if text:
+                    buffers[current_section].append(text)
+        
+        if trait_code:
+            # Special handling for IN trait (Social Orientation)
+            if trait_code == 'IN':
+                trait_descriptions[trait_code] = {
+                    'high_extro': " ".join(buffers["extroversion"]),
+                    'high_intro': " ".join(buffers["introversion"]),
+                    'low': " ".join(buffers["growth"])
+                }
+            else:
+                trait_descriptions[trait_code] = {
+                    'high': " ".join(buffers["strength"]),
+                    'low': " ".join(buffers["growth"])
+                }
+    
+    return trait_descriptions
+
+def _split_first_sentence(full_description: str) -> Optional[Tuple[str, str]]:
+    """Split a description into its first sentence and the remaining text (ending with a period), or None if it has one sentence"""
+    sentences = full_description.split('. ')
+    if len(sentences) < 2:
+        return None
+    
+    first_sentence = sentences[0].strip()
+    remaining_text = '. '.join(sentences[1:]).strip()
+    
+    # Ensure remaining text ends with period
+    if remaining_text and not remaining_text.endswith('.'):
+        remaining_text += '.'
+    return first_sentence, remaining_text
+
+def _is_plain_first_sentence(first_sentence: str) -> bool:
+    """Whether a first sentence is already short and reader-facing, so an LLM rewrite would add nothing"""
+    return (len(first_sentence) <= PLAIN_FIRST_SENTENCE_MAX_CHARS
+            and first_sentence.startswith(PLAIN_FIRST_SENTENCE_OPENINGS))
+
+def _join_first_sentence(new_first_sentence: str, remaining_text: str) -> str:
+    """Combine a rewritten first sentence (given a closing period if needed) with the original remaining text"""
+    if not new_first_sentence.endswith('.'):
+        new_first_sentence += '.'
+    return f"{new_first_sentence} {remaining_text}"
+
+def _start_concurrently(*calls: Callable[[], Any]) -> Callable[[], List[Any]]:
+    """Start independent blocking calls (e.g. OpenAI requests) in background threads; the returned function waits for their results, in order"""
+    executor = ThreadPoolExecutor(max_workers=len(calls))
+    futures = [executor.submit(call) for call in calls]
+    # Submitted calls keep running; this only releases the worker threads once they finish
+    executor.shutdown(wait=False)
+    return lambda: [future.result() for future in futures]
+
+def _run_concurrently(*calls: Callable[[], Any]) -> List[Any]:
+    """Run independent blocking calls (e.g. OpenAI requests) in parallel threads, returning results in order"""
+    return _start_concurrently(*calls)()
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep a regular dataclass
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
+class TraitView:
+    """A trait as displayed in the report template"""
+    code: str
+    name: str
+    score: float
+    percentage: float
+    description: str
+    is_low_score: bool
+    is_key_trait: bool = False
+    css_class: str = field(init=False)
+    
+    def __post_init__(self):
+        """Derive the CSS class that highlights low scores"""
+        self.css_class = 'low-score' if self.is_low_score else ''
+
 class ReportGenerator:
     """
     Generates comprehensive HTML reports with LLM-generated content
     """
     
+    # Trait name mapping for display
+    trait_name_mapping: Mapping[str, str] = MappingProxyType({
+        'A': 'Accountability', 'AD': 'Adaptability', 'C': 'Conflict Resolution',
+        'CT': 'Critical Thinking', 'DA': 'Drive and Ambition', 'DM': 'Decision-Making',
+        'EI': 'Emotional Intelligence', 'F': 'Approach to Failure', 'IN': 'Social Orientation',
+        'IO': 'Innovation Orientation', 'N': 'Negotiation', 'PS': 'Problem-Solving',
+        'RB': 'Relationship-Building', 'RG': 'Resilience and Grit', 'RT': 'Risk-Taking',
+        'SL': 'Servant Leadership', 'TB': 'Team Building'
+    })
+    
+    # Jinja environments (one per template directory) and compiled templates are shared by all instances
+    _jinja_environments: Dict[str, Environment] = {}
+    _template_cache: Dict[str, Template] = {}
+    
     def __init__(self, openai_client=None, template_path: str = "templates/html/vertria_comprehensive_report.html"):
         """Initialize report generator"""
         self.openai_client = openai_client
         self.template_path = template_path
         
-        # Trait name mapping for display
-        self.trait_name_mapping = {
-            'A': 'Accountability', 'AD': 'Adaptability', 'C': 'Conflict Resolution',
-            'CT': 'Critical Thinking', 'DA': 'Drive and Ambition', 'DM': 'Decision-Making',
-            'EI': 'Emotional Intelligence', 'F': 'Approach to Failure', 'IN': 'Social Orientation',
-            'IO': 'Innovation Orientation', 'N': 'Negotiation', 'PS': 'Problem-Solving',
-            'RB': 'Relationship-Building', 'RG': 'Resilience and Grit', 'RT': 'Risk-Taking',
-            'SL': 'Servant Leadership', 'TB': 'Team Building'
-        }
+        # Model names are read from the environment once per generator
+        self._model = os.getenv("OPENAI_MODEL", "gpt-4o")
+        self._fast_model = os.getenv("OPENAI_FAST_MODEL", "gpt-4o-mini")
+        
+        # Directory holding generated archetype activation descriptions (None disables it)
+        self._archetype_cache_dir = os.getenv(ARCHETYPE_CACHE_DIR_ENV) or None
+        
+        # Archetype detector and its name lookup, created on first use
+        self._detector = None
+        self._archetype_by_name: Dict[str, Any] = {}
+
     
     def generate_inspiring_content(self, profile_data: Dict[str, Any]) -> Dict[str, str]:
         """Generate inspiring content using LLM"""
@@ -43,29 +479,199 @@ class ReportGenerator:
             if not self.openai_client:
                 return self._generate_fallback_content(profile_data)
             
-            # Generate executive summary
-            executive_summary = self._generate_llm_content(
-                'executive_summary',
-                person_name=profile_data.get('person_name', 'You'),
-                archetype_name=profile_data.get('archetype_name', 'Resilient Leadership'),
-                overall_score=profile_data.get('overall_score', 85)
-            )
+            # Both sections share the same context, so request them in one JSON response
+            return self._generate_llm_sections(INSPIRING_CONTENT_SECTIONS, **self._inspiring_content_kwargs(profile_data))
             
-            # Generate archetype description
-            archetype_description = self._generate_llm_content(
-                'archetype_description',
-                person_name=profile_data.get('person_name', 'You'),
-                archetype_name=profile_data.get('archetype_name', 'Resilient Leadership')
+        except Exception as e:
+            logger.error(f"Error generating inspiring content: {e}")
+            return self._generate_fallback_content(profile_data)
+    
+    def generate_inspiring_content_batch(
+        self,
+        profiles: List[Dict[str, Any]],
+        poll_interval: float = 30.0,
+        timeout: float = BATCH_TIMEOUT
+    ) -> List[Dict[str, str]]:
+        """
+        Generate inspiring content for many profiles through the OpenAI Batch API (offline bulk runs only)
+        
+        A batch still running after timeout seconds is cancelled. Its profiles, like those of a
+        failed batch, get their content from the interactive path instead.
+        """
+        if not self.openai_client or not profiles:
+            return [self.generate_inspiring_content(profile_data) for profile_data in profiles]
+        
+        try:
+            # One JSONL request per profile, routed back by its index
+            lines = [
+                json.dumps({
+                    "custom_id": f"{index}:inspiring_content",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": self._build_llm_sections_request(INSPIRING_CONTENT_SECTIONS, **self._inspiring_content_kwargs(profile_data))
+                })
+                for index, profile_data in enumerate(profiles)
+            ]
+            batch_file = self.openai_client.files.create(
+                file=("inspiring_content_batch.jsonl", "\n".join(lines).encode('utf-8')),
+                purpose="batch"
+            )
+            batch = self.openai_client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
             )
+            logger.info(f"Submitted OpenAI batch {batch.id} with {len(lines)} requests")
+            
+            deadline = time.monotonic() + timeout
+            while batch.status not in BATCH_TERMINAL_STATUSES:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.openai_client.batches.cancel(batch.id)
+                    raise TimeoutError(f"Batch {batch.id} did not finish within {timeout} s and was cancelled")
+                time.sleep(min(poll_interval, remaining))
+                batch = self.openai_client.batches.retrieve(batch.id)
+            
+            if batch.status != 'completed' or not batch.output_file_id:
+                raise RuntimeError(f"Batch {batch.id} finished with status {batch.status}")
+            
+            contents = {}
+            for line in self.openai_client.files.content(batch.output_file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                result = json.loads(line)
+                response = result.get('response') or {}
+                if response.get('status_code') == 200:
+                    contents[result['custom_id']] = response['body']['choices'][0]['message']['content']
+            
+            results = []
+            for index, profile_data in enumerate(profiles):
+                content = contents.get(f"{index}:inspiring_content")
+                if content is None:
+                    # Request failed inside the batch; generate it interactively instead
+                    results.append(self.generate_inspiring_content(profile_data))
+                    continue
+                try:
+                    results.append(self._parse_llm_sections(content, INSPIRING_CONTENT_SECTIONS))
+                except ValueError as e:
+                    logger.error(f"Error parsing batch result for profile {index}: {e}")
+                    results.append(self.generate_inspiring_content(profile_data))
+            return results
             
-            return {
-                'executive_summary': executive_summary,
-                'archetype_description': archetype_description
-            }
+        except Exception as e:
+            logger.error(f"Error generating inspiring content batch: {e}")
+            return [self.generate_inspiring_content(profile_data) for profile_data in profiles]
+    
+    def _inspiring_content_kwargs(self, profile_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Prompt arguments for the inspiring content sections of a profile"""
+        return {
+            'person_name': profile_data.get('person_name', 'You'),
+            'archetype_name': profile_data.get('archetype_name', 'Resilient Leadership'),
+            'overall_score': profile_data.get('overall_score', 85)
+        }
+    
+    def _model_for_sections(self, *sections: str) -> str:
+        """Pick the model for a request: the fast model only if every section it produces allows it"""
+        if sections and all(section in FAST_MODEL_SECTIONS for section in sections):
+            return self._fast_model
+        return self._model
+    
+    def _get_detector(self):
+        """Return the archetype detector, creating it and its archetype name lookup on first use"""
+        if self._detector is None:
+            self._detector = ArchetypeDetector()
+            self._archetype_by_name = {arch.name: arch for arch in self._detector.archetypes.values()}
+        return self._detector
+    
+    def _get_template(self) -> Template:
+        """Return the compiled report template, loading it only once per template path"""
+        template = self._template_cache.get(self.template_path)
+        if template is None:
+            template_dir = os.path.dirname(self.template_path)
+            env = self._jinja_environments.get(template_dir)
+            if env is None:
+                env = Environment(
+                    loader=FileSystemLoader(template_dir),
+                    auto_reload=False,
+                    bytecode_cache=FileSystemBytecodeCache()
+                )
+                self._jinja_environments[template_dir] = env
+            template = env.get_template(os.path.basename(self.template_path))
+            self._template_cache[self.template_path] = template
+        return template
+    
+    def _chat_completion(self, **params) -> str:
+        """Return the message content for a chat completion, reusing cached responses for identical requests"""
+        cache_key = _response_cache_key(params)
+        content = _get_cached_response(cache_key)
+        if content is not None:
+            return content
+        
+        response = _create_with_retry(self.openai_client.chat.completions.create, **params)
+        content = response.choices[0].message.content
+        
+        _cache_response(cache_key, content)
+        return content
+    
+    def _build_llm_prompt(self, content_type: str, **kwargs) -> str:
+        """Build the LLM prompt for one content section from the profile context"""
+        # Only the per-section templates apply here (not the executive summary paragraph ones)
+        if content_type not in RELEVANT_QUESTIONS_BY_TYPE:
+            return f"Generate content for {content_type}"
+        
+        # Extract open-ended responses for context
+        open_ended_responses = kwargs.get('open_ended_responses', {})
+        context = self._create_llm_context(kwargs, open_ended_responses, content_type)
+        
+        # Enhanced prompt with actual responses
+        person_name = kwargs.get('person_name', 'a person')
+        raw_archetype_name = kwargs.get('archetype_name', 'Resilient Leader')
+        archetype_name = raw_archetype_name.replace('\\', '')
+        
+        return PROMPT_TEMPLATES[content_type].safe_substitute(
+            person_name=person_name,
+            archetype_name=archetype_name,
+            context=context
+        )
+    
+    def _build_llm_sections_request(self, content_types: List[str], **kwargs) -> Dict[str, Any]:
+        """Build the JSON-mode chat completion request that generates several content sections at once"""
+        section_prompts = "\n\n".join(
+            f'"{content_type}":\n{self._build_llm_prompt(content_type, **kwargs)}'
+            for content_type in content_types
+        )
+        prompt = f"""Write each of the following sections. Respond with a JSON object whose keys are {', '.join(f'"{content_type}"' for content_type in content_types)} and whose values are the finished text of each section. Keep each section under {SECTION_WORD_LIMIT} words.
+
+{section_prompts}"""
+        
+        return {
+            'model': self._model_for_sections(*content_types),
+            'messages': [{"role": "user", "content": prompt}],
+            'max_tokens': SECTION_MAX_TOKENS * len(content_types),
+            'temperature': 0.7,
+            'response_format': {"type": "json_object"}
+        }
+    
+    def _parse_llm_sections(self, content: str, content_types: List[str]) -> Dict[str, str]:
+        """Split a JSON-mode response into its sections, using placeholder text for any that are missing"""
+        sections = json.loads(content)
+        return {
+            content_type: str(sections.get(content_type) or f"Generated content for {content_type}").strip()
+            for content_type in content_types
+        }
+    
+    def _generate_llm_sections(self, content_types: List[str], **kwargs) -> Dict[str, str]:
+        """Generate several LLM content sections with a single JSON-mode request"""
+        try:
+            if not self.openai_client:
+                return {content_type: f"Generated content for {content_type}" for content_type in content_types}
+            
+            content = self._chat_completion(**self._build_llm_sections_request(content_types, **kwargs))
+            return self._parse_llm_sections(content, content_types)
             
         except Exception as e:
-            logger.error(f"Error generating inspiring content: {e}")
-            return self._generate_fallback_content(profile_data)
+            logger.error(f"Error generating LLM content for {', '.join(content_types)}: {e}")
+            return {content_type: f"Generated content for {content_type}" for content_type in content_types}
     
     def _generate_llm_content(self, content_type: str, **kwargs) -> str:
         """Generate LLM content for specific sections"""
@@ -73,67 +679,62 @@ class ReportGenerator:
             if not self.openai_client:
                 return f"Generated content for {content_type}"
             
-            # Extract open-ended responses for context
-            open_ended_responses = kwargs.get('open_ended_responses', {})
-            context = self._create_llm_context(kwargs, open_ended_responses)
+            content = self._chat_completion(**self._build_llm_content_request(content_type, **kwargs))
             
-            # Enhanced prompts with actual responses
-            person_name = kwargs.get('person_name', 'a person')
-            raw_archetype_name = kwargs.get('archetype_name', 'Resilient Leader')
-            archetype_name = raw_archetype_name.replace('\\', '')
-            
-            prompts = {
-                'executive_summary': f"""Write a personal, engaging executive summary for {person_name} who has been identified as a {archetype_name}.
-
-Context from their responses:
-{context}
-
-Focus on their personal journey, their vision, and what makes them unique. Use their actual words and make it feel personal and inspiring. Avoid specific numbers or percentages.""",
-                
-                'archetype_description': f"""Write a personal description of what the {archetype_name} archetype means for this specific person.
-
-Context from their responses:
-{context}
-
-Focus on how this archetype connects to their personal responses and journey. Make it feel personal and relevant to their specific situation. Avoid generic trait lists.""",
-                
-                'personalized_insights': f"""Provide personalized insights for {person_name} based on their {archetype_name} archetype and their specific responses.
-
-Context from their responses:
-{context}
-
-Use their actual words and experiences to create relevant, personalized insights.""",
-                
-                'growth_opportunities_description': f"""Describe specific growth opportunities for {person_name} based on their {archetype_name} archetype and their responses.
-
-Context from their responses:
-{context}
-
-Make the recommendations specific to their situation and goals.""",
-                
-                'next_steps_description': f"""Suggest concrete next steps for {person_name} based on their {archetype_name} archetype and their entrepreneurial journey.
-
-Context from their responses:
-{context}
-
-Provide actionable, specific recommendations that align with their goals and current situation."""
-            }
-            
-            prompt = prompts.get(content_type, f"Generate content for {content_type}")
-            
-            response = self.openai_client.chat.completions.create(
-                model=os.getenv("OPENAI_MODEL", "gpt-4o"),
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=500,
-                temperature=0.7
-            )
-            
-            return response.choices[0].message.content.strip()
+            return content.strip()
             
         except Exception as e:
             logger.error(f"Error generating LLM content for {content_type}: {e}")
             return f"Generated content for {content_type}"
     
+    def stream_llm_content(self, content_type: str, **kwargs) -> Iterator[str]:
+        """
+        Stream LLM content for a section as it is generated, for interactive callers
+        that can display partial text. Yields text fragments; the full text is cached
+        so a later non-streamed request for the same section is served from memory.
+        """
+        if not self.openai_client:
+            yield f"Generated content for {content_type}"
+            return
+        
+        params = self._build_llm_content_request(content_type, **kwargs)
+        cache_key = _response_cache_key(params)
+        content = _get_cached_response(cache_key)
+        if content is not None:
+            yield content.strip()
+            return
+        
+        parts = []
+        try:
+            for chunk in _stream_with_retry(self.openai_client.chat.completions.create, **params):
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    # Drop leading whitespace so the streamed text matches the stripped non-streamed result
+                    if not parts:
+                        delta = delta.lstrip()
+                        if not delta:
+                            continue
+                    parts.append(delta)
+                    yield delta
+        except Exception as e:
+            logger.error(f"Error streaming LLM content for {content_type}: {e}")
+            if not parts:
+                yield f"Generated content for {content_type}"
+            return
+        
+        _cache_response(cache_key, ''.join(parts))
+    
+    def _build_llm_content_request(self, content_type: str, **kwargs) -> Dict[str, Any]:
+        """Build the chat completion request for a single content section"""
+        prompt = self._build_llm_prompt(content_type, **kwargs)
+        
+        return {
+            'model': self._model_for_sections(content_type),
+            'messages': [{"role": "user", "content": f"{prompt}\n\nKeep it under {SECTION_WORD_LIMIT} words."}],
+            'max_tokens': SECTION_MAX_TOKENS,
+            'temperature': 0.7
+        }
+    
     def _generate_fallback_content(self, profile_data: Dict[str, Any]) -> Dict[str, str]:
         """Generate fallback content when LLM is not available"""
         # Extract open-ended responses for personalized content
@@ -150,197 +751,40 @@ Provide actionable, specific recommendations that align with their goals and cur
     
     
     
-    def _create_llm_context(self, profile_data: Dict[str, Any], open_ended_responses: Dict[str, str]) -> str:
-        """Create context for LLM from open-ended responses"""
+    def _create_llm_context(self, profile_data: Dict[str, Any], open_ended_responses: Dict[str, str],
+                            content_type: Optional[str] = None) -> str:
+        """Create context for LLM from the open-ended responses most relevant to a content type"""
         context_parts = []
         
-        # Add key responses
-        key_questions = [
-            'Which of the following best describes where you are in your entrepreneurial journey?',
-            'What does "entrepreneurship" mean to you personally?',
-            'What kind of work energizes you most—and why?',
-            'When you imagine your future, what role (if any) does building something yourself play?',
-            'What are you learning about yourself right now—and what are you still figuring out?',
-            'What inspired you to take this assessment today?',
-            "What's a time when you took initiative or built something from scratch",
-            'What fears or uncertainties do you have about starting something of your own?',
-            'What kinds of work or challenges bring out the best in you?',
-            'When have you taken the lead without being asked—and what happened?',
-            'Where do you feel most confident in how you contribute?',
-            "What's something others often rely on you for?",
-            'How do you typically approach uncertainty or change?',
-            'If you were to fully embrace your entrepreneurial energy, what might become possible?'
-        ]
-        
-        for question in key_questions:
+        # Add key responses, trimmed to keep prompts small
+        for question in RELEVANT_QUESTIONS_BY_TYPE.get(content_type, CONTEXT_QUESTIONS):
             if question in open_ended_responses and open_ended_responses[question]:
-                context_parts.append(f"Q: {question}\nA: {open_ended_responses[question]}")
+                answer = textwrap.shorten(str(open_ended_responses[question]), width=CONTEXT_ANSWER_MAX_CHARS, placeholder='...')
+                context_parts.append(f"Q: {question}\nA: {answer}")
         
         return "\n\n".join(context_parts)
     
-    def _load_trait_descriptions(self):
-        """Load detailed trait descriptions from trait.txt file"""
-        # Get the project root directory (where victoria_pipeline.py is located)
-        # From victoria/core/report_generator.py -> victoria/core -> victoria -> project root
-        project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-        trait_file_path = os.path.join(project_root, 'trait.txt')
-        logger.info(f"Looking for trait.txt at: {trait_file_path}")
-        logger.info(f"File exists: {os.path.exists(trait_file_path)}")
+    def _load_trait_descriptions(self) -> Dict[str, Dict[str, str]]:
+        """Load detailed trait descriptions from trait.txt file (shared, re-parsed only if the file changes)"""
         try:
-            with open(trait_file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Parse the trait descriptions from the file
-            trait_descriptions = {}
-            sections = content.split('Trait ')
-            
-            for section in sections[1:]:  # Skip first empty section
-                lines = section.strip().split('\n')
-                if len(lines) < 2:
-                    continue
-                    
-                # Extract trait name and code
-                trait_line = lines[0]
-                if ':' in trait_line:
-                    trait_name = trait_line.split(':')[1].strip()
-                    trait_code = self._get_trait_code_from_name(trait_name)
-                    
-                    # Extract strength and growth area descriptions
-                    # Special handling for IN trait which has two "as a Strength" sections
-                    strength_text = ""
-                    growth_text = ""
-                    extroversion_text = ""
-                    introversion_text = ""
-                    
-                    current_section = ""
-                    for line in lines[1:]:
-                        if "Extroversion as a Strength" in line:
-                            current_section = "extroversion"
-                        elif "Introversion as a Strength" in line:
-                            current_section = "introversion"
-                        elif "as a Strength" in line and trait_code != 'IN':
-                            current_section = "strength"
-                        elif "as a Growth Area" in line:
-                            current_section = "growth"
-                        elif line.strip() and current_section:
-                            if current_section == "strength":
-                                strength_text += line.strip() + " "
-                            elif current_section == "growth":
-                                growth_text += line.strip() + " "
-                            elif current_section == "extroversion":
-                                extroversion_text += line.strip() + " "
-                            elif current_section == "introversion":
-                                introversion_text += line.strip() + " "
-                    
-                    if trait_code:
-                        # Special handling for IN trait (Social Orientation)
-                        if trait_code == 'IN':
-                            trait_descriptions[trait_code] = {
-                                'high_extro': extroversion_text.strip(),
-                                'high_intro': introversion_text.strip(),
-                                'low': growth_text.strip()
-                            }
-                        else:
-                            trait_descriptions[trait_code] = {
-                                'high': strength_text.strip(),
-                                'low': growth_text.strip()
-                            }
-            
-            return trait_descriptions
+            return _parse_trait_file(TRAIT_FILE_PATH, os.path.getmtime(TRAIT_FILE_PATH))
         except Exception as e:
-            logger.error(f"Error loading trait descriptions: {e}")
+            logger.error(f"Error loading trait descriptions from {TRAIT_FILE_PATH}: {e}")
             return {}
     
     def _get_trait_code_from_name(self, trait_name: str) -> str:
         """Map trait name to trait code"""
-        name_to_code = {
-            'Risk-Taking': 'RT',
-            'Introversion and Extroversion': 'IN',  # Keep for backward compatibility with trait.txt
-            'Social Orientation': 'IN',  # New name
-            'Relationship-Building': 'RB',
-            'Decision-Making': 'DM',
-            'Problem-Solving': 'PS',
-            'Critical Thinking': 'CT',
-            'Negotiation': 'N',
-            'Accountability': 'A',
-            'Emotional Intelligence': 'EI',
-            'Conflict Resolution': 'C',
-            'Team Building': 'TB',
-            'Servant Leadership': 'SL',
-            'Adaptability': 'AD',
-            'Approach to Failure': 'F',
-            'Resilience and Grit': 'RG',
-            'Innovation Orientation': 'IO',
-            'Drive and Ambition': 'DA'
-        }
-        return name_to_code.get(trait_name, None)
+        return TRAIT_NAME_TO_CODE.get(trait_name)
 
     def _generate_comprehensive_executive_summary(self, data: Dict[str, Any]) -> Dict[str, str]:
         """Generate comprehensive executive summary using LLM with open-ended responses"""
         try:
             # Extract key data
-            person_name = data.get('person_name', 'Victoria Raish')
-            overall_score = data.get('overall_score', 0.0)
             archetype_name = data.get('archetype_name', 'Resilient Leadership')
-            archetype_score = data.get('archetype_score', 0.8)
-            archetype_description = data.get('archetype_description', '')
-            
-            # Get trait scores for top traits
-            trait_scores = data.get('trait_scores', {})
-            top_traits = sorted(trait_scores.items(), key=lambda x: x[1], reverse=True)[:3]
             
             # Get open-ended responses from the data
             open_ended_responses = data.get('open_ended_responses', {})
             
-            # Create structured prompt
-            prompt = f"""
-            Create a professional executive summary for {person_name}'s entrepreneurial assessment report.
-            
-            Key Information:
-            - Archetype: {archetype_name} (Score: {archetype_score:.1f})
-            - Overall Score: {overall_score * 100:.1f}%
-            - Top Strengths: {', '.join([self.trait_name_mapping.get(trait[0], trait[0]) for trait in top_traits])}
-            
-            Selected Responses:
-            - Journey stage: {open_ended_responses.get('Which of the following best describes where you are in your entrepreneurial journey?', 'Not provided')}
-            - Entrepreneurship definition: {open_ended_responses.get('What does "entrepreneurship" mean to you personally?', 'Not provided')}
-            - What energizes them: {open_ended_responses.get('What kind of work energizes you most—and why?', 'Not provided')}
-            - Future vision: {open_ended_responses.get('When you imagine your future, what role (if any) does building something yourself play?', 'Not provided')}
-            - Desired impact: {open_ended_responses.get('What kind of impact do you hope your business will create—in your life or for others?', 'Not provided')}
-            - What draws them: {open_ended_responses.get('What is drawing you toward entrepreneurship at this moment in your life?', 'Not provided')}
-            - Initiative example: {open_ended_responses.get("What's a time when you took initiative or built something from scratch?", 'Not provided')}
-            - Fears/uncertainties: {open_ended_responses.get('What fears or uncertainties do you have about starting something of your own?', 'Not provided')}
-            - Success definition: {open_ended_responses.get('What would success look like for you in this phase of exploration?', 'Not provided')}
-            - Entrepreneurial energy: {open_ended_responses.get('If you were to fully embrace your entrepreneurial energy, what might become possible?', 'Not provided')}
-            
-            STRUCTURE REQUIRED:
-            
-            PARAGRAPH 1 (3-4 sentences): ARCHETYPE AND REPORT OVERVIEW
-            Write ONLY about:
-            - The {archetype_name} archetype and how it functions in entrepreneurship
-            - The practical characteristics and behaviors of this archetype
-            - Overview of the comprehensive assessment report and its value
-            - DO NOT mention any personal responses, quotes, or individual details
-            - DO NOT use trait.txt content
-            
-            PARAGRAPH 2 (3-4 sentences): OPEN-ENDED RESPONSES ANALYSIS
-            Write ONLY about their specific responses:
-            - Analyze their specific quotes and how they connect to the archetype
-            - Show how their answers demonstrate archetype characteristics
-            - Provide guidance based on their specific responses
-            - DO NOT describe the archetype again
-            - DO NOT use trait.txt content
-            
-            CRITICAL RULES:
-            - Paragraph 1 = Archetype and report overview only
-            - Paragraph 2 = Personal responses analysis only
-            - NO mixing of topics between paragraphs
-            - NO repetition of words or phrases
-            - Use their actual words only once
-            - Be concise and professional
-            - Fix grammar errors
-            """
-            
             if self.openai_client:
                 # Generate archetype paragraph only
                 clean_archetype_name = archetype_name.replace('\\', '')
@@ -348,29 +792,9 @@ Provide actionable, specific recommendations that align with their goals and cur
                 archetype_key_traits = data.get('archetype_key_traits', [])
                 key_traits_str = ', '.join(archetype_key_traits) if archetype_key_traits else 'Not defined'
                 
-                archetype_prompt = f"""
-                Write a professional paragraph (3-4 sentences) about the {clean_archetype_name} archetype in entrepreneurship.
-                
-                IMPORTANT - The KEY TRAITS for {clean_archetype_name} are: {key_traits_str}
-                
-                Focus ONLY on:
-                - What this archetype is and how it functions in entrepreneurship
-                - Mention the specific key traits: {key_traits_str}
-                - How this archetype approaches business challenges and opportunities
-                
-                YOU MUST mention these exact key traits: {key_traits_str}
-                DO NOT mention any personal responses, quotes, or individual details.
-                Be professional and concise.
-                """
-                
-                archetype_response = self.openai_client.chat.completions.create(
-                    model=os.getenv("OPENAI_MODEL", "gpt-4o"),
-                    messages=[
-                        {"role": "system", "content": f"You are an expert entrepreneurial coach. Write ONLY about archetypes in entrepreneurship. The key traits for {clean_archetype_name} are: {key_traits_str}. You MUST mention these exact traits."},
-                        {"role": "user", "content": archetype_prompt}
-                    ],
-                    max_tokens=200,
-                    temperature=0.3
+                archetype_prompt = PROMPT_TEMPLATES['executive_summary_archetype'].safe_substitute(
+                    archetype_name=clean_archetype_name,
+                    key_traits=key_traits_str
                 )
                 
                 # Generate personal responses paragraph only
@@ -398,44 +822,58 @@ Provide actionable, specific recommendations that align with their goals and cur
                 logger.debug(f"Success definition: {success_def}")
                 logger.debug(f"Entrepreneurial energy: {entrepreneurial_energy}")
                 
-                personal_prompt = f"""
-                Write a professional paragraph (3-4 sentences) analyzing these specific responses and how they connect to the {clean_archetype_name} archetype.
-                
-                ACTUAL RESPONSES TO ANALYZE:
-                - Journey stage: "{journey_stage}"
-                - Entrepreneurship definition: "{entrepreneurship_def}"
-                - What energizes them: "{what_energizes}"
-                - Future vision: "{future_vision}"
-                - Desired impact: "{desired_impact}"
-                - What draws them: "{what_draws}"
-                - Initiative example: "{initiative_example}"
-                - Fears/uncertainties: "{fears}"
-                - Success definition: "{success_def}"
-                - Entrepreneurial energy: "{entrepreneurial_energy}"
-                
-                REQUIREMENTS:
-                - Use their EXACT quotes from the responses above (only use responses that are not "Not provided")
-                - Show how their specific words connect to the archetype
-                - Analyze their actual responses, not generic statements
-                - Provide guidance based on their specific words
+                # Only embed the responses that were actually given, trimmed to keep the prompt small
+                responses_to_analyze = "\n".join(
+                    f'- {label}: "{textwrap.shorten(str(response), width=CONTEXT_ANSWER_MAX_CHARS, placeholder="...")}"'
+                    for label, response in (
+                        ('Journey stage', journey_stage),
+                        ('Entrepreneurship definition', entrepreneurship_def),
+                        ('What energizes them', what_energizes),
+                        ('Future vision', future_vision),
+                        ('Desired impact', desired_impact),
+                        ('What draws them', what_draws),
+                        ('Initiative example', initiative_example),
+                        ('Fears/uncertainties', fears),
+                        ('Success definition', success_def),
+                        ('Entrepreneurial energy', entrepreneurial_energy)
+                    )
+                    if response and response != 'Not provided'
+                ) or '- No responses provided'
                 
-                DO NOT describe the archetype again.
-                Be professional and concise.
-                """
+                personal_prompt = PROMPT_TEMPLATES['executive_summary_personal'].safe_substitute(
+                    archetype_name=clean_archetype_name,
+                    responses=responses_to_analyze
+                )
                 
-                personal_response = self.openai_client.chat.completions.create(
-                    model=os.getenv("OPENAI_MODEL", "gpt-4o"),
-                    messages=[
-                        {"role": "system", "content": "You are an expert entrepreneurial coach. Write ONLY about analyzing personal responses and how they connect to archetypes. You MUST use the exact quotes provided in the responses. Do not describe the archetype itself. Focus on their specific words and how they demonstrate archetype characteristics."},
-                        {"role": "user", "content": personal_prompt}
-                    ],
-                    max_tokens=200,
-                    temperature=0.3
+                # The two paragraphs are independent, so request them concurrently
+                archetype_content, personal_content = _run_concurrently(
+                    partial(
+                        self._chat_completion,
+                        model=self._model_for_sections('executive_summary'),
+                        messages=[
+                            {"role": "system", "content": f"You are an expert entrepreneurial coach. Write ONLY about archetypes in entrepreneurship. The key traits for {clean_archetype_name} are: {key_traits_str}. You MUST mention these exact traits."},
+                            {"role": "user", "content": archetype_prompt}
+                        ],
+                        max_tokens=160,
+                        temperature=0.3,
+                        stop=["\n\n\n"]
+                    ),
+                    partial(
+                        self._chat_completion,
+                        model=self._model_for_sections('executive_summary'),
+                        messages=[
+                            {"role": "system", "content": "You are an expert entrepreneurial coach. Write ONLY about analyzing personal responses and how they connect to archetypes. You MUST use the exact quotes provided in the responses. Do not describe the archetype itself. Focus on their specific words and how they demonstrate archetype characteristics."},
+                            {"role": "user", "content": personal_prompt}
+                        ],
+                        max_tokens=160,
+                        temperature=0.3,
+                        stop=["\n\n\n"]
+                    )
                 )
                 
                 return {
-                    'paragraph1': archetype_response.choices[0].message.content.strip(),
-                    'paragraph2': personal_response.choices[0].message.content.strip()
+                    'paragraph1': archetype_content.strip(),
+                    'paragraph2': personal_content.strip()
                 }
             else:
                 # Fallback if no OpenAI client
@@ -452,118 +890,151 @@ Provide actionable, specific recommendations that align with their goals and cur
                 'paragraph2': f"The {data.get('archetype_name', 'Resilient Leadership')} archetype was selected because it best matches your entrepreneurial profile and goals."
             }
 
+    def _select_strength_traits(self, trait_scores: Dict[str, float]) -> List[Tuple[str, float]]:
+        """Top 3 traits shown in the strengths gauge graphs (excluding IN)"""
+        # Filter out IN (Social Orientation) from trait scores
+        filtered_scores = {k: v for k, v in trait_scores.items() if k != 'IN'}
+        return heapq.nlargest(3, filtered_scores.items(), key=itemgetter(1))
+    
+    def _select_growth_traits(self, trait_scores: Dict[str, float]) -> List[Tuple[str, float]]:
+        """Bottom 3 traits shown in the growth gauge graphs (excluding IN), avoiding the top 3 where possible"""
+        # Filter out IN (Social Orientation) from trait scores
+        filtered_scores = {k: v for k, v in trait_scores.items() if k != 'IN'}
+        # Get the actual bottom 3 traits with lowest scores, but exclude any that are in top 3
+        top_3_traits = heapq.nlargest(3, filtered_scores.items(), key=itemgetter(1))
+        top_3_codes = {trait[0] for trait in top_3_traits}
+        
+        # Get the bottom 3 traits from the lowest scores, excluding top 3
+        bottom_traits = heapq.nsmallest(
+            3, ((trait, score) for trait, score in filtered_scores.items() if trait not in top_3_codes),
+            key=itemgetter(1)
+        )
+        
+        # If we don't have 3 traits after filtering, take the actual bottom 3
+        if len(bottom_traits) < 3:
+            bottom_traits = heapq.nsmallest(3, filtered_scores.items(), key=itemgetter(1))
+        return bottom_traits
+    
+    def _build_explanation_prompt(self, content_type: str, traits: List[Tuple[str, float]], score: float, focus: str) -> str:
+        """Build the strengths or growth explanation prompt from the trait.txt descriptions of the given traits"""
+        trait_names = [self.trait_name_mapping.get(trait, trait) for trait, _ in traits]
+        
+        # Get trait descriptions from trait.txt, as context for the LLM
+        trait_descriptions = []
+        for (trait_code, _), trait_name in zip(traits, trait_names):
+            description = self._get_source_trait_description(trait_code, score)
+            if description:
+                trait_descriptions.append(f"{trait_name}: {description}")
+        
+        trait_context = "\n".join(trait_descriptions) if trait_descriptions else f"{focus}: {', '.join(trait_names)}"
+        return PROMPT_TEMPLATES[content_type].safe_substitute(trait_context=trait_context)
+    
     def _generate_strengths_explanation(self, trait_scores: Dict[str, float]) -> str:
         """Generate explanation for top 3 strengths shown in gauge graphs"""
         try:
-            # Filter out IN (Social Orientation) from trait scores
-            filtered_scores = {k: v for k, v in trait_scores.items() if k != 'IN'}
             # Get top 3 traits (same as gauge graphs, excluding IN)
-            sorted_traits = sorted(filtered_scores.items(), key=lambda x: x[1], reverse=True)[:3]
+            sorted_traits = self._select_strength_traits(trait_scores)
             
             if not sorted_traits:
                 return "Your entrepreneurial strengths are developing through continuous learning and experience."
             
-            trait_names = [self.trait_name_mapping.get(trait, trait) for trait, _ in sorted_traits]
-            
-            # Get trait descriptions from trait.txt for strengths
-            trait_descriptions = []
-            for trait_code, _ in sorted_traits:
-                trait_name = self.trait_name_mapping.get(trait_code, trait_code)
-                description = self._get_trait_description(trait_code, 0.8)  # High score for strength
-                if description:
-                    trait_descriptions.append(f"{trait_name}: {description}")
+            if not self.openai_client:
+                # Fallback content only needs the trait names
+                trait_names = [self.trait_name_mapping.get(trait, trait) for trait, _ in sorted_traits]
+                return f"Your combination of {', '.join(trait_names)} creates a powerful foundation for entrepreneurial success. These strengths enable you to navigate challenges with confidence while building meaningful connections and driving innovation in your ventures."
             
             # Generate LLM content for these specific strengths
-            if self.openai_client:
-                trait_context = "\n".join(trait_descriptions) if trait_descriptions else f"Focus on these strengths: {', '.join(trait_names)}"
-                
-                prompt = f"""Based on these top 3 entrepreneurial strengths and their descriptions from trait.txt:
-
-{trait_context}
-
-Write a brief 2-3 line explanation that highlights how these specific traits work together to create entrepreneurial success. Focus on the synergy between these exact strengths and their practical impact in business contexts. Use an inspiring and professional tone that references the specific strengths mentioned in the trait descriptions."""
-                
-                response = self.openai_client.chat.completions.create(
-                    model=os.getenv("OPENAI_MODEL", "gpt-4o"),
-                    messages=[{"role": "user", "content": prompt}],
-                    max_tokens=120,
-                    temperature=0.7
-                )
-                return response.choices[0].message.content.strip()
-            else:
-                # Fallback content using trait descriptions
-                if trait_descriptions:
-                    return f"Your combination of {', '.join(trait_names)} creates a powerful foundation for entrepreneurial success. These strengths enable you to navigate challenges with confidence while building meaningful connections and driving innovation in your ventures."
-                else:
-                    return f"Your combination of {', '.join(trait_names)} creates a powerful foundation for entrepreneurial success. These strengths enable you to navigate challenges with confidence while building meaningful connections and driving innovation in your ventures."
+            prompt = self._build_explanation_prompt(
+                'strengths_explanation', sorted_traits, 0.8, "Focus on these strengths"  # High score for strength
+            )
+            content = self._chat_completion(
+                model=self._model_for_sections('strengths_explanation'),
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=EXPLANATION_MAX_TOKENS,
+                temperature=0.7,
+                stop=["\n\n"]
+            )
+            return content.strip()
                 
         except Exception as e:
             logger.error(f"Error generating strengths explanation: {e}")
-            return "Your entrepreneurial strengths provide a solid foundation for success in business and leadership contexts."
+            return STRENGTHS_EXPLANATION_ERROR_FALLBACK
 
     def _generate_growth_explanation(self, trait_scores: Dict[str, float]) -> str:
         """Generate explanation for growth opportunities shown in gauge graphs"""
         try:
-            # Filter out IN (Social Orientation) from trait scores
-            filtered_scores = {k: v for k, v in trait_scores.items() if k != 'IN'}
             # Get bottom 3 traits (same as growth gauge graphs) - exclude top 3 to avoid duplication
-            sorted_traits = sorted(filtered_scores.items(), key=lambda x: x[1])  # Sort lowest to highest
-            # Get the actual bottom 3 traits with lowest scores, but exclude any that are in top 3
-            top_3_traits = sorted(filtered_scores.items(), key=lambda x: x[1], reverse=True)[:3]
-            top_3_codes = [trait[0] for trait in top_3_traits]
-            
-            # Get the bottom 3 traits from the lowest scores, excluding top 3
-            bottom_traits = []
-            for trait, score in sorted_traits:
-                if trait not in top_3_codes:
-                    bottom_traits.append((trait, score))
-                if len(bottom_traits) >= 3:
-                    break
-            
-            # If we don't have 3 traits after filtering, take the actual bottom 3
-            if len(bottom_traits) < 3:
-                bottom_traits = sorted_traits[:3]
+            bottom_traits = self._select_growth_traits(trait_scores)
             
             if not bottom_traits:
                 return "Focus on continuous development to enhance your entrepreneurial capabilities."
             
-            trait_names = [self.trait_name_mapping.get(trait, trait) for trait, _ in bottom_traits]
-            
-            # Get trait descriptions from trait.txt for growth areas
-            trait_descriptions = []
-            for trait_code, _ in bottom_traits:
-                trait_name = self.trait_name_mapping.get(trait_code, trait_code)
-                description = self._get_trait_description(trait_code, 0.3)  # Low score for growth area
-                if description:
-                    trait_descriptions.append(f"{trait_name}: {description}")
+            if not self.openai_client:
+                # Fallback content only needs the trait names
+                trait_names = [self.trait_name_mapping.get(trait, trait) for trait, _ in bottom_traits]
+                return f"Developing these areas will strengthen your overall entrepreneurial profile: {', '.join(trait_names)}. These growth opportunities represent key areas where focused development can create more balanced leadership approaches and unlock new potential in your business endeavors."
             
             # Generate LLM content for these specific growth areas
-            if self.openai_client:
-                trait_context = "\n".join(trait_descriptions) if trait_descriptions else f"Focus on developing: {', '.join(trait_names)}"
+            prompt = self._build_explanation_prompt(
+                'growth_explanation', bottom_traits, 0.3, "Focus on developing"  # Low score for growth area
+            )
+            content = self._chat_completion(
+                model=self._model_for_sections('growth_explanation'),
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=EXPLANATION_MAX_TOKENS,
+                temperature=0.7,
+                stop=["\n\n"]
+            )
+            return content.strip()
                 
-                prompt = f"""Based on these growth opportunities and their descriptions from trait.txt:
+        except Exception as e:
+            logger.error(f"Error generating growth explanation: {e}")
+            return GROWTH_EXPLANATION_ERROR_FALLBACK
 
-{trait_context}
+    def _generate_trait_explanations(self, trait_scores: Dict[str, float]) -> Tuple[str, str]:
+        """Generate the strengths and growth explanations together with one JSON-mode request"""
+        strength_traits = self._select_strength_traits(trait_scores)
+        growth_traits = self._select_growth_traits(trait_scores)
+        
+        # Without a client, or with nothing to explain, each generator returns its fallback without a request
+        if not (self.openai_client and strength_traits and growth_traits):
+            return self._generate_strengths_explanation(trait_scores), self._generate_growth_explanation(trait_scores)
+        
+        try:
+            strengths_prompt = self._build_explanation_prompt(
+                'strengths_explanation', strength_traits, 0.8, "Focus on these strengths"  # High score for strength
+            )
+            growth_prompt = self._build_explanation_prompt(
+                'growth_explanation', growth_traits, 0.3, "Focus on developing"  # Low score for growth area
+            )
+            prompt = f"""Write both of the following explanations. Respond with a JSON object whose keys are "strengths_explanation" and "growth_explanation" and whose values are the finished text of each explanation.
 
-Write a brief 2-3 line explanation that motivates development in these specific areas. Focus on the potential impact of improving these exact traits and how they complement existing strengths. Use an encouraging and professional tone that references the specific growth potential mentioned in the trait descriptions."""
-                
-                response = self.openai_client.chat.completions.create(
-                    model=os.getenv("OPENAI_MODEL", "gpt-4o"),
-                    messages=[{"role": "user", "content": prompt}],
-                    max_tokens=150,
-                    temperature=0.7
-                )
-                return response.choices[0].message.content.strip()
-            else:
-                # Fallback content using trait descriptions
-                if trait_descriptions:
-                    return f"Developing these areas will strengthen your overall entrepreneurial profile: {', '.join(trait_names)}. These growth opportunities represent key areas where focused development can create more balanced leadership approaches and unlock new potential in your business endeavors."
-                else:
-                    return f"Developing {', '.join(trait_names)} will strengthen your overall entrepreneurial profile. These areas represent opportunities to enhance your capabilities and create more balanced leadership approaches in your business endeavors."
-                
+"strengths_explanation":
+{strengths_prompt}
+
+"growth_explanation":
+{growth_prompt}"""
+            
+            content = self._chat_completion(
+                model=self._model_for_sections('strengths_explanation', 'growth_explanation'),
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=EXPLANATION_MAX_TOKENS * 2,
+                temperature=0.7,
+                response_format={"type": "json_object"}
+            )
+            sections = json.loads(content)
+            
         except Exception as e:
-            logger.error(f"Error generating growth explanation: {e}")
-            return "Focus on developing these areas to create a more comprehensive entrepreneurial skill set."
+            logger.error(f"Error generating strengths and growth explanations: {e}")
+            return STRENGTHS_EXPLANATION_ERROR_FALLBACK, GROWTH_EXPLANATION_ERROR_FALLBACK
+        
+        # An explanation missing from the response falls back to its own request
+        strengths = sections.get('strengths_explanation')
+        growth = sections.get('growth_explanation')
+        return (
+            strengths.strip() if isinstance(strengths, str) and strengths.strip() else self._generate_strengths_explanation(trait_scores),
+            growth.strip() if isinstance(growth, str) and growth.strip() else self._generate_growth_explanation(trait_scores)
+        )
 
     def _generate_individual_growth_explanations(self, trait_scores: Dict[str, float]) -> List[Dict[str, str]]:
         """Generate individual explanations for each growth trait"""
@@ -571,8 +1042,7 @@ Write a brief 2-3 line explanation that motivates development in these specific
             # Filter out IN (Social Orientation) from trait scores
             filtered_scores = {k: v for k, v in trait_scores.items() if k != 'IN'}
             # Get bottom 3 traits (lowest scores) - simple approach
-            sorted_traits = sorted(filtered_scores.items(), key=lambda x: x[1])  # Sort lowest to highest
-            bottom_traits = sorted_traits[:3]  # Take the first 3 (lowest scores)
+            bottom_traits = heapq.nsmallest(3, filtered_scores.items(), key=itemgetter(1))
             
             # Debug: Print the bottom 3 traits being selected
 
@@ -580,43 +1050,27 @@ Write a brief 2-3 line explanation that motivates development in these specific
             if not bottom_traits:
                 return []
             
+            # For growth opportunities, use the 'low' (Growth Area) descriptions from trait.txt
+            trait_descriptions = self._load_trait_descriptions()
+            
             explanations = []
             for trait_code, score in bottom_traits:
                 # Use the exact trait name as shown in gauge graphs
                 trait_name = self.trait_name_mapping.get(trait_code, trait_code)
                 
-                # For growth opportunities, use the 'low' (Growth Area) descriptions from trait.txt
-                if not hasattr(self, '_trait_descriptions'):
-                    self._trait_descriptions = self._load_trait_descriptions()
-                
-                if trait_code in self._trait_descriptions:
-                    description = self._trait_descriptions[trait_code]['low']  # Use Growth Area description
+                if trait_code in trait_descriptions:
+                    description = trait_descriptions[trait_code]['low']  # Use Growth Area description
                 else:
                     description = f"Developing {trait_name} will strengthen your entrepreneurial capabilities and create new opportunities for growth."
                 
                 # Use only 1-2 complete sentences from trait.txt description
                 if description:
-                    # Split description into complete sentences using regex
-                    sentences = re.split(r'\.\s+', description)
+                    # Split off just the first 2 sentences, ensuring each ends with a period
+                    sentences = (sentence.strip() for sentence in SENTENCE_SPLIT_PATTERN.split(description, maxsplit=2)[:2])
+                    clean_sentences = [sentence if sentence.endswith('.') else sentence + '.' for sentence in sentences if sentence]
                     
-                    # Clean up sentences and ensure they end with periods
-                    clean_sentences = []
-                    for sentence in sentences:
-                        sentence = sentence.strip()
-                        if sentence and not sentence.endswith('.'):
-                            sentence += '.'
-                        if sentence:
-                            clean_sentences.append(sentence)
-                    
-                    if len(clean_sentences) >= 2:
-                        # Take first 2 complete sentences
-                        explanation_text = ' '.join(clean_sentences[:2])
-                    elif len(clean_sentences) == 1:
-                        # If only 1 complete sentence, use it
-                        explanation_text = clean_sentences[0]
-                    else:
-                        # Fallback to original description
-                        explanation_text = description
+                    # Fallback to original description if no complete sentence was found
+                    explanation_text = ' '.join(clean_sentences) if clean_sentences else description
                 else:
                     # Fallback explanation using exact trait name
                     explanation_text = f"Developing {trait_name} will strengthen your entrepreneurial capabilities and create new opportunities for growth."
@@ -632,53 +1086,121 @@ Write a brief 2-3 line explanation that motivates development in these specific
             logger.error(f"Error generating individual growth explanations: {e}")
             return []
 
-    def _get_trait_description(self, trait_code: str, score: float) -> str:
-        """Get trait description based on score and trait code using detailed descriptions from trait.txt"""
-        # Load trait descriptions if not already loaded
-        if not hasattr(self, '_trait_descriptions'):
-            self._trait_descriptions = self._load_trait_descriptions()
+    def _get_trait_description(self, trait_code: str, score: float,
+                               descriptions: Dict[Tuple[str, float], str]) -> str:
+        """Get trait description based on score and trait code, reusing descriptions already generated for this report"""
+        cache_key = (trait_code, score)
+        description = descriptions.get(cache_key)
+        if description is None:
+            description = self._build_trait_description(trait_code, score)
+            descriptions[cache_key] = description
+        return description
+    
+    def _build_trait_description(self, trait_code: str, score: float) -> str:
+        """Build trait description based on score and trait code using detailed descriptions from trait.txt"""
+        full_description = self._get_source_trait_description(trait_code, score)
+        
+        # Only vary the first sentence using LLM, keep rest from trait.txt
+        if full_description.strip():
+            if self.openai_client:
+                return self._vary_first_sentence_only(trait_code, score, full_description)
+            else:
+                return full_description
+        else:
+            # Fallback to basic description
+            return f"Your {self.trait_name_mapping.get(trait_code, trait_code)} score is {round(score * 100, 1)}%."
+    
+    def _get_source_trait_description(self, trait_code: str, score: float) -> str:
+        """Return the unmodified trait.txt description for a trait, or an empty string if there is none"""
+        trait_descriptions = self._load_trait_descriptions()
+        
+        if trait_code not in trait_descriptions:
+            return ''
         
         # Special handling for IN trait (Social Orientation)
         if trait_code == 'IN':
-            if trait_code in self._trait_descriptions:
-                # Select description based on score threshold (0.5)
-                if score >= 0.5:
-                    # High score = Extroversion
-                    full_description = self._trait_descriptions[trait_code].get('high_extro', '')
-                else:
-                    # Low score = Introversion
-                    full_description = self._trait_descriptions[trait_code].get('high_intro', '')
-                
-                if full_description.strip():
-                    # Only vary the first sentence using LLM, keep rest from trait.txt
-                    if self.openai_client:
-                        return self._vary_first_sentence_only(trait_code, score, full_description)
-                    else:
-                        return full_description
-                else:
-                    # Fallback if descriptions not found
-                    return f"Your {self.trait_name_mapping.get(trait_code, trait_code)} score is {round(score * 100, 1)}%."
-            else:
-                return f"Your {self.trait_name_mapping.get(trait_code, trait_code)} score is {round(score * 100, 1)}%."
+            # Select description based on score threshold (0.5):
+            # high score = Extroversion, low score = Introversion
+            if score >= 0.5:
+                return trait_descriptions[trait_code].get('high_extro', '')
+            return trait_descriptions[trait_code].get('high_intro', '')
         
         # For all other traits, use the standard 'high' (Strength) description
-        level = 'high'
+        return trait_descriptions[trait_code].get('high', '')
+    
+    def _prefill_trait_descriptions(self, trait_scores: Dict[str, float],
+                                    descriptions: Dict[Tuple[str, float], str]) -> None:
+        """Fill a report's descriptions with every scored trait's varied text, using one batched first-sentence rewrite"""
+        if not self.openai_client:
+            return
+        
+        pending = {}
+        for trait_code, score in trait_scores.items():
+            cache_key = (trait_code, score)
+            if cache_key in descriptions or cache_key in pending:
+                continue
+            full_description = self._get_source_trait_description(trait_code, score)
+            if not full_description.strip():
+                continue
+            split = _split_first_sentence(full_description)
+            if split is None or _is_plain_first_sentence(split[0]):
+                descriptions[cache_key] = full_description
+                continue
+            pending[cache_key] = (trait_code, score, split)
+        
+        if not pending:
+            return
         
-        # Get description for trait code
-        if trait_code in self._trait_descriptions:
-            full_description = self._trait_descriptions[trait_code].get(level, '')
+        rewrites = self._vary_first_sentences_batch(
+            [(trait_code, score, first_sentence) for trait_code, score, (first_sentence, _) in pending.values()]
+        )
+        # Traits missing from the batch response fall back to the per-trait rewrite later
+        for index, (cache_key, (_, _, (_, remaining_text))) in enumerate(pending.items()):
+            if index in rewrites:
+                descriptions[cache_key] = _join_first_sentence(rewrites[index], remaining_text)
+    
+    def _vary_first_sentences_batch(self, items: List[Tuple[str, float, str]]) -> Dict[int, str]:
+        """Rewrite the first sentence of several trait descriptions in one request; returns {item index: sentence}"""
+        try:
+            listed = "\n\n".join(
+                f"[{index}] Trait: {self.trait_name_mapping.get(trait_code, trait_code)}\n"
+                f"Score: {round(score * 100, 1)}%\n"
+                f"Original First Sentence: {first_sentence}"
+                for index, (trait_code, score, first_sentence) in enumerate(items)
+            )
+            prompt = f"""Create a simple, clear first sentence for each of these trait descriptions. Keep them straightforward and professional.
+
+{listed}
+
+Requirements:
+- EXACTLY one sentence per trait
+- Keep the same meaning and key points
+- Make it simple and clear
+- Avoid complex or flowery language
+- End with a period
+- Keep it professional
+
+Respond with a JSON object mapping each trait's number (as a string, e.g. "0") to its new first sentence."""
+
+            content = self._chat_completion(
+                model=self._model_for_sections('first_sentence'),
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=40 * len(items),
+                temperature=0.3,
+                response_format={"type": "json_object"}
+            )
             
-            # Only vary the first sentence using LLM, keep rest from trait.txt
-            if full_description.strip():
-                if self.openai_client:
-                    return self._vary_first_sentence_only(trait_code, score, full_description)
-                else:
-                    return full_description
-            else:
-                return f"Your {self.trait_name_mapping.get(trait_code, trait_code)} score is {round(score * 100, 1)}%."
-        else:
-            # Fallback to basic description
-            return f"Your {self.trait_name_mapping.get(trait_code, trait_code)} score is {round(score * 100, 1)}%."
+            sentences = json.loads(content)
+            rewrites = {}
+            for index in range(len(items)):
+                sentence = sentences.get(str(index))
+                if isinstance(sentence, str) and sentence.strip():
+                    rewrites[index] = sentence.strip()
+            return rewrites
+            
+        except Exception as e:
+            logger.error(f"Error varying first sentences in batch: {e}")
+            return {}
     
     def _vary_first_sentence_only(self, trait_code: str, score: float, full_description: str) -> str:
         """Only vary the first sentence of trait description, keep rest from trait.txt"""
@@ -687,17 +1209,14 @@ Write a brief 2-3 line explanation that motivates development in these specific
             score_percentage = round(score * 100, 1)
             
             # Split description into sentences
-            sentences = full_description.split('. ')
-            if len(sentences) < 2:
+            split = _split_first_sentence(full_description)
+            if split is None:
                 # If only one sentence, return as is
                 return full_description
-            
-            first_sentence = sentences[0].strip()
-            remaining_text = '. '.join(sentences[1:]).strip()
-            
-            # Ensure remaining text ends with period
-            if remaining_text and not remaining_text.endswith('.'):
-                remaining_text += '.'
+            first_sentence, remaining_text = split
+            if _is_plain_first_sentence(first_sentence):
+                # Already simple and clear; a rewrite would come back near-identical
+                return full_description
             
             # Generate simple first sentence only
             prompt = f"""Create a simple, clear first sentence for this trait description. Keep it straightforward and professional.
@@ -716,28 +1235,31 @@ Requirements:
 
 Generate ONLY the first sentence:"""
 
-            response = self.openai_client.chat.completions.create(
-                model=os.getenv("OPENAI_MODEL", "gpt-4o"),
+            content = self._chat_completion(
+                model=self._model_for_sections('first_sentence'),
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=30,
-                temperature=0.3
+                temperature=0.3,
+                stop=["\n"]
             )
             
-            new_first_sentence = response.choices[0].message.content.strip()
-            
-            # Ensure it ends with period
-            if not new_first_sentence.endswith('.'):
-                new_first_sentence += '.'
-            
             # Combine new first sentence with original remaining text
-            return f"{new_first_sentence} {remaining_text}"
+            return _join_first_sentence(content.strip(), remaining_text)
             
         except Exception as e:
             logger.error(f"Error varying first sentence for {trait_code}: {e}")
             return full_description  # Fallback to original description
     
+    def _archetype_cache_path(self, params: Dict[str, Any]) -> Optional[str]:
+        """Disk cache file for the activation description generated by a request, or None when the cache is disabled"""
+        if not self._archetype_cache_dir:
+            return None
+        # The request holds the model and the whole prompt, so editing the prompt changes the key
+        key = _response_cache_key({'cache_version': ARCHETYPE_CACHE_VERSION, **params})
+        return os.path.join(self._archetype_cache_dir, f"{key}.txt")
+    
     def _generate_archetype_activation_description(self, archetype_name: str) -> str:
-        """Generate archetype-specific activation description"""
+        """Generate archetype-specific activation description, reusing one already generated for this archetype"""
         try:
             if self.openai_client:
                 clean_archetype_name = archetype_name.replace('\\', '')
@@ -758,32 +1280,49 @@ Requirements:
 
 Generate the activation description:"""
 
-                response = self.openai_client.chat.completions.create(
-                    model=os.getenv("OPENAI_MODEL", "gpt-4o"),
-                    messages=[{"role": "user", "content": prompt}],
-                    max_tokens=300,
-                    temperature=0.7
-                )
+                params = {
+                    'model': self._model_for_sections('archetype_activation_description'),
+                    'messages': [{"role": "user", "content": prompt}],
+                    'max_tokens': 300,
+                    'temperature': 0.7
+                }
+                cache_path = self._archetype_cache_path(params)
+                if cache_path:
+                    try:
+                        with open(cache_path, 'r', encoding='utf-8') as f:
+                            cached = f.read()
+                        if cached.strip():
+                            return cached
+                    except OSError:
+                        pass
+                
+                content = self._chat_completion(**params).strip()
+                
+                # Write through a temporary file so concurrent reports never read a partial description
+                if content and cache_path:
+                    try:
+                        os.makedirs(self._archetype_cache_dir, exist_ok=True)
+                        # A temporary file of its own, so threads writing the same archetype never share one
+                        fd, tmp_path = tempfile.mkstemp(dir=self._archetype_cache_dir, suffix='.tmp')
+                        try:
+                            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                                f.write(content)
+                            os.replace(tmp_path, cache_path)
+                        except BaseException:
+                            os.unlink(tmp_path)
+                            raise
+                    except OSError as e:
+                        logger.warning(f"Could not cache archetype activation description: {e}")
                 
-                return response.choices[0].message.content.strip()
+                return content
             else:
                 # Fallback description
-                clean_archetype_name = archetype_name.replace('\\', '')
-                return f"""Your results confirm your strength as a {clean_archetype_name} — someone who not only adapts and perseveres but also sees connections others often miss and pursues a vision rooted in making a difference rather than simply building something. These qualities position you to lead with both clarity and purpose, turning uncertainty into opportunity and setbacks into momentum.
-
-The next step is to activate these strengths through Vertria Vantage — a dynamic experience that transforms insights into practice. Here you'll engage in challenges that sharpen resilience, expand your ability to connect people and ideas, and translate your purpose into tangible strategies. You'll also step into a trusted network of peers and mentors who will walk beside you as you grow.
-
-Don't stop at insight. Step into Vertria Vantage, the next stage of your journey where your assessment comes alive — connecting you with the right opportunities, mentors, and challenges to activate your entrepreneurial advantage."""
+                return ARCHETYPE_ACTIVATION_FALLBACK.format(name=archetype_name.replace('\\', ''))
                 
         except Exception as e:
             logger.error(f"Error generating archetype activation description: {e}")
             # Fallback description
-            clean_archetype_name = archetype_name.replace('\\', '')
-            return f"""Your results confirm your strength as a {clean_archetype_name} — someone who not only adapts and perseveres but also sees connections others often miss and pursues a vision rooted in making a difference rather than simply building something. These qualities position you to lead with both clarity and purpose, turning uncertainty into opportunity and setbacks into momentum.
-
-The next step is to activate these strengths through Vertria Vantage — a dynamic experience that transforms insights into practice. Here you'll engage in challenges that sharpen resilience, expand your ability to connect people and ideas, and translate your purpose into tangible strategies. You'll also step into a trusted network of peers and mentors who will walk beside you as you grow.
-
-Don't stop at insight. Step into Vertria Vantage, the next stage of your journey where your assessment comes alive — connecting you with the right opportunities, mentors, and challenges to activate your entrepreneurial advantage."""
+            return ARCHETYPE_ACTIVATION_FALLBACK.format(name=archetype_name.replace('\\', ''))
     
     
     def generate_comprehensive_report(self, data: Dict[str, Any], output_path: str) -> Dict[str, Any]:
@@ -794,36 +1333,50 @@ Don't stop at insight. Step into Vertria Vantage, the next stage of your journey
             
             # Prepare traits data for template
             trait_scores = data.get('trait_scores', {})
-            traits = []
-            for trait_code, score in trait_scores.items():
-                trait_name = self.trait_name_mapping.get(trait_code, trait_code)
-                trait_description = self._get_trait_description(trait_code, score)
-                is_low_score = score < 0.6  # Below 60%
-                traits.append({
-                    'code': trait_name,  # Use full name instead of abbreviation
-                    'name': trait_name,
-                    'score': score,
-                    'percentage': round(score * 100, 1),
-                    'description': trait_description,
-                    'is_low_score': is_low_score,
-                    'css_class': 'low-score' if is_low_score else ''
-                })
+            
+            # Start the LLM-backed sections straight away: strengths and growth explanations (one
+            # request), individual growth trait explanations, archetype activation description and the
+            # comprehensive executive summary are independent of each other and of the
+            # template scaffolding below, so they run while it is built
+            collect_sections = _start_concurrently(
+                partial(self._generate_trait_explanations, trait_scores),
+                partial(self._generate_individual_growth_explanations, trait_scores),
+                partial(self._generate_archetype_activation_description, data.get('archetype_name', 'Resilient Leadership')),
+                partial(self._generate_comprehensive_executive_summary, dict(data))
+            )
+            
+            # Trait descriptions belong to this report only, keyed by (trait code, exact score);
+            # every trait's first sentence is rewritten in a single request up front
+            descriptions: Dict[Tuple[str, float], str] = {}
+            self._prefill_trait_descriptions(trait_scores, descriptions)
+            
+            # Resolve each trait's display fields once; the full trait list and the
+            # key traits section below both read from here
+            resolved = {
+                trait_code: TraitView(
+                    code=trait_name,  # Use full name instead of abbreviation
+                    name=trait_name,
+                    score=score,
+                    percentage=round(score * 100, 1),
+                    description=self._get_trait_description(trait_code, score, descriptions),
+                    is_low_score=score < 0.6  # Below 60%
+                )
+                for trait_code, score in trait_scores.items()
+                for trait_name in (self.trait_name_mapping.get(trait_code, trait_code),)
+            }
+            
+            traits = list(resolved.values())
             
             # Sort traits by score (highest first)
-            traits.sort(key=lambda x: x['score'], reverse=True)
+            traits.sort(key=lambda x: x.score, reverse=True)
             
             # Create prioritized Key Traits list: Social Orientation FIRST, then archetype key traits
             # Create prioritized Key Traits list based on Archetype definition
-            from victoria.core.archetype_detector import ArchetypeDetector
-            detector = ArchetypeDetector()
+            detector = self._get_detector()
             archetype_name = data.get('archetype_name', 'Resilient Leadership')
             
             # Find the archetype object
-            archetype_obj = None
-            for arch_id, arch in detector.archetypes.items():
-                if arch.name == archetype_name:
-                    archetype_obj = arch
-                    break
+            archetype_obj = self._archetype_by_name.get(archetype_name)
             
             key_traits_for_section = []
             
@@ -837,37 +1390,24 @@ Don't stop at insight. Step into Vertria Vantage, the next stage of your journey
                         key_trait_codes.append(trait_code)
                 
                 # Get trait data for key traits, sorted by score (highest first)
-                archetype_key_traits_data = []
-                for trait_code in key_trait_codes:
-                    if trait_code in trait_scores:
-                        trait_name = self.trait_name_mapping.get(trait_code, trait_code)
-                        score = trait_scores[trait_code]
-                        trait_description = self._get_trait_description(trait_code, score)
-                        archetype_key_traits_data.append({
-                            'code': trait_name,
-                            'name': trait_name,
-                            'score': score,
-                            'percentage': round(score * 100, 1),
-                            'description': trait_description,
-                            'is_low_score': score < 0.6,
-                            'css_class': 'low-score' if score < 0.6 else '',
-                            'is_key_trait': True
-                        })
+                archetype_key_traits_data = [
+                    replace(resolved[trait_code], is_key_trait=True)
+                    for trait_code in key_trait_codes
+                    if trait_code in resolved
+                ]
                 
                 # Sort archetype key traits by score (highest first)
-                archetype_key_traits_data.sort(key=lambda x: x['score'], reverse=True)
+                archetype_key_traits_data.sort(key=lambda x: x.score, reverse=True)
                 key_traits_for_section.extend(archetype_key_traits_data)
                 
                 # We want exactly TOP 4 traits
                 # If we have fewer than 4 key traits, fill with highest scoring non-key traits
                 if len(key_traits_for_section) < 4:
                     remaining_slots = 4 - len(key_traits_for_section)
-                    existing_codes = [t['code'] for t in key_traits_for_section]
+                    existing_codes = {t.code for t in key_traits_for_section}
                     
-                    # Get all other traits not already added
-                    non_key_traits = [t for t in traits if t['code'] not in existing_codes]
-                    # Ensure they are sorted by score
-                    non_key_traits.sort(key=lambda x: x['score'], reverse=True)
+                    # Get all other traits not already added (traits is already sorted by score)
+                    non_key_traits = [t for t in traits if t.code not in existing_codes]
                     
                     key_traits_for_section.extend(non_key_traits[:remaining_slots])
                 
@@ -886,15 +1426,15 @@ Don't stop at insight. Step into Vertria Vantage, the next stage of your journey
             if 'growth_gauges_chart' in data:
                 data['growth_trait_gauges'] = data['growth_gauges_chart']
             
-            # Generate trait explanations for strengths and growth opportunities
-            data['strengths_explanation'] = self._generate_strengths_explanation(trait_scores)
-            data['growth_explanation'] = self._generate_growth_explanation(trait_scores)
-            
-            # Generate individual growth trait explanations
-            data['growth_trait_explanations'] = self._generate_individual_growth_explanations(trait_scores)
-            
-            # Generate archetype activation description
-            data['archetype_activation_description'] = self._generate_archetype_activation_description(data.get('archetype_name', 'Resilient Leadership'))
+            # Collect the LLM-backed sections started above
+            (
+                (data['strengths_explanation'], data['growth_explanation']),
+                data['growth_trait_explanations'],
+                data['archetype_activation_description'],
+                executive_summary
+            ) = collect_sections()
+            data['executive_summary_paragraph1'] = executive_summary['paragraph1']
+            data['executive_summary_paragraph2'] = executive_summary['paragraph2']
             
             # Add entrepreneurial stage data
             data['entrepreneurial_stage'] = data.get('entrepreneurial_stage', 'Discover')
@@ -917,23 +1457,17 @@ Don't stop at insight. Step into Vertria Vantage, the next stage of your journey
                 {"title": "Networking", "description": "Broader networks that encourage you to experiment with different roles and directions."}
             ])
             
-            # Generate comprehensive executive summary using LLM
-            executive_summary = self._generate_comprehensive_executive_summary(data)
-            data['executive_summary_paragraph1'] = executive_summary['paragraph1']
-            data['executive_summary_paragraph2'] = executive_summary['paragraph2']
-            
-            # Load template
-            template_dir = os.path.dirname(self.template_path)
-            template_name = os.path.basename(self.template_path)
-            env = Environment(loader=FileSystemLoader(template_dir))
-            template = env.get_template(template_name)
-            
-            # Render template
-            html_content = template.render(**data)
-            
-            # Write to file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            # Render the template chunk by chunk into a temporary file next to the report, which
+            # replaces the report only once complete, so a failed render never leaves a truncated one
+            # (created with open() rather than mkstemp, so the report's mode follows the umask)
+            tmp_path = f"{output_path}.{uuid.uuid4().hex}.tmp"
+            try:
+                with open(tmp_path, 'x', encoding='utf-8') as f:
+                    self._get_template().stream(**data).dump(f)
+                os.replace(tmp_path, output_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
             
             logger.info(f"Report generated successfully: {output_path}")
             return {'success': True, 'file_path': output_path}
@@ -2,20 +2,162 @@
 Visualization Engine - Creates all visualizations for the report
 """
 
+import json
+from functools import lru_cache
 import plotly.graph_objects as go
+import plotly.io as pio
 import plotly.express as px
-from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Callable, Dict, List, Tuple, Optional, Any
 import logging
-from dotenv import load_dotenv
+from types import MappingProxyType
 
-# Load environment variables from .env file
-load_dotenv()
+from victoria.core.archetype_detector import get_default_detector
+
+# Optional JIT compilation for the score level bucketing
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 logger = logging.getLogger(__name__)
 
+# Bar chart score levels: High (>= 0.70) green, Medium (>= 0.50) orange, Low red
+HIGH_SCORE_THRESHOLD = 0.70
+MEDIUM_SCORE_THRESHOLD = 0.50
+SCORE_LEVEL_COLORS = ('#2E8B57', '#FFA500', '#DC143C')
+
+# Rendered score-driven charts kept per engine, keyed by the exact trait scores
+CHART_CACHE_SIZE = 128
+
+def _score_levels(scores):
+    """Score level of each score as an index into SCORE_LEVEL_COLORS: 0 high, 1 medium, 2 low"""
+    out = np.empty(scores.size, dtype=np.int8)
+    for i in range(scores.size):
+        if scores[i] >= HIGH_SCORE_THRESHOLD:
+            out[i] = 0
+        elif scores[i] >= MEDIUM_SCORE_THRESHOLD:
+            out[i] = 1
+        else:
+            out[i] = 2
+    return out
+
+if njit is not None:
+    _score_levels = njit(cache=True)(_score_levels)
+
+# Heatmap rows, top to bottom: archetype name and its y-axis label (match score is appended per report)
+HEATMAP_ARCHETYPE_ORDER = (
+    ('Adaptive Intelligence', 'Adaptive<br>Intelligence'),
+    ('Ambitious Drive', 'Ambitious Drive'),
+    ('Collaborative Responsibility', 'Collaborative<br>Responsibility'),
+    ('Resilient Leadership', 'Resilient<br>Leadership'),
+    ('Strategic Innovation', 'Strategic<br>Innovation')
+)
+# Heatmap row of each archetype, for highlighting the detected one
+HEATMAP_ARCHETYPE_INDEX = MappingProxyType({
+    full_name: i for i, (full_name, _) in enumerate(HEATMAP_ARCHETYPE_ORDER)
+})
+HEATMAP_TRAIT_COUNT = 17
+
+# Trait names in exact heatmap column order
+HEATMAP_TRAIT_NAMES = (
+    'Social Orientation',  # IN - Always include first
+    'Resilience & Grit', 'Servant Leadership', 'Emotional Intelligence',
+    'Decision-Making', 'Problem-Solving', 'Drive & Ambition',
+    'Innovation Orientation', 'Adaptability', 'Critical Thinking',
+    'Team Building', 'Risk Taking', 'Accountability',
+    'Relationship-Building', 'Negotiation', 'Conflict Resolution', 'Approach to Failure'
+)
+
+# Shorter display names for x-axis labels to prevent truncation
+HEATMAP_TRAIT_DISPLAY_NAMES = (
+    'Social Orientation',
+    'Resilience & Grit', 'Servant Leadership', 'Emotional Intel.',
+    'Decision-Making', 'Problem-Solving', 'Drive & Ambition',
+    'Innovation Orient.', 'Adaptability', 'Critical Thinking',
+    'Team Building', 'Risk Taking', 'Accountability',
+    'Relationship-Bldg', 'Negotiation', 'Conflict Resol.', 'Approach to Failure'
+)
+
+# Mapping from heatmap trait names to archetype trait names (for key trait detection)
+HEATMAP_TO_ARCHETYPE_TRAIT = MappingProxyType({
+    'Social Orientation': 'Social Orientation',
+    'Resilience & Grit': 'Resilience and Grit',
+    'Servant Leadership': 'Servant Leadership',
+    'Emotional Intel.': 'Emotional Intelligence',
+    'Decision-Making': 'Decision Making',
+    'Problem-Solving': 'Problem Solving',
+    'Drive & Ambition': 'Drive and Ambition',
+    'Innovation Orient.': 'Innovation Orientation',
+    'Adaptability': 'Adaptability',
+    'Critical Thinking': 'Critical Thinking',
+    'Team Building': 'Team Building',
+    'Risk Taking': 'Risk Taking',
+    'Accountability': 'Accountability',
+    'Relationship-Bldg': 'Relationship-Building',
+    'Negotiation': 'Negotiation',
+    'Conflict Resol.': 'Conflict Resolution',
+    'Approach to Failure': 'Approach to Failure'
+})
+
+# Heatmap correlation colour scale, white (no correlation) to blue (perfect)
+HEATMAP_COLORSCALE = (
+    (0.0, '#FFFFFF'), (0.2, '#E6F3FF'), (0.4, '#CCE7FF'),
+    (0.6, '#99CFFF'), (0.8, '#66B7FF'), (1.0, '#339FFF')
+)
+HEATMAP_COLORBAR = MappingProxyType({
+    'title': {'text': "Correlation<br>Score", 'font': {'size': 9}},
+    'tickmode': "array",
+    'tickvals': (0, 0.2, 0.4, 0.6, 0.8, 1.0),
+    'ticktext': ("Low", "Low-Med", "Medium", "High", "Very High", "Perfect"),
+    'len': 0.6, 'thickness': 15, 'x': 0.78, 'xpad': 3,
+    'tickfont': {'size': 7}
+})
+# Font of the heatmap cell value labels (plotly copies it into each annotation)
+HEATMAP_ANNOTATION_FONT = {'color': "black", 'size': 11, 'family': "Arial, sans-serif", 'weight': "bold"}
+
+# Archetype detection only reads the fixed archetype definitions, so the shared default detector
+# (and one key trait lookup built from it on first use) serves every engine
+@lru_cache(maxsize=None)
+def _archetype_key_traits() -> MappingProxyType:
+    """Key traits of each archetype by archetype name"""
+    return MappingProxyType({
+        arch.name: arch.key_traits for arch in get_default_detector().archetypes.values()
+    })
+
+# Background bands of the top trait (pink) and growth opportunity (amber) gauges
+TOP_GAUGE_STEPS = (
+    {'range': [0, 20], 'color': "#FEF2F2"},
+    {'range': [20, 40], 'color': "#FED7D7"},
+    {'range': [40, 60], 'color': "#FBB6CE"},
+    {'range': [60, 80], 'color': "#F687B3"},
+    {'range': [80, 100], 'color': "#ED64A6"}
+)
+GROWTH_GAUGE_STEPS = (
+    {'range': [0, 20], 'color': "#FFF8E1"},
+    {'range': [20, 40], 'color': "#FFECB3"},
+    {'range': [40, 60], 'color': "#FFE082"},
+    {'range': [60, 80], 'color': "#FFD54F"},
+    {'range': [80, 100], 'color': "#FFC107"}
+)
+
+# Shared domains and layout of the top trait and growth opportunity gauges; the 3 gauges
+# sit side by side as in a 1x3 make_subplots grid (horizontal spacing 0.2 / 3)
+_GAUGE_SPACING = 0.2 / 3
+_GAUGE_WIDTH = (1 - 2 * _GAUGE_SPACING) / 3
+_GAUGE_DOMAINS = tuple(
+    {'x': [c * (_GAUGE_WIDTH + _GAUGE_SPACING), c * (_GAUGE_WIDTH + _GAUGE_SPACING) + _GAUGE_WIDTH], 'y': [0, 1]}
+    for c in range(3)
+)
+_GAUGE_LAYOUT = MappingProxyType({
+    'height': 300,
+    'width': 800,
+    'paper_bgcolor': "white",
+    'plot_bgcolor': "white",
+    'margin': {'l': 20, 'r': 20, 't': 40, 'b': 20}
+})
+
 class VisualizationEngine:
     """
     Generates all visualizations for the Victoria assessment report
@@ -57,75 +199,124 @@ class VisualizationEngine:
             'DA': 'Drive and Ambition',
             'RT': 'Risk-Taking'
         }
+        
+        # Archetype correlations and key traits are generic (not personal): every engine shares
+        # the default detector and key trait lookup, and builds the heatmap matrix and its
+        # cell labels once
+        self._detector = get_default_detector()
+        self._corr_matrix, self._corr_text = self._build_correlation_matrix()
+        self._archetype_key_traits = _archetype_key_traits()
+        self._heatmap_annotations = self._build_heatmap_annotations()
+        self._keytrait_shapes = self._build_keytrait_shapes()
+        
+        # The radar, bar and gauge charts depend only on trait_scores, so re-rendering the
+        # same scores (previews, regenerated reports) reuses the finished HTML
+        self._chart_cache = lru_cache(maxsize=CHART_CACHE_SIZE)(self._render_cached_chart)
+        self._heatmap_cache = lru_cache(maxsize=CHART_CACHE_SIZE)(self._render_archetype_heatmap)
+    
+    def _build_heatmap_annotations(self) -> List[Dict[str, Any]]:
+        """One value label per heatmap cell, all sharing HEATMAP_ANNOTATION_FONT"""
+        rows, cols = np.indices(self._corr_matrix.shape)
+        labels = [text for text_row in self._corr_text for text in text_row]
+        return [
+            dict(x=j, y=i, text=text, showarrow=False, font=HEATMAP_ANNOTATION_FONT, xref="x", yref="y")
+            for i, j, text in zip(rows.ravel().tolist(), cols.ravel().tolist(), labels)
+        ]
+    
+    def _build_keytrait_shapes(self) -> List[Dict[str, Any]]:
+        """Orange borders around the cells of each archetype's key traits"""
+        shapes = []
+        for i, (archetype_full, _) in enumerate(HEATMAP_ARCHETYPE_ORDER):
+            key_traits = self._archetype_key_traits.get(archetype_full, ())
+            logger.debug("Adding borders for archetype: %s, Key traits: %s", archetype_full, key_traits)
+            
+            for j, trait_display_name in enumerate(HEATMAP_TRAIT_DISPLAY_NAMES):
+                # Check if THIS SPECIFIC display name maps to a key trait for THIS archetype
+                mapped_trait_name = HEATMAP_TO_ARCHETYPE_TRAIT.get(trait_display_name, trait_display_name)
+                
+                if mapped_trait_name in key_traits:
+                    shapes.append(dict(
+                        type="rect",
+                        x0=j-0.5, x1=j+0.5,
+                        y0=i-0.5, y1=i+0.5,
+                        line=dict(color="#FF6B35", width=3),
+                        fillcolor="rgba(0,0,0,0)",
+                        layer="above"
+                    ))
+        return shapes
+    
+    def _build_correlation_matrix(self) -> Tuple[np.ndarray, List[List[str]]]:
+        """Correlation scores in heatmap row order (padded or cut to 17 traits) and their 2-decimal labels"""
+        correlation_data = self._detector.get_archetype_correlation_data()
+        matrix = np.zeros((len(HEATMAP_ARCHETYPE_ORDER), HEATMAP_TRAIT_COUNT))
+        for row, (full_name, _) in enumerate(HEATMAP_ARCHETYPE_ORDER):
+            correlation_scores = correlation_data.get(full_name, [])[:HEATMAP_TRAIT_COUNT]
+            matrix[row, :len(correlation_scores)] = correlation_scores
+        text = np.char.mod('%.2f', matrix).tolist()
+        return matrix, text
+    
+    def _fig_to_div(self, fig: go.Figure, div_id: str, config: Optional[Dict[str, Any]] = None) -> str:
+        """Embed a figure as a sized div plus one Plotly.newPlot call (plotly.js is loaded once by the report template)"""
+        # The figure was validated as it was built, so serialization skips a second validation pass
+        figure_json = pio.to_json(fig, validate=False, pretty=False)
+        config_json = json.dumps({'responsive': True} if config is None else config)
+        height = f"{fig.layout.height}px" if fig.layout.height else "100%"
+        width = f"{fig.layout.width}px" if fig.layout.width else "100%"
+        return (
+            f'<div style="height:{height}; width:{width};">'
+            f'<div id="{div_id}" class="plotly-graph-div" style="height:100%; width:100%;"></div>'
+            f'<script>(function () {{ if (document.getElementById("{div_id}")) {{'
+            f'var figure = {figure_json}; Plotly.newPlot("{div_id}", figure.data, figure.layout, {config_json});'
+            f'}} }})();</script></div>'
+        )
+    
+    def _render_cached_chart(self, render_name: str, scores_key: Tuple[Tuple[str, float], ...]) -> str:
+        """Render a score-driven chart from its cache key"""
+        return getattr(self, render_name)(dict(scores_key))
+    
+    def _cached_chart(self, render: Callable[[Dict[str, float]], str], trait_scores: Dict[str, float]) -> str:
+        """Return the chart HTML for these trait scores, rendering it only on a cache miss"""
+        # Key on the scores in their given order, which is the order the charts use for ties
+        scores_key = tuple(trait_scores.items())
+        try:
+            return self._chart_cache(render.__name__, scores_key)
+        except TypeError:
+            # Unhashable score values cannot be cached
+            return render(trait_scores)
+    
+    def _scores_array(self, trait_scores: Dict[str, float], exclude: Tuple[str, ...] = ()) -> Tuple[np.ndarray, np.ndarray]:
+        """Trait codes and their scores as aligned arrays, in trait_scores order, leaving out the excluded codes"""
+        codes = np.array([trait for trait in trait_scores if trait not in exclude], dtype=object)
+        scores = np.fromiter(
+            (trait_scores[trait] for trait in codes), dtype=np.float64, count=len(codes)
+        )
+        return codes, scores
+    
+    def _smallest(self, keys: np.ndarray, k: int) -> np.ndarray:
+        """Indices of the k smallest keys in ascending order, tied keys in their original order (like heapq)"""
+        return np.argsort(keys, kind='stable')[:k]
+    
+    def _pick_top_bottom(self, scores: np.ndarray, k: int = 3) -> Tuple[np.ndarray, np.ndarray]:
+        """Indices of the k highest scores and of the k lowest among the rest (or overall, if fewer than k remain)"""
+        top = self._smallest(-scores, k)
+        rest = np.ones(scores.size, dtype=bool)
+        rest[top] = False
+        if rest.sum() < k:
+            return top, self._smallest(scores, k)
+        return top, self._smallest(np.where(rest, scores, np.inf), k)
     
     def create_archetype_heatmap(self, profile_data: Dict[str, Any]) -> str:
         """Create archetype-trait heatmap showing correlation scores"""
         try:
-            # Define trait names in exact order (matching the heatmap)
-            trait_names = [
-                'Social Orientation',  # IN - Always include first
-                'Resilience & Grit', 'Servant Leadership', 'Emotional Intelligence',
-                'Decision-Making', 'Problem-Solving', 'Drive & Ambition',
-                'Innovation Orientation', 'Adaptability', 'Critical Thinking',
-                'Team Building', 'Risk Taking', 'Accountability',
-                'Relationship-Building', 'Negotiation', 'Conflict Resolution', 'Approach to Failure'
-            ]
-            
-            # Shorter display names for x-axis labels to prevent truncation
-            trait_display_names = [
-                'Social Orientation',
-                'Resilience & Grit', 'Servant Leadership', 'Emotional Intel.',
-                'Decision-Making', 'Problem-Solving', 'Drive & Ambition',
-                'Innovation Orient.', 'Adaptability', 'Critical Thinking',
-                'Team Building', 'Risk Taking', 'Accountability',
-                'Relationship-Bldg', 'Negotiation', 'Conflict Resol.', 'Approach to Failure'
-            ]
-            
-            # Mapping from heatmap trait names to archetype trait names (for key trait detection)
-            heatmap_to_archetype_mapping = {
-                'Social Orientation': 'Social Orientation',
-                'Resilience & Grit': 'Resilience and Grit',
-                'Servant Leadership': 'Servant Leadership',
-                'Emotional Intel.': 'Emotional Intelligence',
-                'Decision-Making': 'Decision Making',
-                'Problem-Solving': 'Problem Solving',
-                'Drive & Ambition': 'Drive and Ambition',
-                'Innovation Orient.': 'Innovation Orientation',
-                'Adaptability': 'Adaptability',
-                'Critical Thinking': 'Critical Thinking',
-                'Team Building': 'Team Building',
-                'Risk Taking': 'Risk Taking',
-                'Accountability': 'Accountability',
-                'Relationship-Bldg': 'Relationship-Building',
-                'Negotiation': 'Negotiation',
-                'Conflict Resol.': 'Conflict Resolution',
-                'Approach to Failure': 'Approach to Failure'
-            }
-            
-            # Get archetype correlation data (PURE CORRELATIONS - NO PERSONAL DATA)
-            from victoria.core.archetype_detector import ArchetypeDetector
-            detector = ArchetypeDetector()
-            correlation_data = detector.get_archetype_correlation_data()
-            
             # Get archetype match scores for display
             trait_scores = profile_data.get('trait_scores', {})
-            archetype_result = detector.detect_archetype(trait_scores)
+            archetype_result = self._detector.detect_archetype(trait_scores)
             all_match_scores = archetype_result.get('all_scores', {})
             
             # Define archetypes in exact order with line breaks and MATCH SCORES
             archetypes = []
-            archetype_display_to_full = {}
-            
-            # Order items exactly for visualization
-            arch_order = [
-                ('Adaptive Intelligence', 'Adaptive<br>Intelligence'),
-                ('Ambitious Drive', 'Ambitious Drive'),
-                ('Collaborative Responsibility', 'Collaborative<br>Responsibility'),
-                ('Resilient Leadership', 'Resilient<br>Leadership'),
-                ('Strategic Innovation', 'Strategic<br>Innovation')
-            ]
             
-            for full_name, display_base in arch_order:
+            for full_name, display_base in HEATMAP_ARCHETYPE_ORDER:
                 # Find matching ID (keys in all_match_scores are like 'adaptive_intelligence')
                 arch_id = full_name.lower().replace(' ', '_')
                 match_val = all_match_scores.get(arch_id, 0.0)
@@ -133,231 +324,164 @@ class VisualizationEngine:
                 
                 display_name = f"{display_base}<br>({match_pct}% Match)"
                 archetypes.append(display_name)
-                archetype_display_to_full[display_name] = full_name
-            
-            # Create trait score matrix and text matrix using ONLY correlation data
-            trait_score_matrix = []
-            text_matrix = []
-            
-            for archetype_display in archetypes:
-                # Map display name to full name for correlation data lookup
-                archetype_full = archetype_display_to_full.get(archetype_display, archetype_display)
-                
-                # Get correlation scores for this archetype (ALWAYS use correlations)
-                correlation_scores = correlation_data.get(archetype_full, [0.0] * 17)
-                
-                # Ensure we have exactly 17 values
-                if len(correlation_scores) < 17:
-                    correlation_scores.extend([0.0] * (17 - len(correlation_scores)))
-                elif len(correlation_scores) > 17:
-                    correlation_scores = correlation_scores[:17]
-                
-                # Build score and text rows
-                score_row = []
-                text_row = []
-                
-                for i, trait_name in enumerate(trait_names):
-                    score = correlation_scores[i] if i < len(correlation_scores) else 0.0
-                    score_row.append(score)
-                    text_row.append(f"{score:.2f}")
-                
-                trait_score_matrix.append(score_row)
-                text_matrix.append(text_row)
-            
-            # Log the matrix for debugging
-            logger.info(f"Heatmap using PURE CORRELATION DATA (no personal scores)")
-            logger.info(f"Text matrix: {text_matrix}")
-            logger.info(f"Trait names: {trait_names}")
-            logger.info(f"Archetypes: {archetypes}")
-            
-            # Create compact heatmap with smaller cells and borders
-            heatmap_data = go.Heatmap(
-                z=trait_score_matrix,
-                x=trait_display_names,
-                y=archetypes,
-                text=text_matrix,
-                texttemplate="%{text}",
-                textfont={"color": "black", "size": 11, "family": "Arial, sans-serif", "weight": "bold"},
-                hovertext=text_matrix,
-                hoverinfo="text",
-                colorscale=[
-                    [0.0, '#FFFFFF'], [0.2, '#E6F3FF'], [0.4, '#CCE7FF'],
-                    [0.6, '#99CFFF'], [0.8, '#66B7FF'], [1.0, '#339FFF']
-                ],
-                zmin=0,
-                zmax=1,
-                showscale=True,
-                colorbar=dict(
-                    title=dict(text="Correlation<br>Score", font=dict(size=9)),
-                    tickmode="array",
-                    tickvals=[0, 0.2, 0.4, 0.6, 0.8, 1.0],
-                    ticktext=["Low", "Low-Med", "Medium", "High", "Very High", "Perfect"],
-                    len=0.6, thickness=15, x=0.78, xpad=3,
-                    tickfont=dict(size=7)
-                ),
-                hovertemplate="<b>%{y}</b><br>%{x}<br>Correlation: %{z:.2f}<br><extra></extra>",
-                xgap=0.5,
-                ygap=0.5
-            )
-            
-            fig = go.Figure(data=heatmap_data)
-            
-            # Add annotations for each cell
-            annotations = []
-            for i, archetype in enumerate(archetypes):
-                for j, trait in enumerate(trait_display_names):
-                    annotations.append(
-                        dict(
-                            x=j, y=i,
-                            text=text_matrix[i][j],
-                            showarrow=False,
-                            font=dict(color="black", size=11, family="Arial, sans-serif", weight="bold"),
-                            xref="x", yref="y"
-                        )
-                    )
             
-            # Improved Border Drawing Logic (Ensures 100% accuracy)
-            for i, archetype_display in enumerate(archetypes):
-                archetype_full = archetype_display_to_full.get(archetype_display, archetype_display)
-                # Find the archetype object to get the latest key traits
-                arch_id = archetype_full.lower().replace(' ', '_')
-                arch_obj = detector.archetypes.get(arch_id)
-                key_traits = arch_obj.key_traits if arch_obj else []
-                
-                logger.info(f"Adding borders for archetype: {archetype_full}, Key traits: {key_traits}")
-                
-                for j, trait_display_name in enumerate(trait_display_names):
-                    # Check if THIS SPECIFIC display name maps to a key trait for THIS archetype
-                    mapped_trait_name = heatmap_to_archetype_mapping.get(trait_display_name, trait_display_name)
-                    
-                    if mapped_trait_name in key_traits:
-                        logger.info(f"  Highlighting cell: {archetype_full} -> {trait_display_name} (mapped as {mapped_trait_name})")
-                        # Add orange border for key traits
-                        fig.add_shape(
-                            type="rect",
-                            x0=j-0.5, x1=j+0.5,
-                            y0=i-0.5, y1=i+0.5,
-                            line=dict(color="#FF6B35", width=3),
-                            fillcolor="rgba(0,0,0,0)",
-                            layer="above"
-                        )
-            
-            # Add highlighting for detected archetype row
+            # The figure only depends on the detected archetype and the match labels, so a
+            # repeated combination reuses the rendered HTML
             detected_archetype = profile_data.get('archetype_name', 'Resilient Leadership')
-            detected_display = None
-            for display_name, full_name in archetype_display_to_full.items():
-                if full_name == detected_archetype:
-                    detected_display = display_name
-                    break
+            return self._heatmap_cache(detected_archetype, tuple(archetypes))
             
-            if detected_display and detected_display in archetypes:
-                detected_index = archetypes.index(detected_display)
-                
-                # Add subtle gold background for detected archetype row
-                fig.add_shape(
+        except Exception as e:
+            import traceback
+            error_trace = traceback.format_exc()
+            logger.error(f"Error creating archetype heatmap: {e}")
+            logger.error(f"Traceback: {error_trace}")
+            return f'<div>Correlation heatmap unavailable: {str(e)}</div>'
+    
+    def _render_archetype_heatmap(self, detected_archetype: str, archetypes: Tuple[str, ...]) -> str:
+        """Build the heatmap HTML for a detected archetype and archetype row labels (uncached)"""
+        # Score and text matrices use ONLY the precomputed correlation data (PURE CORRELATIONS -
+        # NO PERSONAL DATA); Plotly gets plain lists, which every plotly.js bundle can read
+        trait_score_matrix = self._corr_matrix.tolist()
+        text_matrix = self._corr_text
+        
+        # Log the matrix for debugging
+        logger.debug("Heatmap using PURE CORRELATION DATA (no personal scores)")
+        logger.debug("Text matrix: %s", text_matrix)
+        logger.debug("Trait names: %s", HEATMAP_TRAIT_NAMES)
+        logger.debug("Archetypes: %s", archetypes)
+        
+        # Create compact heatmap with smaller cells and borders
+        heatmap_data = dict(
+            type="heatmap",
+            z=trait_score_matrix,
+            x=HEATMAP_TRAIT_DISPLAY_NAMES,
+            y=archetypes,
+            # Cell values are drawn once, by the layout annotations: the report's plotly-latest
+            # bundle (plotly.js 1.x) ignores heatmap texttemplate, and on newer bundles it
+            # would draw every value a second time
+            text=text_matrix,
+            hovertext=text_matrix,
+            hoverinfo="text",
+            colorscale=HEATMAP_COLORSCALE,
+            zmin=0,
+            zmax=1,
+            showscale=True,
+            colorbar=dict(HEATMAP_COLORBAR),
+            hovertemplate="<b>%{y}</b><br>%{x}<br>Correlation: %{z:.2f}<br><extra></extra>",
+            xgap=0.5,
+            ygap=0.5
+        )
+        
+        # Orange borders for key traits (precomputed; they do not depend on the profile)
+        shapes = list(self._keytrait_shapes)
+        
+        # Add highlighting for detected archetype row
+        detected_index = HEATMAP_ARCHETYPE_INDEX.get(detected_archetype)
+        
+        if detected_index is not None:
+            shapes.extend([
+                # Subtle gold background for detected archetype row
+                dict(
                     type="rect",
-                    x0=-0.5, x1=len(trait_display_names) - 0.5,
+                    x0=-0.5, x1=len(HEATMAP_TRAIT_DISPLAY_NAMES) - 0.5,
                     y0=detected_index - 0.5, y1=detected_index + 0.5,
                     fillcolor="rgba(255, 215, 0, 0.15)",
                     line=dict(width=0),
                     layer="below"
-                )
-                
-                # Add thick dark border around detected archetype row
-                fig.add_shape(
+                ),
+                # Thick dark border around detected archetype row
+                dict(
                     type="rect",
-                    x0=-0.5, x1=len(trait_display_names) - 0.5,
+                    x0=-0.5, x1=len(HEATMAP_TRAIT_DISPLAY_NAMES) - 0.5,
                     y0=detected_index - 0.5, y1=detected_index + 0.5,
                     line=dict(color="#570F27", width=5),
                     fillcolor="rgba(0,0,0,0)",
                     layer="above"
                 )
-            
-            # Update layout with improved title
-            fig.update_layout(
-                title=dict(
-                    text=f"Archetype-Trait Correlation Matrix<br><sub style='font-size: 9px; line-height: 1.3;'>Shows how strongly each trait correlates with each archetype pattern (generic, not personalized)<br>Your Archetype: {detected_archetype} (Dark Border) | ★ = Key Traits | See bar chart below for YOUR personal trait scores</sub>",
-                    font=dict(size=13, color="#2c3e50", family="Arial, sans-serif"),
-                    x=0.4,
-                    xanchor='center',
-                    y=1.0,
-                    yref='paper',
-                    pad=dict(t=0, b=20)
-                ),
-                xaxis=dict(
-                    title="Personality Traits", 
-                    tickfont=dict(size=8, weight='bold', family="Arial, sans-serif"),
-                    title_font=dict(size=10, weight='bold', family="Arial, sans-serif"),
-                    tickangle=-60,
-                    tickmode='linear',
-                    dtick=1,
-                    side='bottom',
-                    showgrid=False,
-                    zeroline=False,
-                    automargin=True,
-                    ticklabeloverflow='allow',
-                    ticklabelposition='outside',
-                    anchor='free',
-                    position=0.0
-                ),
-                yaxis=dict(
-                    title="Entrepreneurial Archetypes", 
-                    tickfont=dict(size=9, weight='bold', family="Arial, sans-serif"),
-                    title_font=dict(size=10, weight='bold', family="Arial, sans-serif"),
-                    showgrid=False,
-                    zeroline=False,
-                    domain=[0.0, 0.85],
-                    tickmode='array',
-                    tickvals=list(range(len(archetypes))),
-                    ticktext=archetypes
-                ),
-                font=dict(family="Arial, sans-serif"),
-                margin=dict(l=40, r=70, t=80, b=100),  # Increased top margin for longer subtitle
-                height=480, width=1100,
-                paper_bgcolor="#FEFEFE", plot_bgcolor="#D0D0D0",
-                autosize=True,
-                annotations=annotations,
-                bargap=0,
-                bargroupgap=0
-            )
-            
-            fig.update_xaxes(domain=[0, 0.75])
-            
-            config = {
-                'responsive': True,
-                'displayModeBar': False,
-                'staticPlot': False,
-                'autosizable': True
-            }
-            
-            return fig.to_html(include_plotlyjs=False, div_id="archetype-heatmap", full_html=False, config=config)
-            
-        except Exception as e:
-            import traceback
-            error_trace = traceback.format_exc()
-            logger.error(f"Error creating archetype heatmap: {e}")
-            logger.error(f"Traceback: {error_trace}")
-            return f'<div>Correlation heatmap unavailable: {str(e)}</div>'
+            ])
+        
+        # Build the figure with its full layout (improved title) in one pass
+        fig = go.Figure(data=[heatmap_data], layout=dict(
+            title=dict(
+                text=f"Archetype-Trait Correlation Matrix<br><sub style='font-size: 9px; line-height: 1.3;'>Shows how strongly each trait correlates with each archetype pattern (generic, not personalized)<br>Your Archetype: {detected_archetype} (Dark Border) | ★ = Key Traits | See bar chart below for YOUR personal trait scores</sub>",
+                font=dict(size=13, color="#2c3e50", family="Arial, sans-serif"),
+                x=0.4,
+                xanchor='center',
+                y=1.0,
+                yref='paper',
+                pad=dict(t=0, b=20)
+            ),
+            xaxis=dict(
+                title="Personality Traits", 
+                tickfont=dict(size=8, weight='bold', family="Arial, sans-serif"),
+                title_font=dict(size=10, weight='bold', family="Arial, sans-serif"),
+                tickangle=-60,
+                tickmode='linear',
+                dtick=1,
+                side='bottom',
+                showgrid=False,
+                zeroline=False,
+                automargin=True,
+                ticklabeloverflow='allow',
+                ticklabelposition='outside',
+                anchor='free',
+                position=0.0,
+                domain=[0, 0.75]
+            ),
+            yaxis=dict(
+                title="Entrepreneurial Archetypes", 
+                tickfont=dict(size=9, weight='bold', family="Arial, sans-serif"),
+                title_font=dict(size=10, weight='bold', family="Arial, sans-serif"),
+                showgrid=False,
+                zeroline=False,
+                domain=[0.0, 0.85],
+                tickmode='array',
+                tickvals=list(range(len(archetypes))),
+                ticktext=archetypes
+            ),
+            font=dict(family="Arial, sans-serif"),
+            margin=dict(l=40, r=70, t=80, b=100),  # Increased top margin for longer subtitle
+            height=480, width=1100,
+            paper_bgcolor="#FEFEFE", plot_bgcolor="#D0D0D0",
+            autosize=True,
+            annotations=self._heatmap_annotations,
+            shapes=shapes,
+            bargap=0,
+            bargroupgap=0
+        ))
+        
+        config = {
+            'responsive': True,
+            'displayModeBar': False,
+            'staticPlot': False,
+            'autosizable': True
+        }
+        
+        return self._fig_to_div(fig, "archetype-heatmap", config)
     
     def create_trait_radar_chart(self, trait_scores: Dict[str, float]) -> str:
         """Create radar chart for trait scores"""
+        return self._cached_chart(self._render_trait_radar_chart, trait_scores)
+    
+    def _render_trait_radar_chart(self, trait_scores: Dict[str, float]) -> str:
+        """Build the radar chart HTML (uncached)"""
         try:
             # Prepare data
             categories = [self.trait_descriptions.get(trait, trait) for trait in self.trait_names]
-            values = [trait_scores.get(trait, 0) for trait in self.trait_names]
-            
-            fig = go.Figure()
+            values = np.fromiter(
+                (trait_scores.get(trait, 0) for trait in self.trait_names),
+                dtype=np.float64, count=len(self.trait_names)
+            ).tolist()
             
-            fig.add_trace(go.Scatterpolar(
+            fig = go.Figure(data=[dict(
+                type='scatterpolar',
                 r=values,
                 theta=categories,
                 fill='toself',
                 name='Trait Scores',
-                line_color=self.colors['primary'],
+                line=dict(color=self.colors['primary']),
                 fillcolor=f"rgba(87, 15, 39, 0.3)"
-            ))
-            
-            fig.update_layout(
+            )], layout=dict(
                 polar=dict(
                     radialaxis=dict(
                         visible=True,
@@ -381,9 +505,9 @@ class VisualizationEngine:
                         xanchor="left"
                     )
                 ]
-            )
+            ))
             
-            return fig.to_html(include_plotlyjs=False, div_id="trait-radar", full_html=False)
+            return self._fig_to_div(fig, "trait-radar")
             
         except Exception as e:
             logger.error(f"Error creating radar chart: {e}")
@@ -391,26 +515,26 @@ class VisualizationEngine:
     
     def create_trait_bar_chart(self, trait_scores: Dict[str, float]) -> str:
         """Create bar chart for trait scores"""
+        return self._cached_chart(self._render_trait_bar_chart, trait_scores)
+    
+    def _render_trait_bar_chart(self, trait_scores: Dict[str, float]) -> str:
+        """Build the bar chart HTML (uncached)"""
         try:
-            # Sort traits by score
-            sorted_traits = sorted(trait_scores.items(), key=lambda x: x[1], reverse=True)
-            traits, scores = zip(*sorted_traits)
+            # Sort traits by score (stable, so ties keep their input order)
+            codes, scores_arr = self._scores_array(trait_scores)
+            if not len(codes):
+                raise ValueError("no trait scores to chart")
+            order = np.argsort(-scores_arr, kind='stable')
+            sorted_scores = scores_arr[order]
+            traits = codes[order].tolist()
+            scores = sorted_scores.tolist()
             
             # Debug: Print all traits being processed
-            logger.info(f"Bar chart processing {len(traits)} traits: {list(traits)}")
-            logger.info(f"Trait scores: {dict(zip(traits, scores))}")
+            logger.debug("Bar chart processing %d traits: %s", len(traits), traits)
+            logger.debug("Trait scores: %s", scores)
             
             # Define colors based on score levels
-            def get_score_color(score):
-                if score >= 0.70:  # Adjusted threshold for green
-                    return '#2E8B57'  # High scores - Green
-                elif score >= 0.50:  # Adjusted threshold for orange
-                    return '#FFA500'  # Medium scores - Orange
-                else:
-                    return '#DC143C'  # Low scores - Red
-            
-            # Create color array
-            colors = [get_score_color(score) for score in scores]
+            colors = [SCORE_LEVEL_COLORS[level] for level in _score_levels(sorted_scores)]
             
             # Ensure all traits are included with proper names
             trait_labels = []
@@ -421,42 +545,8 @@ class VisualizationEngine:
                     trait_labels.append(trait)  # Fallback to trait code if not found
                     logger.warning(f"Trait {trait} not found in trait_descriptions")
             
-            # Debug: Print final trait labels
-            logger.info(f"Final trait labels for bar chart: {len(trait_labels)} traits")
-            logger.info(f"Trait labels: {trait_labels}")
-            
-            # Debug: Print data being passed to Plotly
-            logger.info(f"Plotly data - x (scores): {len(list(scores))} values")
-            logger.info(f"Plotly data - y (labels): {len(trait_labels)} values")
-            logger.info(f"Plotly data - colors: {len(colors)} values")
-            
-            # Create bar chart
-            fig = go.Figure(data=[
-                go.Bar(
-                    x=list(scores),
-                    y=trait_labels,
-                    orientation='h',
-                    marker_color=colors,
-                    text=[f"{score:.2f}" for score in scores],
-                    textposition='inside',
-                    textfont=dict(color='white', size=11, weight='bold')
-                )
-            ])
-            
-            # Add legend annotations
-            fig.add_annotation(
-                x=0.98, y=0.98,
-                xref="paper", yref="paper",
-                text="<b>Score Levels:</b><br><span style='color:#2E8B57'>●</span> High (≥0.70)<br><span style='color:#FFA500'>●</span> Medium (0.50-0.70)<br><span style='color:#DC143C'>●</span> Low (<0.50)",
-                showarrow=False,
-                align="right",
-                bgcolor="rgba(255,255,255,0.9)",
-                bordercolor="gray",
-                borderwidth=1,
-                font=dict(size=11),
-                xanchor="right",
-                yanchor="top"
-            )
+            # Debug: Print final trait labels (scores, labels and colors all have one entry per trait)
+            logger.debug("Trait labels: %s", trait_labels)
             
             # Calculate dynamic height based on number of traits
             num_traits = len(traits)
@@ -464,78 +554,100 @@ class VisualizationEngine:
             min_height = 400  # Further reduced minimum height
             calculated_height = max(min_height, num_traits * bar_height + 100)
             
-            fig.update_layout(
+            # Create bar chart with its legend annotation and layout
+            fig = go.Figure(data=[dict(
+                type='bar',
+                x=scores,
+                y=trait_labels,
+                orientation='h',
+                marker=dict(color=colors),
+                text=np.char.mod('%.2f', sorted_scores).tolist(),
+                textposition='inside',
+                textfont=dict(color='white', size=11, weight='bold')
+            )], layout=dict(
                 title="Trait Scores Ranking",
-                xaxis_title="Score",
-                yaxis_title="Traits",
+                xaxis=dict(title="Score"),
+                yaxis=dict(title="Traits"),
                 font=dict(family="Arial, sans-serif"),
                 height=calculated_height,
                 width=900,
                 margin=dict(l=180, r=60, t=40, b=40),  # Further reduced margins
-                showlegend=False
-            )
+                showlegend=False,
+                # Legend annotation for the score levels
+                annotations=[dict(
+                    x=0.98, y=0.98,
+                    xref="paper", yref="paper",
+                    text="<b>Score Levels:</b><br><span style='color:#2E8B57'>●</span> High (≥0.70)<br><span style='color:#FFA500'>●</span> Medium (0.50-0.70)<br><span style='color:#DC143C'>●</span> Low (<0.50)",
+                    showarrow=False,
+                    align="right",
+                    bgcolor="rgba(255,255,255,0.9)",
+                    bordercolor="gray",
+                    borderwidth=1,
+                    font=dict(size=11),
+                    xanchor="right",
+                    yanchor="top"
+                )]
+            ))
             
-            return fig.to_html(include_plotlyjs=False, div_id="trait-bars", full_html=False)
+            return self._fig_to_div(fig, "trait-bars")
             
         except Exception as e:
             logger.error(f"Error creating bar chart: {e}")
             return '<div>Bar chart unavailable</div>'
     
+    def _build_gauge_figure(self, items: List[Tuple[str, float]], bar_color: str,
+                            step_palette: Tuple[Dict[str, Any], ...], threshold_color: str,
+                            **layout: Any) -> go.Figure:
+        """Build a row of up to 3 trait gauges, extra layout keys override _GAUGE_LAYOUT"""
+        traces = []
+        for domain, (trait, score) in zip(_GAUGE_DOMAINS, items):
+            trait_name = self.trait_descriptions.get(trait, trait)
+            percentage = round(score * 100, 1)
+            
+            traces.append(dict(
+                type="indicator",
+                mode="gauge+number",
+                value=percentage,
+                domain=domain,
+                title={'text': trait_name, 'font': {'size': 10}},
+                gauge={
+                    'axis': {'range': [None, 100], 'tickwidth': 2, 'tickcolor': "#2D3748"},
+                    'bar': {'color': bar_color},
+                    'bgcolor': "white",
+                    'borderwidth': 3,
+                    'bordercolor': "#E2E8F0",
+                    'steps': step_palette,
+                    'threshold': {
+                        'line': {'color': threshold_color, 'width': 4},
+                        'thickness': 0.8,
+                        'value': 90
+                    }
+                },
+                number={'font': {'size': 16, 'color': '#570F27'}, 'suffix': '%'}
+            ))
+        
+        return go.Figure(data=traces, layout={**_GAUGE_LAYOUT, **layout})
+    
     def create_top_trait_gauges(self, trait_scores: Dict[str, float]) -> str:
         """Create gauges for top 3 traits"""
+        return self._cached_chart(self._render_top_trait_gauges, trait_scores)
+    
+    def _render_top_trait_gauges(self, trait_scores: Dict[str, float]) -> str:
+        """Build the top trait gauges HTML (uncached)"""
         try:
             # Filter out IN (Social Orientation) from trait scores
-            filtered_scores = {k: v for k, v in trait_scores.items() if k != 'IN'}
+            codes, scores = self._scores_array(trait_scores, exclude=('IN',))
             # Get top 3 traits (excluding IN)
-            sorted_traits = sorted(filtered_scores.items(), key=lambda x: x[1], reverse=True)[:3]
-            
-            fig = make_subplots(
-                rows=1, cols=3,
-                specs=[[{"type": "indicator"}, {"type": "indicator"}, {"type": "indicator"}]]
-            )
-            
-            for i, (trait, score) in enumerate(sorted_traits, 1):
-                trait_name = self.trait_descriptions.get(trait, trait)
-                percentage = round(score * 100, 1)
-                
-                fig.add_trace(go.Indicator(
-                    mode="gauge+number",
-                    value=percentage,
-                    domain={'x': [0, 1], 'y': [0, 1]},
-                    title={'text': trait_name, 'font': {'size': 10}},
-                    gauge={
-                        'axis': {'range': [None, 100], 'tickwidth': 2, 'tickcolor': "#2D3748"},
-                        'bar': {'color': "#570F27"},
-                        'bgcolor': "white",
-                        'borderwidth': 3,
-                        'bordercolor': "#E2E8F0",
-                        'steps': [
-                            {'range': [0, 20], 'color': "#FEF2F2"},
-                            {'range': [20, 40], 'color': "#FED7D7"},
-                            {'range': [40, 60], 'color': "#FBB6CE"},
-                            {'range': [60, 80], 'color': "#F687B3"},
-                            {'range': [80, 100], 'color': "#ED64A6"}
-                        ],
-                        'threshold': {
-                            'line': {'color': "#E53E3E", 'width': 4},
-                            'thickness': 0.8,
-                            'value': 90
-                        }
-                    },
-                    number={'font': {'size': 16, 'color': '#570F27'}, 'suffix': '%'}
-                ), row=1, col=i)
+            top, _ = self._pick_top_bottom(scores)
+            sorted_traits = list(zip(codes[top].tolist(), scores[top].tolist()))
             
-            fig.update_layout(
+            fig = self._build_gauge_figure(
+                sorted_traits, "#570F27", TOP_GAUGE_STEPS, "#E53E3E",
                 title="Top 3 Trait Scores",
-                font={'family': "Arial, sans-serif", 'size': 10},  # Added size parameter
-                height=300,
-                width=800,
-                paper_bgcolor="white",
-                plot_bgcolor="white",
-                margin=dict(l=20, r=20, t=40, b=20)
+                font={'family': "Arial, sans-serif", 'size': 10}
             )
             
-            return fig.to_html(include_plotlyjs=False, div_id="trait-gauges", full_html=False)
+            return self._fig_to_div(fig, "trait-gauges")
             
         except Exception as e:
             logger.error(f"Error creating trait gauges: {e}")
@@ -566,85 +678,27 @@ class VisualizationEngine:
     
     def create_growth_opportunities_gauges(self, trait_scores: Dict[str, float]) -> str:
         """Create gauge charts for growth opportunities (bottom 3 traits)"""
+        return self._cached_chart(self._render_growth_opportunities_gauges, trait_scores)
+    
+    def _render_growth_opportunities_gauges(self, trait_scores: Dict[str, float]) -> str:
+        """Build the growth opportunities gauges HTML (uncached)"""
         try:
             # Filter out IN (Social Orientation) from trait scores
-            filtered_scores = {k: v for k, v in trait_scores.items() if k != 'IN'}
-            # Get bottom 3 traits (lowest scores) - exclude top 3 to avoid duplication
-            sorted_traits = sorted(filtered_scores.items(), key=lambda x: x[1])  # Sort lowest to highest
-            # Get the actual bottom 3 traits with lowest scores, but exclude any that are in top 3
-            top_3_traits = sorted(filtered_scores.items(), key=lambda x: x[1], reverse=True)[:3]
-            top_3_codes = [trait[0] for trait in top_3_traits]
-            
-            # Get the bottom 3 traits from the lowest scores, excluding top 3
-            bottom_traits = []
-            for trait, score in sorted_traits:
-                if trait not in top_3_codes:
-                    bottom_traits.append((trait, score))
-                if len(bottom_traits) >= 3:
-                    break
-            
-            # If we don't have 3 traits after filtering, take the actual bottom 3
-            if len(bottom_traits) < 3:
-                bottom_traits = sorted_traits[:3]
-            
-            # Debug logging
-
+            codes, scores = self._scores_array(trait_scores, exclude=('IN',))
+            # Get bottom 3 traits (lowest scores) - exclude top 3 to avoid duplication,
+            # unless that leaves fewer than 3, in which case take the actual bottom 3
+            _, bottom = self._pick_top_bottom(scores)
+            bottom_traits = list(zip(codes[bottom].tolist(), scores[bottom].tolist()))
             
             if not bottom_traits:
                 return '<div>No growth opportunities data available</div>'
             
-            # Create subplots for 3 gauges with smaller size
-            from plotly.subplots import make_subplots
-            fig = make_subplots(
-                rows=1, cols=3,
-                specs=[[{'type': 'indicator'}, {'type': 'indicator'}, {'type': 'indicator'}]]
-            )
-            
-            # Add gauges
-            for i, (trait, score) in enumerate(bottom_traits, 1):
-                trait_name = self.trait_descriptions.get(trait, trait)
-                percentage = round(score * 100, 1)
-                
-                fig.add_trace(
-                    go.Indicator(
-                        mode="gauge+number",
-                        value=percentage,
-                        domain={'x': [0, 1], 'y': [0, 1]},
-                        title={'text': trait_name, 'font': {'size': 10}},
-                        gauge={
-                            'axis': {'range': [None, 100], 'tickwidth': 2, 'tickcolor': "#2D3748"},
-                            'bar': {'color': "#F57F17"},
-                            'bgcolor': "white",
-                            'borderwidth': 3,
-                            'bordercolor': "#E2E8F0",
-                            'steps': [
-                                {'range': [0, 20], 'color': "#FFF8E1"},
-                                {'range': [20, 40], 'color': "#FFECB3"},
-                                {'range': [40, 60], 'color': "#FFE082"},
-                                {'range': [60, 80], 'color': "#FFD54F"},
-                                {'range': [80, 100], 'color': "#FFC107"}
-                            ],
-                            'threshold': {
-                                'line': {'color': "#E65100", 'width': 4},
-                                'thickness': 0.8,
-                                'value': 90
-                            }
-                        },
-                        number={'font': {'size': 16, 'color': '#570F27'}, 'suffix': '%'}
-                    ),
-                    row=1, col=i
-                )
-            
-            fig.update_layout(
-                height=300,
-                width=800,
-                font={'family': "Arial, sans-serif"},
-                paper_bgcolor="white",
-                plot_bgcolor="white",
-                margin=dict(l=20, r=20, t=40, b=20)
+            fig = self._build_gauge_figure(
+                bottom_traits, "#F57F17", GROWTH_GAUGE_STEPS, "#E65100",
+                font={'family': "Arial, sans-serif"}
             )
             
-            return fig.to_html(include_plotlyjs=False, div_id="growth-opportunities-gauges", full_html=False)
+            return self._fig_to_div(fig, "growth-opportunities-gauges")
             
         except Exception as e:
             logger.error(f"Error creating growth opportunities gauges: {e}")
@@ -9,12 +9,82 @@ Uses genuine Rasch measures instead of simple arithmetic mean
 import pandas as pd
 import numpy as np
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from ..mapping.question_trait_mapper import QuestionTraitMapper
 
+# Optional JIT compilation (multi-threaded over persons) for the Rasch trait scoring
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+# Overflow-free logistic function and its inverse; plain NumPy equivalents without SciPy
+try:
+    from scipy.special import expit, logit
+except ImportError:
+    def expit(x):
+        return 0.5 * (1.0 + np.tanh(0.5 * x))
+    
+    def logit(p):
+        return np.log(p) - np.log1p(-p)
+
 logger = logging.getLogger(__name__)
 
 
+# Social Orientation (IN) - Option 2: Weighted Intensity. Questions containing these phrases are
+# introverted traits (reverse keyed) or high-agency extroverted traits (weighted 1.5)
+INTROVERTED_PHRASES = ("drain my energy", "observant", "active listener", "reflect")
+HIGH_AGENCY_PHRASES = ("pitch ideas", "jump into conversations")
+HIGH_AGENCY_WEIGHT = 1.5
+
+
+def _rasch_trait_kernel(response_codes, response_logits, difficulty, has_difficulty, item_weights,
+                        abilities, trait_item_ptr, trait_item_idx):
+    """
+    Rasch trait scores (0-1 scale) of every person from their item responses.
+    
+    Responses are given as codes into response_logits, the logit of each distinct response
+    value (-1 when missing). The items of trait t are
+    trait_item_idx[trait_item_ptr[t]:trait_item_ptr[t + 1]]. Each answered item gives the ability
+    logit(p) + difficulty, or the overall person ability when it has no difficulty; the mean
+    weighted by item_weights is mapped through the (overflow-free) logistic function. Also returns
+    the total weight per person and trait, which is 0 (and the score NaN) when none of the
+    trait's items were answered.
+    """
+    n_persons = response_codes.shape[0]
+    n_traits = trait_item_ptr.shape[0] - 1
+    scores = np.empty((n_persons, n_traits))
+    weight_total = np.zeros((n_persons, n_traits))
+    for i in prange(n_persons):
+        for t in range(n_traits):
+            weighted_sum = 0.0
+            total = 0.0
+            for k in range(trait_item_ptr[t], trait_item_ptr[t + 1]):
+                j = trait_item_idx[k]
+                code = response_codes[i, j]
+                if code < 0:
+                    continue
+                weight = item_weights[j]
+                if has_difficulty[j]:
+                    weighted_sum += (response_logits[code] + difficulty[j]) * weight
+                else:
+                    weighted_sum += abilities[i] * weight
+                total += weight
+            weight_total[i, t] = total
+            if total > 0.0:
+                scores[i, t] = 0.5 * (1.0 + np.tanh(0.5 * weighted_sum / total))
+            else:
+                scores[i, t] = np.nan
+    return scores, weight_total
+
+if njit is not None:
+    # fastmath without the no-NaN/no-Inf assumptions, which the unanswered items would break
+    _rasch_trait_kernel = njit(
+        parallel=True, cache=True, fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+    )(_rasch_trait_kernel)
+
+
 class FixedTraitScorer:
     """
     Calculates trait scores using Rasch measurement
@@ -27,10 +97,50 @@ class FixedTraitScorer:
         self.likert_mapping = self.mapper.get_likert_mapping()
         self.trait_names = self.mapper.get_trait_names()
         
+        # Questions of each trait, looked up from the mapper once
+        self._questions_by_trait = {
+            trait: tuple(self.mapper.get_questions_for_trait(trait)) for trait in self.trait_names
+        }
+        
+        # Mapped questions in a fixed column order, and which of them measure each trait as
+        # CSR rows: the questions of trait t are at the _item_cols positions
+        # _trait_item_idx[_trait_item_ptr[t]:_trait_item_ptr[t + 1]]
+        self._item_cols = list(self.question_mapping)
+        item_position = {question: j for j, question in enumerate(self._item_cols)}
+        self._trait_item_idx = np.array(
+            [item_position[question] for trait in self.trait_names for question in self._questions_by_trait[trait]],
+            dtype=np.int32
+        )
+        self._trait_item_ptr = np.cumsum(
+            [0] + [len(self._questions_by_trait[trait]) for trait in self.trait_names]
+        ).astype(np.int32)
+        # The same membership as a matrix (1.0 at [question, trait] when the question belongs to the trait)
+        self._trait_item_matrix = np.zeros((len(self._item_cols), len(self.trait_names)))
+        for t in range(len(self.trait_names)):
+            self._trait_item_matrix[self._trait_item_idx[self._trait_item_ptr[t]:self._trait_item_ptr[t + 1]], t] = 1.0
+        
+        # Arithmetic mean scoring: a question's value for IN is offset + sign * response, so
+        # introverted questions become 1 - response; _mean_weights is the membership matrix
+        # with the IN column carrying the question weights. Phrase matching happens only here.
+        introverted = np.array(
+            [any(phrase in question for phrase in INTROVERTED_PHRASES) for question in self._item_cols], dtype=bool
+        ).reshape(len(self._item_cols))
+        high_agency = ~introverted & np.array(
+            [any(phrase in question for phrase in HIGH_AGENCY_PHRASES) for question in self._item_cols], dtype=bool
+        ).reshape(len(self._item_cols))
+        self._in_offset = np.where(introverted, 1.0, 0.0)
+        self._in_sign = np.where(introverted, -1.0, 1.0)
+        self._in_weights = np.where(high_agency, HIGH_AGENCY_WEIGHT, 1.0)
+        self._in_index = self.trait_names.index('IN') if 'IN' in self.trait_names else None
+        self._mean_weights = self._trait_item_matrix.copy()
+        if self._in_index is not None:
+            self._mean_weights[:, self._in_index] *= self._in_weights
+        
         # Rasch analysis results (set by set_rasch_results)
         self.rasch_item_difficulties = {}
         self.rasch_person_abilities = {}
         self.use_rasch = False
+        self._align_item_difficulties()
         
         logger.info(f"Initialized FixedTraitScorer with {len(self.trait_names)} traits")
         logger.info(f"Trait names: {', '.join(self.trait_names)}")
@@ -50,8 +160,29 @@ class FixedTraitScorer:
         self.rasch_item_difficulties = item_difficulties
         self.rasch_person_abilities = person_abilities
         self.use_rasch = True
+        self._align_item_difficulties()
         logger.info(f"Rasch results set: {len(item_difficulties)} items, {len(person_abilities)} persons")
     
+    def _align_item_difficulties(self):
+        """
+        Align the Rasch item difficulties to _item_cols once, so scoring only indexes arrays
+        
+        Items without a difficulty get 0 in _item_difficulty and False in _has_item_difficulty;
+        _item_weights is |difficulty| + 1 (1 without a difficulty) and _trait_weights spreads it
+        over the traits of each item
+        """
+        item_difficulties = [self.rasch_item_difficulties.get(question) for question in self._item_cols]
+        self._has_item_difficulty = np.array(
+            [difficulty is not None for difficulty in item_difficulties], dtype=bool
+        ).reshape(len(self._item_cols))
+        self._item_difficulty = np.array(
+            [0.0 if difficulty is None else difficulty for difficulty in item_difficulties], dtype=np.float64
+        ).reshape(len(self._item_cols))
+        
+        # Weight by item difficulty (more difficult items weighted more); add 1 to avoid zero weights
+        self._item_weights = np.where(self._has_item_difficulty, np.abs(self._item_difficulty) + 1.0, 1.0)
+        self._trait_weights = self._trait_item_matrix * self._item_weights[:, None]
+    
     def calculate_trait_scores(
         self, 
         df: pd.DataFrame,
@@ -67,6 +198,30 @@ class FixedTraitScorer:
         Returns:
             Dictionary of person profiles with trait scores
         """
+        trait_scores = self.calculate_trait_score_frame(df, rasch_results)
+        
+        profiles = {}
+        for person_id, scores in zip(trait_scores.index, trait_scores.to_numpy().tolist()):
+            profiles[person_id] = dict(zip(self.trait_names, scores))
+            logger.debug(f"Calculated scores for {person_id}: {len(profiles[person_id])} traits")
+        
+        return profiles
+    
+    def calculate_trait_score_frame(
+        self,
+        df: pd.DataFrame,
+        rasch_results: Optional[Dict[str, Any]] = None
+    ) -> pd.DataFrame:
+        """
+        Calculate trait scores for all persons in the dataframe as one table
+        
+        Args:
+            df: DataFrame with Likert scale responses
+            rasch_results: Optional Rasch analysis results dictionary
+            
+        Returns:
+            DataFrame of trait scores indexed by person ID, with one column per trait
+        """
         logger.info(f"Calculating trait scores for {len(df)} persons")
         
         # Set Rasch results if provided
@@ -76,48 +231,79 @@ class FixedTraitScorer:
             if item_diffs and person_abils:
                 self.set_rasch_results(item_diffs, person_abils)
         
-        profiles = {}
+        person_ids = [f"person_{idx}" for idx in df.index]
+        if self.use_rasch:
+            rasch_rows = np.array([pid in self.rasch_person_abilities for pid in person_ids], dtype=bool)
+        else:
+            rasch_rows = np.zeros(len(person_ids), dtype=bool)
         
-        # Process each person (row)
-        for idx, row in df.iterrows():
-            person_id = f"person_{idx}"
-            person_scores = self._calculate_person_traits(row, person_id)
-            profiles[person_id] = person_scores
-            
-            logger.debug(f"Calculated scores for {person_id}: {len(person_scores)} traits")
+        responses, likert_responses, asked = self._response_matrix(df)
+        # The arithmetic mean takes every response that is not a Likert answer (missing or not
+        # recognised) as neutral
+        mean_values = np.where(likert_responses, responses, 0.5)
+        trait_scores = np.empty((len(person_ids), len(self.trait_names)))
+        
+        # Persons with a Rasch ability are scored all at once from their response matrix
+        if rasch_rows.any():
+            rasch_ids = [pid for pid, use_rasch in zip(person_ids, rasch_rows) if use_rasch]
+            trait_scores[rasch_rows] = self._calculate_traits_from_rasch(
+                responses[rasch_rows], mean_values[rasch_rows], asked, rasch_ids
+            )
+        
+        # Fallback to arithmetic mean (legacy method) for everyone else
+        if not rasch_rows.all():
+            mean_ids = [pid for pid, use_rasch in zip(person_ids, rasch_rows) if not use_rasch]
+            trait_scores[~rasch_rows] = self._calculate_traits_from_mean(mean_values[~rasch_rows], asked, mean_ids)
+        
+        trait_scores = pd.DataFrame(trait_scores, index=person_ids, columns=self.trait_names)
         
         # Log summary statistics
-        self._log_scoring_summary(profiles)
+        self._log_scoring_summary(trait_scores)
         
-        return profiles
+        return trait_scores
     
-    def _calculate_person_traits(self, person_data: pd.Series, person_id: str) -> Dict[str, float]:
+    def _response_matrix(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        Calculate trait scores for a single person using Rasch measures
+        Numeric responses of every person to every mapped question (columns in _item_cols order)
+        
+        Likert strings are mapped to their numeric value and other values are taken as numbers;
+        missing responses and questions absent from the data are NaN
         
         Args:
-            person_data: Person's response data
-            person_id: Person identifier
+            df: DataFrame with Likert scale responses
             
         Returns:
-            Dictionary of trait scores (0-1 scale)
+            Tuple of the (persons, questions) responses, a (persons, questions) mask of the
+            responses given as Likert strings, and a (questions,) mask of the questions in df
         """
-        trait_scores = {}
+        asked = np.array([question in df.columns for question in self._item_cols], dtype=bool)
+        raw = df.reindex(columns=self._item_cols).to_numpy(dtype=object)
         
-        if self.use_rasch and person_id in self.rasch_person_abilities:
-            # Use Rasch measures: aggregate item-level abilities to trait-level
-            trait_scores = self._calculate_traits_from_rasch(person_data, person_id)
-        else:
-            # Fallback to arithmetic mean (legacy method)
-            trait_scores = self._calculate_traits_from_mean(person_data, person_id)
+        # Encode the responses as codes of their distinct values (-1 when missing) so that each
+        # distinct value is converted once; the trailing entries are for the missing responses
+        response_codes, response_values = pd.factorize(raw.ravel())
+        numeric_values = np.array(
+            [self._response_to_numeric(value) for value in response_values] + [np.nan], dtype=np.float64
+        )
+        likert_values = np.array([isinstance(value, str) for value in response_values] + [False], dtype=bool)
         
-        return trait_scores
+        responses = numeric_values[response_codes].reshape(raw.shape)
+        likert_responses = likert_values[response_codes].reshape(raw.shape)
+        return responses, likert_responses, asked
+    
+    def _response_to_numeric(self, response_value: Any) -> float:
+        """Convert a single (non-missing) response to numeric"""
+        if isinstance(response_value, str):
+            return self.mapper.map_likert_to_numeric(response_value)
+        return float(response_value)
     
     def _calculate_traits_from_rasch(
         self, 
-        person_data: pd.Series, 
-        person_id: str
-    ) -> Dict[str, float]:
+        responses: np.ndarray,
+        mean_values: np.ndarray,
+        asked: np.ndarray,
+        person_ids: List[str]
+    ) -> np.ndarray:
         """
         Calculate trait scores using Rasch measures (Option B: Item-level Rasch, Trait Aggregation)
         
@@ -127,215 +313,157 @@ class FixedTraitScorer:
         3. Average the abilities (or use weighted average based on item difficulties)
         4. Convert logit scale to 0-1 scale
         
+        All persons and traits are computed together as array operations.
+        
         Args:
-            person_data: Person's response data
-            person_id: Person identifier
+            responses: Numeric responses (NaN when missing), one row per person
+            mean_values: Response values for the arithmetic mean fallback, aligned with responses
+            asked: Mask of the questions present in the data
+            person_ids: Person identifiers, aligned with the rows of responses
             
         Returns:
-            Dictionary of trait scores (0-1 scale)
+            Array of trait scores (0-1 scale) of shape (persons, traits), columns in trait_names order
         """
-        trait_scores = {}
-        overall_person_ability_logit = self.rasch_person_abilities.get(person_id, 0.0)
-        
-        for trait in self.trait_names:
-            # Find all questions that measure this trait
-            trait_questions = self.mapper.get_questions_for_trait(trait)
-            trait_item_scores = []
-            trait_item_weights = []
+        overall_person_ability_logit = np.array(
+            [self.rasch_person_abilities.get(person_id, 0.0) for person_id in person_ids], dtype=np.float64
+        )
+        
+        # Calculate item-specific person ability estimates
+        # Using Rasch model: P(X=1) = exp(ability - difficulty) / (1 + exp(ability - difficulty))
+        # Response value (0-1) represents probability of endorsement
+        # Convert to logit: logit = log(p / (1-p)), clamped to avoid log(0) or log(inf)
+        # Then: ability = logit + difficulty
+        # Items without a difficulty use the overall person ability instead
+        # Items are weighted by their precomputed _item_weights
+        #
+        # Responses take few distinct values, so the logit is computed once per distinct value and
+        # responses are coded as positions in that table (-1 when missing, which picks the
+        # trailing NaN entry)
+        response_codes, response_values = pd.factorize(responses.ravel())
+        response_codes = response_codes.reshape(responses.shape).astype(
+            np.int8 if len(response_values) < np.iinfo(np.int8).max else np.int32
+        )
+        response_logits = np.append(logit(np.clip(response_values, 0.01, 0.99)), np.nan)
+        answered = response_codes >= 0  # Skip missing responses
+        
+        if njit is not None:
+            trait_scores, weight_total = _rasch_trait_kernel(
+                response_codes, response_logits, self._item_difficulty, self._has_item_difficulty,
+                self._item_weights, overall_person_ability_logit,
+                self._trait_item_ptr, self._trait_item_idx
+            )
+            no_measures = weight_total == 0
+        else:
+            item_abilities = np.where(
+                self._has_item_difficulty,
+                response_logits[response_codes] + self._item_difficulty,
+                overall_person_ability_logit[:, None]
+            )
+            item_abilities = np.where(answered, item_abilities, 0.0)
             
-            for question in trait_questions:
-                # Get item difficulty for this question
-                item_difficulty = self.rasch_item_difficulties.get(question)
-                
-                # Get person's actual response to this item
-                if question in person_data.index:
-                    response_value = person_data[question]
-                    
-                    # Convert response to numeric if needed
-                    if isinstance(response_value, str):
-                        response_numeric = self.mapper.map_likert_to_numeric(response_value)
-                    elif pd.isna(response_value):
-                        continue  # Skip missing responses
-                    else:
-                        response_numeric = float(response_value)
-                    
-                    # Calculate item-specific person ability estimate
-                    # Using Rasch model: P(X=1) = exp(ability - difficulty) / (1 + exp(ability - difficulty))
-                    # For polytomous (0-4 scale), we estimate ability from response
-                    # Response value (0-1) represents probability of endorsement
-                    # Convert to logit: logit = log(p / (1-p))
-                    # Then: ability = logit + difficulty
-                    
-                    if item_difficulty is not None:
-                        # Convert response (0-1) to logit scale
-                        # Clamp to avoid log(0) or log(inf)
-                        p = np.clip(response_numeric, 0.01, 0.99)
-                        response_logit = np.log(p / (1 - p))
-                        
-                        # Estimate person ability for this item: ability = response_logit + difficulty
-                        # This gives us item-specific ability estimate
-                        item_specific_ability = response_logit + item_difficulty
-                        
-                        trait_item_scores.append(item_specific_ability)
-                        
-                        # Weight by item difficulty (more difficult items weighted more)
-                        # Items with higher absolute difficulty get more weight
-                        weight = abs(item_difficulty) + 1.0  # Add 1 to avoid zero weights
-                        trait_item_weights.append(weight)
-                    else:
-                        # Fallback: use overall person ability if item difficulty not available
-                        trait_item_scores.append(overall_person_ability_logit)
-                        trait_item_weights.append(1.0)
+            # Weighted average of item-specific abilities per person and trait
+            weighted_sum = np.einsum('ij,jt->it', item_abilities, self._trait_weights)
+            weight_total = np.einsum('ij,jt->it', answered.astype(np.float64), self._trait_weights)
+            no_measures = weight_total == 0
+            weighted_ability = weighted_sum / np.where(no_measures, 1.0, weight_total)
             
-            if trait_item_scores:
-                # Weighted average of item-specific abilities
-                if trait_item_weights and len(trait_item_weights) == len(trait_item_scores):
-                    weights_array = np.array(trait_item_weights)
-                    abilities_array = np.array(trait_item_scores)
-                    weighted_ability = np.average(abilities_array, weights=weights_array)
-                else:
-                    weighted_ability = np.mean(trait_item_scores)
-                
-                # Convert logit to 0-1 scale
-                trait_score = self._convert_logit_to_0_1(weighted_ability)
-                trait_scores[trait] = trait_score
-            else:
-                # No items found for this trait - use fallback to arithmetic mean
-                logger.warning(f"No Rasch measures found for trait {trait} for person {person_id}, using fallback")
-                trait_scores[trait] = self._calculate_trait_fallback_mean(person_data, trait)
+            # Convert logit to 0-1 scale
+            trait_scores = self._convert_logit_to_0_1(weighted_ability)
+        
+        # No items answered for a trait - use fallback to arithmetic mean
+        for i, t in zip(*np.nonzero(no_measures)):
+            trait = self.trait_names[t]
+            logger.warning(f"No Rasch measures found for trait {trait} for person {person_ids[i]}, using fallback")
+            trait_scores[i, t] = self._calculate_trait_fallback_mean(mean_values[i], asked, t)
         
         return trait_scores
     
-    def _calculate_trait_fallback_mean(self, person_data: pd.Series, trait: str) -> float:
+    def _calculate_trait_fallback_mean(self, values: np.ndarray, asked: np.ndarray, trait_index: int) -> float:
         """
         Fallback method: calculate trait score using arithmetic mean
         Used when Rasch measures are not available for a trait
-        """
-        trait_questions = self.mapper.get_questions_for_trait(trait)
-        trait_values = []
         
-        for question in trait_questions:
-            if question in person_data.index:
-                value = self.mapper.map_likert_to_numeric(person_data[question])
-                if not pd.isna(value):
-                    trait_values.append(value)
+        Args:
+            values: One person's response values for the arithmetic mean (missing as neutral)
+            asked: Mask of the questions present in the data
+            trait_index: Position of the trait in trait_names
+        """
+        trait_questions = self._trait_item_idx[self._trait_item_ptr[trait_index]:self._trait_item_ptr[trait_index + 1]]
+        trait_values = values[trait_questions[asked[trait_questions]]]
         
-        if trait_values:
-            return sum(trait_values) / len(trait_values)
+        if trait_values.size:
+            return float(trait_values.mean())
         else:
             return 0.5  # Default neutral score
     
     def _calculate_traits_from_mean(
         self, 
-        person_data: pd.Series, 
-        person_id: str
-    ) -> Dict[str, float]:
+        values: np.ndarray, 
+        asked: np.ndarray,
+        person_ids: List[str]
+    ) -> np.ndarray:
         """
         Calculate trait scores using arithmetic mean (legacy fallback method)
         
+        Social Orientation (IN) is a weighted mean with introverted questions reverse keyed.
+        
         Args:
-            person_data: Person's response data
-            person_id: Person identifier
+            values: Numeric response values (0-1, missing as neutral), one row per person
+            asked: Mask of the questions present in the data
+            person_ids: Person identifiers, aligned with the rows of values
             
         Returns:
-            Dictionary of trait scores
+            Array of trait scores of shape (persons, traits), columns in trait_names order
         """
-        trait_scores = {}
+        weights = self._mean_weights * asked[:, None]
+        weighted_sum = values @ weights
+        if self._in_index is not None:
+            # Apply Reverse Keying and Weights
+            weighted_sum[:, self._in_index] = (self._in_offset + self._in_sign * values) @ weights[:, self._in_index]
         
-        for trait in self.trait_names:
-            # Find all questions that measure this trait
-            trait_questions = self.mapper.get_questions_for_trait(trait)
-            trait_values = []
-            
-            # Special handling for Social Orientation (IN) - Option 2: Weighted Intensity
-            if trait == 'IN':
-                weights = []
-                for question in trait_questions:
-                    if question in person_data.index:
-                        raw_val = self.mapper.map_likert_to_numeric(person_data[question])
-                        
-                        # Apply Reverse Keying and Weights
-                        if "drain my energy" in question or "observant" in question or "active listener" in question or "reflect" in question:
-                            # Introverted traits: Reverse and standard weight
-                            val = 1.0 - raw_val
-                            weight = 1.0
-                        elif "pitch ideas" in question or "jump into conversations" in question:
-                            # High-Agency Extroverted traits: High weight
-                            val = raw_val
-                            weight = 1.5
-                        else:
-                            # Standard Extroverted traits: Standard weight
-                            val = raw_val
-                            weight = 1.0
-                            
-                        trait_values.append(val * weight)
-                        weights.append(weight)
-                
-                if trait_values:
-                    trait_scores[trait] = sum(trait_values) / sum(weights)
-                else:
-                    trait_scores[trait] = 0.5
-                continue
-
-            # Standard logic for other traits
-            for question in trait_questions:
-                if question in person_data.index:
-                    value = self.mapper.map_likert_to_numeric(person_data[question])
-                    trait_values.append(value)
-            
-            if trait_values:
-                # Calculate average score for this trait
-                avg_score = sum(trait_values) / len(trait_values)
-                trait_scores[trait] = avg_score
-            else:
-                trait_scores[trait] = 0.5  # Default neutral score
-                logger.warning(f"No measures found for trait {trait} for person {person_id}")
+        weight_total = weights.sum(axis=0)
+        no_measures = weight_total == 0
+        trait_scores = weighted_sum / np.where(no_measures, 1.0, weight_total)
+        trait_scores[:, no_measures] = 0.5  # Default neutral score
+        
+        for t in np.flatnonzero(no_measures):
+            if t != self._in_index:
+                for person_id in person_ids:
+                    logger.warning(f"No measures found for trait {self.trait_names[t]} for person {person_id}")
         
         return trait_scores
     
-    def _convert_logit_to_0_1(self, logit_value: float) -> float:
+    def _convert_logit_to_0_1(self, logit_value: np.ndarray) -> np.ndarray:
         """
-        Convert logit scale value to 0-1 scale for compatibility
+        Convert logit scale values to 0-1 scale for compatibility
         
         Args:
-            logit_value: Value on logit scale
+            logit_value: Values on logit scale
             
         Returns:
-            Value on 0-1 scale
+            Values on 0-1 scale
         """
-        try:
-            # Use logistic function: p = exp(logit) / (1 + exp(logit))
-            exp_logit = np.exp(logit_value)
-            prob = exp_logit / (1 + exp_logit)
-            return float(np.clip(prob, 0.0, 1.0))
-        except (OverflowError, ValueError):
-            # Handle extreme values
-            if logit_value > 10:
-                return 1.0
-            elif logit_value < -10:
-                return 0.0
-            else:
-                return 0.5
+        # Logistic function p = exp(logit) / (1 + exp(logit)), saturating instead of overflowing
+        return expit(logit_value)
     
-    def _log_scoring_summary(self, profiles: Dict[str, Dict[str, float]]):
+    def _log_scoring_summary(self, trait_scores: pd.DataFrame):
         """Log summary statistics of the scoring process"""
-        if not profiles:
+        if trait_scores.empty:
             logger.warning("No profiles generated")
             return
         
         # Calculate statistics
-        all_scores = []
-        for profile in profiles.values():
-            all_scores.extend(profile.values())
-        
-        if all_scores:
-            min_score = min(all_scores)
-            max_score = max(all_scores)
-            avg_score = sum(all_scores) / len(all_scores)
-            std_dev = pd.Series(all_scores).std()
+        all_scores = trait_scores.to_numpy().ravel()
+        
+        if all_scores.size:
+            min_score = all_scores.min()
+            max_score = all_scores.max()
+            avg_score = all_scores.mean()
+            # Sample standard deviation (ddof=1), undefined for a single score
+            std_dev = all_scores.std(ddof=1) if all_scores.size > 1 else np.nan
             
             logger.info(f"Trait scoring completed:")
-            logger.info(f"  - Persons processed: {len(profiles)}")
+            logger.info(f"  - Persons processed: {len(trait_scores)}")
             logger.info(f"  - Traits per person: {len(self.trait_names)}")
             logger.info(f"  - Total scores calculated: {len(all_scores)}")
             logger.info(f"  - Score range: {min_score:.3f} to {max_score:.3f}")
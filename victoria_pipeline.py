@@ -6,15 +6,24 @@ Main pipeline script that orchestrates all modules to generate comprehensive rep
 
 import sys
 import os
-import pandas as pd
+import hashlib
+import json
 import logging
+import threading
+import uuid
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, List
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 from dotenv import load_dotenv
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 # Load environment variables from .env file
-load_dotenv()
+# Its values override system environment variables (utf-8-sig handles a BOM)
+load_dotenv(Path(__file__).parent / ".env", override=True, encoding='utf-8-sig')
 
 # Add project root to path
 project_root = Path(__file__).parent
@@ -31,30 +40,66 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Override system environment variable with .env file value
-# This ensures our .env file takes precedence over system environment variables
-env_file_path = Path(__file__).parent / ".env"
-if env_file_path.exists():
-    with open(env_file_path, 'r', encoding='utf-8-sig') as f:  # Handle BOM
-        for line in f:
-            if line.strip() and not line.startswith('#') and '=' in line:
-                key, value = line.strip().split('=', 1)
-                # Force override the environment variable
-                os.environ[key] = value
-                logger.info(f"Set environment variable: {key}={value[:20]}...")
-    
-    # Explicitly verify the override worked
-    final_key = os.getenv("OPENAI_API_KEY")
-    logger.info(f"Final API key after override: {final_key[:20] if final_key else 'None'}...")
-
-# Import core modules
-from victoria.core import DataProcessor, ArchetypeDetector, VisualizationEngine, ReportGenerator
-from victoria.scoring.fixed_trait_scorer import FixedTraitScorer
-
 # OpenAI API key should be set via environment variable
 # Set it in your .env file or export OPENAI_API_KEY=your_key_here
 # This ensures no hardcoded API keys are committed to the repository
 
+# Open-ended question columns (A to Z range in the CSV)
+OPEN_ENDED_COLUMNS = (
+    "What inspired your business idea, and how did it first come to you?",
+    "What specific problem does your business solve, and who benefits most from it?",
+    "Where are you in the process—idea stage, prototype, launch, or beyond?",
+    "What is one decision you've already made that challenged you?",
+    "How do your personal values show up in your business idea?",
+    "What kind of impact do you hope your business will create—in your life or for others?",
+    "What kind of support would help you move forward right now?",
+    "What is drawing you toward entrepreneurship at this moment in your life?",
+    "What does \"entrepreneurship\" mean to you personally?",
+    "What's a time when you took initiative or built something from scratch?",
+    "What fears or uncertainties do you have about starting something of your own?",
+    "What kind of work energizes you most—and why?",
+    "When you imagine your future, what role (if any) does building something yourself play?",
+    "What questions are you hoping this experience will help you answer?",
+    "What would success look like for you in this phase of exploration?",
+    "What kinds of work or challenges bring out the best in you?",
+    "When have you taken the lead without being asked—and what happened?",
+    "Where do you feel most confident in how you contribute?",
+    "What's something others often rely on you for?",
+    "How do you typically approach uncertainty or change?",
+    "What are you learning about yourself right now—and what are you still figuring out?",
+    "If you were to fully embrace your entrepreneurial energy, what might become possible?"
+)
+
+# The journey question, which might be in a different column
+JOURNEY_QUESTION = "Which of the following best describes where you are in your entrepreneurial journey?"
+
+# Columns extract_open_ended_responses reads, in the order the responses are reported
+_RESPONSE_COLUMNS = OPEN_ENDED_COLUMNS + (JOURNEY_QUESTION,)
+
+# Number of CSV files whose prepared data (steps 1-4 for every person) is kept in memory
+PREPARED_CACHE_SIZE = 4
+
+# Persons processed concurrently by process_batch and generate_reports (each mostly waits on the
+# OpenAI API); this also bounds the number of OpenAI requests in flight
+REPORT_WORKERS = 8
+
+# Directory where complete profiles are kept on disk (as JSON) and reused across runs, keyed by
+# the CSV content, person and models; unset disables the cache (profiles hold personal data)
+PROFILE_CACHE_DIR_ENV = "VICTORIA_PROFILE_CACHE_DIR"
+
+# Part of every profile cache key: bump it whenever the profile contents change, so that profiles
+# cached by earlier code are no longer used
+PROFILE_CACHE_VERSION = 1
+
+@lru_cache(maxsize=PREPARED_CACHE_SIZE)
+def _file_digest(path: str, mtime_ns: int, size: int) -> str:
+    """BLAKE2b digest of a file's content, cached per path, modification time and size"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
 class VetriaPipeline:
     """
     Main pipeline class that orchestrates the complete Vetria assessment process
@@ -62,23 +107,30 @@ class VetriaPipeline:
     
     def __init__(self):
         """Initialize the Vetria pipeline with all core components"""
+        # Import core modules (and with them pandas, NumPy and Plotly) only when a pipeline is
+        # created, so importing this module and the command line usage message stay fast
+        from victoria.core import DataProcessor, ArchetypeDetector, VisualizationEngine, ReportGenerator
+        from victoria.scoring.fixed_trait_scorer import FixedTraitScorer
+        
         self.data_processor = DataProcessor()
         self.trait_scorer = FixedTraitScorer()
         self.archetype_detector = ArchetypeDetector()
         self.visualization_engine = VisualizationEngine()
         self.report_generator = ReportGenerator()
         
+        # Steps 1-4 cover every person in the CSV at once, so they run once per file version
+        self._prepared_cache = lru_cache(maxsize=PREPARED_CACHE_SIZE)(self._prepare_csv)
+        
+        # Directory holding complete profiles across runs (None disables it)
+        self._profile_cache_dir = os.getenv(PROFILE_CACHE_DIR_ENV) or None
+        
+        # Batch worker threads keep their own visualization engine and report generator here
+        self._worker = threading.local()
+        
         # Initialize OpenAI client
         try:
             from openai import OpenAI
             api_key = os.getenv("OPENAI_API_KEY")
-            logger.info(f"DEBUG - API Key from environment: {api_key[:20] if api_key else 'None'}...")
-            logger.info(f"DEBUG - Full API Key: {api_key}")
-            
-            # Check all environment variables that start with OPENAI
-            openai_vars = {k: v for k, v in os.environ.items() if k.startswith('OPENAI')}
-            logger.info(f"DEBUG - All OPENAI environment variables: {openai_vars}")
-            
             if api_key:
                 self.openai_client = OpenAI(api_key=api_key)
                 self.report_generator.openai_client = self.openai_client
@@ -90,63 +142,123 @@ class VetriaPipeline:
             logger.warning("OpenAI not available, using fallback content generation")
             self.openai_client = None
     
-    def extract_open_ended_responses(self, df: pd.DataFrame, person_index: int = 0) -> Dict[str, str]:
+    def _init_worker(self) -> None:
+        """Give a batch worker thread its own visualization engine and report generator"""
+        from victoria.core import VisualizationEngine, ReportGenerator
+        
+        self._worker.visualization_engine = VisualizationEngine()
+        self._worker.report_generator = ReportGenerator(
+            openai_client=self.openai_client,
+            template_path=self.report_generator.template_path
+        )
+    
+    def _components(self):
+        """The visualization engine and report generator used by the current thread"""
+        return (
+            getattr(self._worker, 'visualization_engine', self.visualization_engine),
+            getattr(self._worker, 'report_generator', self.report_generator)
+        )
+    
+    def extract_open_ended_responses(self, df: "pd.DataFrame", person_index: int = 0) -> Dict[str, str]:
         """Extract open-ended text responses from the dataframe and organize them by category"""
-        # Define the open-ended question columns (A to Z range in the CSV)
-        open_ended_columns = [
-            "What inspired your business idea, and how did it first come to you?",
-            "What specific problem does your business solve, and who benefits most from it?",
-            "Where are you in the process—idea stage, prototype, launch, or beyond?",
-            "What is one decision you've already made that challenged you?",
-            "How do your personal values show up in your business idea?",
-            "What kind of impact do you hope your business will create—in your life or for others?",
-            "What kind of support would help you move forward right now?",
-            "What is drawing you toward entrepreneurship at this moment in your life?",
-            "What does \"entrepreneurship\" mean to you personally?",
-            "What's a time when you took initiative or built something from scratch?",
-            "What fears or uncertainties do you have about starting something of your own?",
-            "What kind of work energizes you most—and why?",
-            "When you imagine your future, what role (if any) does building something yourself play?",
-            "What questions are you hoping this experience will help you answer?",
-            "What would success look like for you in this phase of exploration?",
-            "What kinds of work or challenges bring out the best in you?",
-            "When have you taken the lead without being asked—and what happened?",
-            "Where do you feel most confident in how you contribute?",
-            "What's something others often rely on you for?",
-            "How do you typically approach uncertainty or change?",
-            "What are you learning about yourself right now—and what are you still figuring out?",
-            "If you were to fully embrace your entrepreneurial energy, what might become possible?"
-        ]
+        # The open-ended questions present in the data, plus the journey question which might be
+        # in a different column
+        columns = set(df.columns)
+        present = [col for col in _RESPONSE_COLUMNS if col in columns]
+        
+        # Only keep responses that exist and are not empty (reading just those cells of the row)
+        answers = df.iloc[person_index, df.columns.get_indexer(present)].dropna().astype(str).str.strip()
+        responses = answers[answers != ''].to_dict()
         
-        responses = {}
-        for col in open_ended_columns:
-            if col in df.columns:
-                response = df.iloc[person_index][col]
-                # Only add if response exists and is not empty
-                if pd.notna(response) and str(response).strip() and str(response).strip() != '':
-                    responses[col] = str(response).strip()
-                    print(f"DEBUG - Found response for '{col}': {str(response).strip()[:50]}...")
-                else:
-                    print(f"DEBUG - Skipping empty response for '{col}'")
-        
-        # Also check for the journey question which might be in a different column
-        journey_question = "Which of the following best describes where you are in your entrepreneurial journey?"
-        if journey_question in df.columns:
-            response = df.iloc[person_index][journey_question]
-            if pd.notna(response) and str(response).strip() and str(response).strip() != '':
-                responses[journey_question] = str(response).strip()
-                print(f"DEBUG - Found journey response: {str(response).strip()[:50]}...")
-        
-        print(f"DEBUG - Total open-ended responses found: {len(responses)}")
+        logger.debug("Total open-ended responses found: %s", len(responses))
         return responses
     
-    def process_single_person(self, csv_path: str, person_index: int = 0) -> Dict[str, Any]:
+    def prepare(self, csv_path: str) -> Dict[str, Any]:
+        """
+        Run steps 1-4 (loading, mapping, Rasch measures, trait scores) for every person in a CSV
+        
+        The result is cached per file path, modification time and size, so processing several
+        persons from the same file loads it and fits the Rasch model only once.
+        
+        Args:
+            csv_path: Path to CSV file with assessment responses
+            
+        Returns:
+            Dictionary with the raw and mapped data, the Rasch results and the trait scores
+            (a DataFrame indexed by person ID, with one column per trait, and the same scores
+            as a NumPy array in 'trait_score_values')
+        """
+        stat = os.stat(csv_path)
+        return self._prepared_cache(os.path.abspath(csv_path), stat.st_mtime_ns, stat.st_size)
+    
+    def _prepare_csv(self, csv_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+        """Run steps 1-4 for one version of a CSV file (uncached)"""
+        # Step 1: Load and process raw data
+        logger.info("Step 1: Loading raw data...")
+        raw_data = self.data_processor._load_raw_data(csv_path)
+        logger.info(f"Loaded {len(raw_data)} rows, {len(raw_data.columns)} columns")
+        
+        # Check up front that the assessment questions are present (missing ones score as neutral)
+        columns = set(raw_data.columns)
+        question_count = len(self.trait_scorer.question_mapping)
+        missing_count = sum(question not in columns for question in self.trait_scorer.question_mapping)
+        if missing_count:
+            logger.warning(f"{missing_count} of {question_count} assessment questions are missing from the CSV")
+        
+        # Step 2: Map responses to numeric values
+        logger.info("Step 2: Mapping responses to numeric values...")
+        mapped_data = self.data_processor._map_responses(raw_data)
+        logger.info("Response mapping completed")
+        
+        # Step 3: Calculate Rasch measures using genuine RaschPy RSM
+        logger.info("Step 3: Calculating Rasch measures using RaschPy RSM...")
+        rasch_data = self.data_processor._calculate_rasch_measures(mapped_data)
+        logger.info("Rasch measures calculated")
+        
+        # Extract Rasch results for trait scoring
+        rasch_results = {
+            'item_difficulties': rasch_data.get('item_difficulties', {}),
+            'person_abilities': rasch_data.get('person_abilities', {}),
+            'fit_statistics': rasch_data.get('fit_statistics', {})
+        }
+        
+        if rasch_results['item_difficulties'] and rasch_results['person_abilities']:
+            logger.info(f"Rasch analysis completed: {len(rasch_results['item_difficulties'])} items, "
+                      f"{len(rasch_results['person_abilities'])} persons")
+        else:
+            logger.warning("Rasch analysis incomplete, falling back to arithmetic mean")
+        
+        # Step 4: Calculate trait scores using Rasch measures
+        logger.info("Step 4: Calculating trait scores using Rasch measures...")
+        trait_scores = self.trait_scorer.calculate_trait_score_frame(
+            raw_data, 
+            rasch_results=rasch_results
+        )
+        
+        return {
+            'raw_data': raw_data,
+            'mapped_data': mapped_data,
+            'rasch_results': rasch_results,
+            'trait_scores': trait_scores,
+            'trait_score_values': trait_scores.to_numpy()
+        }
+    
+    def process_single_person(
+        self,
+        csv_path: str,
+        person_index: int = 0,
+        run_time: Optional[datetime] = None,
+        inspiring_content: bool = True
+    ) -> Dict[str, Any]:
         """
         Process a single person's assessment data through the complete pipeline
         
         Args:
             csv_path: Path to CSV file with assessment responses
             person_index: Index of person to process (default: 0)
+            run_time: Time the report is dated with (default: now)
+            inspiring_content: Whether to generate the inspiring content (step 10); a profile
+                built without it is not cached
             
         Returns:
             Dictionary containing complete profile data
@@ -156,46 +268,28 @@ class VetriaPipeline:
             logger.info("VETRIA ENTREPRENEURIAL ASSESSMENT PIPELINE")
             logger.info("=" * 80)
             
-            # Step 1: Load and process raw data
-            logger.info("Step 1: Loading raw data...")
-            raw_data = self.data_processor._load_raw_data(csv_path)
-            logger.info(f"Loaded {len(raw_data)} rows, {len(raw_data.columns)} columns")
+            if run_time is None:
+                run_time = datetime.now()
             
-            # Step 2: Map responses to numeric values
-            logger.info("Step 2: Mapping responses to numeric values...")
-            mapped_data = self.data_processor._map_responses(raw_data)
-            logger.info("Response mapping completed")
+            # A profile already built from the same CSV content is reused as is, apart from its date
+            cache_path = self._profile_cache_path(csv_path, person_index)
+            profile_data = self._load_cached_profile(cache_path)
+            if profile_data is not None:
+                profile_data['current_date'] = run_time.strftime('%B %d, %Y')
+                logger.info(f"Loaded cached profile: {cache_path}")
+                return profile_data
             
-            # Step 3: Calculate Rasch measures using genuine RaschPy RSM
-            logger.info("Step 3: Calculating Rasch measures using RaschPy RSM...")
-            rasch_data = self.data_processor._calculate_rasch_measures(mapped_data)
-            logger.info("Rasch measures calculated")
-            
-            # Extract Rasch results for trait scoring
-            rasch_results = {
-                'item_difficulties': rasch_data.get('item_difficulties', {}),
-                'person_abilities': rasch_data.get('person_abilities', {}),
-                'fit_statistics': rasch_data.get('fit_statistics', {})
-            }
-            
-            if rasch_results['item_difficulties'] and rasch_results['person_abilities']:
-                logger.info(f"Rasch analysis completed: {len(rasch_results['item_difficulties'])} items, "
-                          f"{len(rasch_results['person_abilities'])} persons")
-            else:
-                logger.warning("Rasch analysis incomplete, falling back to arithmetic mean")
-            
-            # Step 4: Calculate trait scores using Rasch measures
-            logger.info("Step 4: Calculating trait scores using Rasch measures...")
-            trait_profiles = self.trait_scorer.calculate_trait_scores(
-                raw_data, 
-                rasch_results=rasch_results
-            )
+            prepared = self.prepare(csv_path)
+            raw_data = prepared['raw_data']
+            trait_table = prepared['trait_scores']
             person_id = f"person_{person_index}"
             
-            if person_id not in trait_profiles:
+            if person_id not in trait_table.index:
                 raise ValueError(f"Person {person_id} not found in trait profiles")
             
-            trait_scores = trait_profiles[person_id]
+            # The person's scores as an array (in trait order) and as the dictionary the later steps use
+            score_values = prepared['trait_score_values'][trait_table.index.get_loc(person_id)]
+            trait_scores = dict(zip(trait_table.columns, score_values.tolist()))
             logger.info(f"Trait scores calculated for {len(trait_scores)} traits")
             
             # Step 5: Detect archetype
@@ -209,12 +303,18 @@ class VetriaPipeline:
             logger.info(f"Extracted {len(open_ended_responses)} open-ended responses")
             
             # Step 7: Calculate overall score
-            overall_score = sum(trait_scores.values()) / len(trait_scores)
+            overall_score = float(score_values.mean())
             
             # Step 8: Prepare profile data
+            # Name and email are read as single cells rather than through the person's whole row
+            columns = raw_data.columns
+            first_name = raw_data['First name'].iat[person_index] if 'First name' in columns else 'Unknown'
+            last_name = raw_data['Last name'].iat[person_index] if 'Last name' in columns else ''
+            person_email = raw_data['Email'].iat[person_index] if 'Email' in columns else ''
+            
             profile_data = {
-                'person_name': f"{raw_data.iloc[person_index].get('First name', 'Unknown')} {raw_data.iloc[person_index].get('Last name', '')}".strip(),
-                'person_email': raw_data.iloc[person_index].get('Email', ''),
+                'person_name': f"{first_name} {last_name}".strip() or 'Unknown',
+                'person_email': person_email,
                 'trait_scores': trait_scores,
                 'archetype_name': archetype_result['archetype_name'],
                 'archetype_description': archetype_result['archetype_description'],
@@ -227,20 +327,35 @@ class VetriaPipeline:
                 'entrepreneurial_stage': 'Discover',  # Default stage
                 'entrepreneurial_stage_class': 'discover',
                 'entrepreneurial_stage_description': 'You want to understand how entrepreneurial energy shapes your path. This stage is about self-discovery, building awareness, and connecting your natural strengths to potential opportunities.',
-                'current_date': datetime.now().strftime('%B %d, %Y'),
+                'current_date': run_time.strftime('%B %d, %Y'),
                 'archetype_match_explanation': f'Your strongest alignment is with {archetype_result["archetype_name"]}, showing high potential to lead through creativity and forward vision'
             }
             
-            # Step 9: Generate visualizations
-            logger.info("Step 9: Generating visualizations...")
-            visualizations = self.visualization_engine.generate_all_visualizations(profile_data)
-            profile_data.update(visualizations)
+            visualization_engine, report_generator = self._components()
+            
+            if not inspiring_content:
+                # Step 9: Generate visualizations (the caller adds the inspiring content)
+                logger.info("Step 9: Generating visualizations...")
+                profile_data.update(visualization_engine.generate_all_visualizations(profile_data))
+                return profile_data
             
-            # Step 10: Generate inspiring content
-            logger.info("Step 10: Generating inspiring content...")
-            inspiring_content = self.report_generator.generate_inspiring_content(profile_data)
+            # Steps 9 and 10 are independent: the inspiring content mostly waits on the OpenAI API,
+            # so it is requested in the background while the (CPU-bound) charts are built
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                # Step 10: Generate inspiring content
+                logger.info("Step 10: Generating inspiring content...")
+                inspiring_future = executor.submit(report_generator.generate_inspiring_content, dict(profile_data))
+                
+                # Step 9: Generate visualizations
+                logger.info("Step 9: Generating visualizations...")
+                visualizations = visualization_engine.generate_all_visualizations(profile_data)
+                profile_data.update(visualizations)
+                
+                inspiring_content = inspiring_future.result()
             profile_data.update(inspiring_content)
             
+            self._store_cached_profile(cache_path, profile_data)
+            
             logger.info("SUCCESS: Profile processing completed!")
             return profile_data
                 
@@ -248,7 +363,112 @@ class VetriaPipeline:
             logger.error(f"Error processing person {person_index}: {e}")
             raise
     
-    def generate_report(self, csv_path: str, output_dir: str = "output/reports", person_index: int = 0) -> str:
+    def _profile_cache_path(self, csv_path: str, person_index: int) -> Optional[str]:
+        """Disk cache file for a person's profile, or None when the profile cache is disabled"""
+        if not self._profile_cache_dir:
+            return None
+        
+        stat = os.stat(csv_path)
+        digest = _file_digest(os.path.abspath(csv_path), stat.st_mtime_ns, stat.st_size)
+        # Profiles with LLM content (per model) and with fallback content are kept apart
+        if self.openai_client:
+            content = f"llm:{self.report_generator._model}:{self.report_generator._fast_model}"
+        else:
+            content = "fallback"
+        key = hashlib.blake2b(
+            f"{PROFILE_CACHE_VERSION}:{digest}:{person_index}:{content}".encode('utf-8'), digest_size=16
+        ).hexdigest()
+        return os.path.join(self._profile_cache_dir, f"{key}.json")
+    
+    def _load_cached_profile(self, cache_path: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Load a cached profile, or None when there is none"""
+        if not cache_path:
+            return None
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read cached profile {cache_path}: {e}")
+            return None
+    
+    def _store_cached_profile(self, cache_path: Optional[str], profile_data: Dict[str, Any]) -> None:
+        """Write a profile to the disk cache (atomically, so readers never see a partial file)"""
+        if not cache_path:
+            return
+        try:
+            os.makedirs(self._profile_cache_dir, exist_ok=True)
+            # A temporary file of its own per write, created with the process umask like other files
+            tmp_path = f"{cache_path}.{uuid.uuid4().hex}.tmp"
+            try:
+                with open(tmp_path, 'x', encoding='utf-8') as f:
+                    json.dump(profile_data, f)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not cache profile: {e}")
+    
+    def process_batch(self, csv_path: str, person_indices: List[int], use_batch_api: bool = False) -> List[Dict[str, Any]]:
+        """
+        Process several persons from the same CSV file, preparing the file only once
+        
+        The persons are processed concurrently in threads, so their OpenAI requests for the
+        inspiring content are in flight together (at most REPORT_WORKERS at a time). Each
+        thread has its own visualization engine and report generator.
+        
+        Args:
+            csv_path: Path to CSV file with assessment responses
+            person_indices: Indices of the persons to process
+            use_batch_api: Request the inspiring content of all persons through one OpenAI
+                batch instead (cheaper, but it can take up to 24 hours; offline runs only)
+            
+        Returns:
+            List of profile data dictionaries, in the order of person_indices
+        """
+        self.prepare(csv_path)
+        run_time = datetime.now()
+        
+        workers = min(REPORT_WORKERS, max(len(person_indices), 1))
+        with ThreadPoolExecutor(max_workers=workers, initializer=self._init_worker) as executor:
+            profiles = list(executor.map(
+                partial(self.process_single_person, csv_path, run_time=run_time, inspiring_content=not use_batch_api),
+                person_indices
+            ))
+        
+        if use_batch_api:
+            self._add_batch_inspiring_content(csv_path, person_indices, profiles)
+        return profiles
+    
+    def _add_batch_inspiring_content(self, csv_path: str, person_indices: List[int], profiles: List[Dict[str, Any]]) -> None:
+        """Add the inspiring content to the profiles lacking it through one OpenAI batch, then cache them"""
+        from victoria.core.report_generator import INSPIRING_CONTENT_SECTIONS
+        
+        # Profiles loaded from the cache already have their content
+        pending = [
+            (person_index, profile_data)
+            for person_index, profile_data in zip(person_indices, profiles)
+            if not all(section in profile_data for section in INSPIRING_CONTENT_SECTIONS)
+        ]
+        if not pending:
+            return
+        
+        contents = self.report_generator.generate_inspiring_content_batch(
+            [dict(profile_data) for _, profile_data in pending]
+        )
+        for (person_index, profile_data), content in zip(pending, contents):
+            profile_data.update(content)
+            self._store_cached_profile(self._profile_cache_path(csv_path, person_index), profile_data)
+    
+    def generate_report(
+        self,
+        csv_path: str,
+        output_dir: str = "output/reports",
+        person_index: int = 0,
+        run_time: Optional[datetime] = None
+    ) -> str:
         """
         Generate a complete assessment report for a single person
         
@@ -256,26 +476,33 @@ class VetriaPipeline:
             csv_path: Path to CSV file with assessment responses
             output_dir: Directory to save the report
             person_index: Index of person to process
+            run_time: Time shared by the reports of one batch, which then also carry the person
+                index in their file names (default: now)
             
         Returns:
             Path to the generated report file
         """
         try:
+            batch_run = run_time is not None
+            if run_time is None:
+                run_time = datetime.now()
+            
             # Process the person's data
-            profile_data = self.process_single_person(csv_path, person_index)
+            profile_data = self.process_single_person(csv_path, person_index, run_time)
             
             # Generate report filename
             person_name = profile_data['person_name'].replace(' ', '_')
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = run_time.strftime('%Y%m%d_%H%M%S')
+            if batch_run:
+                # Persons of one batch share the timestamp, and may share their name
+                timestamp = f"{timestamp}_{person_index}"
             report_filename = f"vetria_report_{person_name}_{timestamp}.html"
             report_path = os.path.join(output_dir, report_filename)
             
-            # Ensure output directory exists
-            os.makedirs(output_dir, exist_ok=True)
-            
-            # Generate the report
+            # Generate the report (which also ensures the output directory exists)
             logger.info("Generating comprehensive report...")
-            result = self.report_generator.generate_comprehensive_report(profile_data, report_path)
+            _, report_generator = self._components()
+            result = report_generator.generate_comprehensive_report(profile_data, report_path)
             
             if result['success']:
                 logger.info(f"SUCCESS: Report generated!")
@@ -289,6 +516,34 @@ class VetriaPipeline:
         except Exception as e:
             logger.error(f"Error generating report: {e}")
             raise
+    
+    def generate_reports(self, csv_path: str, person_indices: List[int], output_dir: str = "output/reports") -> List[str]:
+        """
+        Generate complete assessment reports for several persons from the same CSV file
+        
+        The file is prepared once, then the persons' reports are generated concurrently in threads,
+        which overlap their OpenAI requests and chart rendering. Each thread has its own
+        visualization engine and report generator.
+        
+        Args:
+            csv_path: Path to CSV file with assessment responses
+            person_indices: Indices of the persons to process
+            output_dir: Directory to save the reports
+            
+        Returns:
+            Paths to the generated report files, in the order of person_indices
+        """
+        self.prepare(csv_path)
+        
+        # All reports of the batch are dated with the same run time and share one output directory
+        run_time = datetime.now()
+        os.makedirs(output_dir, exist_ok=True)
+        
+        workers = min(REPORT_WORKERS, max(len(person_indices), 1))
+        with ThreadPoolExecutor(max_workers=workers, initializer=self._init_worker) as executor:
+            return list(executor.map(
+                partial(self.generate_report, csv_path, output_dir, run_time=run_time), person_indices
+            ))
 
 def main():
     """Main function to run the Victoria pipeline"""